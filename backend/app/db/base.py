@@ -1,3 +1,8 @@
+from sqlalchemy import TEXT
+from sqlalchemy.dialects.mysql import MEDIUMTEXT
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
+
+# 64KB(MySQL TEXT)를 넘을 수 있는 JSON 컬럼용 (MySQL은 MEDIUMTEXT, 그 외는 TEXT)
+MediumText = TEXT().with_variant(MEDIUMTEXT(), "mysql")
@@ -1,3 +1,4 @@
+import asyncio
 from urllib.parse import urlparse
 
 from fastapi import FastAPI
@@ -5,7 +6,9 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.db.base import Base
 from app.db.session import engine
-from app.routes import calendar_route, user_route, appointment_route
+from app.routes import calendar_route, user_route, appointment_route, metrics_route
+from app.services.calendar_watch_service import CalendarWatchService
+from app.services.compute_executor import ComputeExecutor
 from app.services.google_calendar_service import GoogleCalendarService
 from app.variable import FRONTEND_URL
 
@@ -38,12 +41,23 @@ async def startup():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # 캘린더 변경 알림 채널 만료 전 갱신
+    if CalendarWatchService.is_enabled():
+        app.state.watch_renewal_task = asyncio.create_task(
+            CalendarWatchService.run_renewal_loop()
+        )
+
 
 @app.on_event("shutdown")
 async def shutdown():
+    renewal_task = getattr(app.state, "watch_renewal_task", None)
+    if renewal_task is not None:
+        renewal_task.cancel()
     await GoogleCalendarService.close_client()
+    ComputeExecutor.shutdown()
 
 
 app.include_router(user_route.router, tags=["user"])
 app.include_router(calendar_route.router, tags=["calendar"])
 app.include_router(appointment_route.router, tags=["appointment"])
+app.include_router(metrics_route.router, tags=["metrics"])
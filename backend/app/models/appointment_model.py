@@ -10,7 +10,7 @@ from sqlalchemy import (
     UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
-from app.db.base import Base
+from app.db.base import Base, MediumText
 from datetime import datetime
 
 
@@ -31,6 +31,28 @@ class Appointments(Base):
     participations = relationship(
         "Participations", back_populates="appointment", cascade="all, delete-orphan"
     )
+    availability = relationship(
+        "AppointmentAvailability",
+        back_populates="appointment",
+        cascade="all, delete-orphan",
+        uselist=False,
+    )
+    availability_days = relationship(
+        "AppointmentAvailabilityDay",
+        back_populates="appointment",
+        cascade="all, delete-orphan",
+    )
+    confirmation = relationship(
+        "AppointmentConfirmation",
+        back_populates="appointment",
+        cascade="all, delete-orphan",
+        uselist=False,
+    )
+    confirmation_events = relationship(
+        "AppointmentConfirmationEvent",
+        back_populates="appointment",
+        cascade="all, delete-orphan",
+    )
 
 
 class AppointmentDates(Base):
@@ -59,3 +81,79 @@ class Participations(Base):
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
 
     appointment = relationship("Appointments", back_populates="participations")
+
+
+class AppointmentAvailability(Base):
+    __tablename__ = "appointment_availability"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    appointment_id = Column(
+        Integer,
+        ForeignKey("appointments.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    # 참여자 비트 위치와 참여자별 날짜 JSON (구간은 AppointmentAvailabilityDay에 날짜별로 저장)
+    members = Column(MediumText, nullable=False)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    appointment = relationship("Appointments", back_populates="availability")
+
+
+class AppointmentAvailabilityDay(Base):
+    __tablename__ = "appointment_availability_days"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    appointment_id = Column(
+        Integer, ForeignKey("appointments.id", ondelete="CASCADE"), nullable=False
+    )
+    # UTC 기준 epoch 일 (epoch 분 // 1440)
+    day = Column(Integer, nullable=False)
+    # [[시작 epoch 분, 끝 epoch 분, 참여자 비트마스크(16진수)], ...] JSON
+    segments = Column(MediumText, nullable=False)
+    __table_args__ = (UniqueConstraint("appointment_id", "day"),)
+
+    appointment = relationship("Appointments", back_populates="availability_days")
+
+
+class AppointmentConfirmation(Base):
+    __tablename__ = "appointment_confirmations"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    appointment_id = Column(
+        Integer,
+        ForeignKey("appointments.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    confirmed_date = Column(Date, nullable=False)
+    # 현지 시각 HH:MM
+    start_time = Column(String(5), nullable=False)
+    end_time = Column(String(5), nullable=False)
+    timezone = Column(String(64), nullable=False)
+    confirmed_by = Column(String(255), nullable=False)
+    created_at = Column(DateTime, default=datetime.now)
+
+    appointment = relationship("Appointments", back_populates="confirmation")
+
+
+class AppointmentConfirmationEvent(Base):
+    __tablename__ = "appointment_confirmation_events"
+    __table_args__ = (UniqueConstraint("appointment_id", "user_id"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    appointment_id = Column(
+        Integer,
+        ForeignKey("appointments.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id = Column(String(255), nullable=False)
+    # 참석자 캘린더 일정 생성 결과 ("pending" | "created" | "failed" | "timeout")
+    status = Column(String(16), nullable=False)
+    event_id = Column(String(255))
+    html_link = Column(TEXT)
+    error = Column(String(255))
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    appointment = relationship("Appointments", back_populates="confirmation_events")
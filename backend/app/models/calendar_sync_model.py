@@ -0,0 +1,38 @@
+from sqlalchemy import Column, String, TEXT, DateTime, Integer
+from app.db.base import Base, MediumText
+from datetime import datetime
+
+
+class CalendarSyncState(Base):
+    __tablename__ = "calendar_sync_states"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(255), unique=True, nullable=False)
+    # Google events.list 증분 동기화 토큰 (없으면 다음 조회 때 전체 동기화)
+    sync_token = Column(TEXT)
+    timezone = Column(String(64), nullable=False)
+    # 동기화 범위 (epoch 분, 반열린 구간)
+    window_start = Column(Integer, nullable=False)
+    window_end = Column(Integer, nullable=False)
+    # 이벤트 id -> [시작 epoch 분, 끝 epoch 분] JSON (바쁜 이벤트만 보관, 64KB 초과 가능)
+    busy_events = Column(MediumText, nullable=False, default="{}")
+    # 푸시 알림 수신 횟수 / 마지막 동기화 시점의 값 (다르면 저장소가 오래된 상태)
+    change_count = Column(Integer, nullable=False, default=0)
+    synced_change_count = Column(Integer, nullable=False, default=0)
+    # 마지막으로 Google과 동기화한 시각 (epoch 초)
+    synced_at = Column(Integer)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+
+class CalendarWatchChannel(Base):
+    __tablename__ = "calendar_watch_channels"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(255), unique=True, nullable=False)
+    # events.watch 채널 정보 (token은 웹훅 요청 검증용 비밀값)
+    channel_id = Column(String(64), unique=True, nullable=False)
+    resource_id = Column(String(255), nullable=False)
+    token = Column(String(64), nullable=False)
+    # 채널 만료 시각 (epoch 초)
+    expires_at = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.now)
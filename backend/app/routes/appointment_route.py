@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, select
@@ -7,6 +9,8 @@ from app.db.session import get_db
 from app.models.appointment_model import Participations
 from app.services.appointment_service import AppointmentService
 from app.schema.appointment_schema import (
+    AppointmentConfirmRequest,
+    AppointmentConfirmResponse,
     AppointmentCreateRequest,
     AppointmentResponse,
     JoinAppointmentRequest,
@@ -162,12 +166,40 @@ async def delete_appointment(
         raise HTTPException(status_code=500, detail=f"약속 삭제 실패: {str(e)}")
 
 
+@router.post("/{invite_code}/confirm", response_model=AppointmentConfirmResponse)
+async def confirm_appointment(
+    invite_code: str,
+    request: AppointmentConfirmRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    # 약속 확정 및 참석자 캘린더 일정 생성 (같은 시간으로 다시 요청하면 실패한 참석자만 재시도)
+    appointment = await AppointmentService.get_appointment_by_invite_code(
+        invite_code, db
+    )
+    if not appointment:
+        raise HTTPException(status_code=404, detail="약속을 찾을 수 없습니다")
+    if appointment.creator_id != current_user["sub"]:
+        raise HTTPException(status_code=403, detail="약속 생성자만 확정할 수 있습니다")
+
+    try:
+        result = await AppointmentService.confirm_appointment(
+            appointment, request, current_user["sub"], db
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return AppointmentConfirmResponse(**result)
+
+
 @router.get("/{invite_code}/optimal-times", response_model=OptimalTimesResponse)
 async def get_optimal_times(
     invite_code: str,
     min_duration_minutes: int = 60,
     time_range_start: str = None,
     time_range_end: str = None,
+    limit: Optional[int] = Query(None, ge=1),
+    min_participants: int = Query(1, ge=1),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
@@ -191,6 +223,8 @@ async def get_optimal_times(
         db,
         time_range_start=time_range_start,
         time_range_end=time_range_end,
+        limit=limit,
+        min_participants=min_participants,
     )
 
     # 전체 참여자 수
@@ -240,6 +274,7 @@ async def sync_my_schedules(
             total_appointments=result["total_appointments"],
             updated_count=result["updated_count"],
             failed_count=result["failed_count"],
+            results=result["results"],
         )
 
     except ValueError as e:
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+import logging
+from typing import Set
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
-from app.schema.calendar_schema import EventCreateRequest, EventCreateResponse
+from app.db.session import AsyncSessionLocal, get_db
+from app.schema.calendar_schema import (
+    EventBatchCreateRequest,
+    EventBatchDeleteRequest,
+    EventBatchResponse,
+    EventCreateRequest,
+    EventCreateResponse,
+)
+from app.services.appointment_service import AppointmentService
+from app.services.calendar_watch_service import CalendarWatchService
 from app.services.google_calendar_service import GoogleCalendarService
 from app.services.user_service import UserService
 from app.utils.jwt import verify_token
@@ -17,6 +28,11 @@ router = APIRouter(prefix="/calendar")
 
 REAUTH_URL = "/user/google/login?force=1"
 
+LOGGER = logging.getLogger(__name__)
+
+# 재계산이 예약되었지만 아직 시작하지 않은 사용자 (알림이 몰려도 사용자당 하나만 예약)
+_pending_recomputes: Set[str] = set()
+
 
 @router.get("/events")
 async def list_events(
@@ -27,40 +43,14 @@ async def list_events(
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
 ):
-    if credentials is None or not credentials.credentials:
-        raise HTTPException(status_code=401, detail="인증 토큰이 필요합니다.")
-
-    payload = verify_token(credentials.credentials)
-    user_id = payload.get("sub") if payload else None
-    if not user_id:
-        raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
-
-    user = await UserService.get_user_by_google_id(user_id, db)
-    if not user or not getattr(user, "google_refresh_token", None):
-        return JSONResponse(
-            status_code=400,
-            content={
-                "code": "calendar_scope_missing",
-                "reauthUrl": REAUTH_URL,
-            },
-        )
+    user = await _get_calendar_user(credentials, db)
+    if isinstance(user, JSONResponse):
+        return user
 
     try:
         access_token = await GoogleCalendarService.refresh_access_token(
             user.google_refresh_token
         )
-    except HTTPException as exc:
-        if exc.status_code == 401:
-            return JSONResponse(
-                status_code=401,
-                content={
-                    "code": "google_reauth_required",
-                    "reauthUrl": REAUTH_URL,
-                },
-            )
-        raise
-
-    try:
         events_payload = await GoogleCalendarService.list_primary_events(
             access_token,
             time_min=time_min,
@@ -69,31 +59,7 @@ async def list_events(
             page_token=page_token,
         )
     except HTTPException as exc:
-        if exc.status_code == 401:
-            return JSONResponse(
-                status_code=401,
-                content={
-                    "code": "google_reauth_required",
-                    "reauthUrl": REAUTH_URL,
-                },
-            )
-        if exc.status_code == 400 and exc.detail == "calendar_scope_missing":
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "code": "calendar_scope_missing",
-                    "reauthUrl": REAUTH_URL,
-                },
-            )
-        if exc.status_code == 403:
-            return JSONResponse(
-                status_code=403,
-                content={
-                    "code": "insufficient_scope",
-                    "reauthUrl": REAUTH_URL,
-                },
-            )
-        raise
+        return _calendar_error_response(exc, user)
 
     return events_payload
 
@@ -104,81 +70,106 @@ async def add_events(
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
 ):
-    if credentials is None or not credentials.credentials:
-        raise HTTPException(status_code=401, detail="인증 토큰이 필요합니다.")
+    user = await _get_calendar_user(credentials, db)
+    if isinstance(user, JSONResponse):
+        return user
 
-    payload = verify_token(credentials.credentials)
-    user_id = payload.get("sub") if payload else None
-    if not user_id:
-        raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
+    event_data = event_request.model_dump(exclude_none=True)
 
-    user = await UserService.get_user_by_google_id(user_id, db)
-    if not user or not getattr(user, "google_refresh_token", None):
-        return JSONResponse(
-            status_code=400,
-            content={
-                "code": "calendar_scope_missing",
-                "reauthUrl": REAUTH_URL,
-            },
+    try:
+        access_token = await GoogleCalendarService.refresh_access_token(
+            user.google_refresh_token
+        )
+        created_event = await GoogleCalendarService.create_event(
+            access_token,
+            event_data,
         )
+    except HTTPException as exc:
+        return _calendar_error_response(exc, user)
+
+    return created_event
+
+
+@router.delete("/events/{event_id}")
+async def delete_event(
+    event_id: str,
+    db: AsyncSession = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+):
+    user = await _get_calendar_user(credentials, db)
+    if isinstance(user, JSONResponse):
+        return user
 
     try:
         access_token = await GoogleCalendarService.refresh_access_token(
             user.google_refresh_token
         )
+        deleted_event = await GoogleCalendarService.delete_event(
+            access_token,
+            event_id,
+        )
     except HTTPException as exc:
-        if exc.status_code == 401:
+        if exc.status_code == 404:
             return JSONResponse(
-                status_code=401,
+                status_code=404,
                 content={
-                    "code": "google_reauth_required",
-                    "reauthUrl": REAUTH_URL,
+                    "code": "event_not_found",
                 },
             )
-        raise
+        return _calendar_error_response(exc, user)
 
-    event_data = event_request.model_dump(exclude_none=True)
+    return deleted_event
 
+
+@router.post("/events/batch", response_model=EventBatchResponse)
+async def add_events_batch(
+    batch_request: EventBatchCreateRequest,
+    db: AsyncSession = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+):
+    # 여러 이벤트를 Google 배치 요청 하나로 생성하고 항목별 결과 반환
+    user = await _get_calendar_user(credentials, db)
+    if isinstance(user, JSONResponse):
+        return user
+
+    events = [event.model_dump(exclude_none=True) for event in batch_request.events]
     try:
-        created_event = await GoogleCalendarService.create_event(
-            access_token,
-            event_data,
+        access_token = await GoogleCalendarService.refresh_access_token(
+            user.google_refresh_token
         )
+        results = await GoogleCalendarService.batch_create_events(access_token, events)
     except HTTPException as exc:
-        if exc.status_code == 401:
-            return JSONResponse(
-                status_code=401,
-                content={
-                    "code": "google_reauth_required",
-                    "reauthUrl": REAUTH_URL,
-                },
-            )
-        if exc.status_code == 400 and exc.detail == "calendar_scope_missing":
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "code": "calendar_scope_missing",
-                    "reauthUrl": REAUTH_URL,
-                },
-            )
-        if exc.status_code == 403:
-            return JSONResponse(
-                status_code=403,
-                content={
-                    "code": "insufficient_scope",
-                    "reauthUrl": REAUTH_URL,
-                },
-            )
-        raise
+        return _calendar_error_response(exc, user)
 
-    return created_event
+    return _batch_response(results, user)
 
 
-@router.delete("/events/{event_id}")
-async def delete_event(
-    event_id: str,
+@router.post("/events/batch-delete", response_model=EventBatchResponse)
+async def delete_events_batch(
+    batch_request: EventBatchDeleteRequest,
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
+):
+    # 여러 이벤트를 Google 배치 요청 하나로 삭제하고 항목별 결과 반환
+    user = await _get_calendar_user(credentials, db)
+    if isinstance(user, JSONResponse):
+        return user
+
+    try:
+        access_token = await GoogleCalendarService.refresh_access_token(
+            user.google_refresh_token
+        )
+        results = await GoogleCalendarService.batch_delete_events(
+            access_token, batch_request.event_ids
+        )
+    except HTTPException as exc:
+        return _calendar_error_response(exc, user)
+
+    return _batch_response(results, user)
+
+
+async def _get_calendar_user(
+    credentials: HTTPAuthorizationCredentials | None, db: AsyncSession
 ):
     if credentials is None or not credentials.credentials:
         raise HTTPException(status_code=401, detail="인증 토큰이 필요합니다.")
@@ -197,59 +188,87 @@ async def delete_event(
                 "reauthUrl": REAUTH_URL,
             },
         )
+    return user
 
-    try:
-        access_token = await GoogleCalendarService.refresh_access_token(
-            user.google_refresh_token
-        )
-    except HTTPException as exc:
-        if exc.status_code == 401:
-            return JSONResponse(
-                status_code=401,
-                content={
-                    "code": "google_reauth_required",
-                    "reauthUrl": REAUTH_URL,
-                },
-            )
-        raise
 
-    try:
-        deleted_event = await GoogleCalendarService.delete_event(
-            access_token,
-            event_id,
+def _calendar_error_response(exc: HTTPException, user) -> JSONResponse:
+    # Google 오류를 재인증/권한 안내 응답으로 변환 (그 외 오류는 그대로 전달)
+    if exc.status_code == 401:
+        GoogleCalendarService.invalidate_access_token(user.google_refresh_token)
+        return JSONResponse(
+            status_code=401,
+            content={
+                "code": "google_reauth_required",
+                "reauthUrl": REAUTH_URL,
+            },
         )
-    except HTTPException as exc:
-        if exc.status_code == 401:
-            return JSONResponse(
-                status_code=401,
-                content={
-                    "code": "google_reauth_required",
-                    "reauthUrl": REAUTH_URL,
-                },
-            )
-        if exc.status_code == 400 and exc.detail == "calendar_scope_missing":
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "code": "calendar_scope_missing",
-                    "reauthUrl": REAUTH_URL,
-                },
-            )
-        if exc.status_code == 403:
-            return JSONResponse(
-                status_code=403,
-                content={
-                    "code": "insufficient_scope",
-                    "reauthUrl": REAUTH_URL,
-                },
-            )
-        if exc.status_code == 404:
-            return JSONResponse(
-                status_code=404,
-                content={
-                    "code": "event_not_found",
-                },
-            )
-        raise
+    if exc.status_code == 400 and exc.detail == "calendar_scope_missing":
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": "calendar_scope_missing",
+                "reauthUrl": REAUTH_URL,
+            },
+        )
+    if exc.status_code == 403:
+        return JSONResponse(
+            status_code=403,
+            content={
+                "code": "insufficient_scope",
+                "reauthUrl": REAUTH_URL,
+            },
+        )
+    raise exc
 
-    return deleted_event
+
+def _batch_response(results, user) -> EventBatchResponse:
+    # 모든 항목이 인증 오류면 캐시된 access token이 만료된 것으로 보고 제거
+    if results and all(
+        item.get("error") == "google_reauth_required" for item in results
+    ):
+        GoogleCalendarService.invalidate_access_token(user.google_refresh_token)
+
+    succeeded = sum(1 for item in results if item["success"])
+    return EventBatchResponse(
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results,
+    )
+
+
+@router.post("/webhook")
+async def calendar_webhook(
+    background_tasks: BackgroundTasks,
+    x_goog_channel_id: str = Header(...),
+    x_goog_channel_token: str | None = Header(None),
+    x_goog_resource_id: str | None = Header(None),
+    x_goog_resource_state: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+):
+    # Google 캘린더 변경 알림 수신 (events.watch 채널)
+    user_id = await CalendarWatchService.handle_notification(
+        x_goog_channel_id,
+        x_goog_channel_token,
+        x_goog_resource_id,
+        x_goog_resource_state,
+        db,
+    )
+    if user_id is None:
+        return {"status": "ignored"}
+
+    # 응답은 바로 보내고 투표 중인 약속의 가용시간은 백그라운드에서 재계산
+    # (이미 예약된 재계산이 있으면 그 실행이 이번 변경도 반영)
+    if user_id not in _pending_recomputes:
+        _pending_recomputes.add(user_id)
+        background_tasks.add_task(recompute_user_availability, user_id)
+    return {"status": "accepted"}
+
+
+async def recompute_user_availability(user_id: str) -> None:
+    # 시작하면서 예약 표시를 지워 실행 중에 들어온 알림은 다시 예약되도록 함
+    _pending_recomputes.discard(user_id)
+    async with AsyncSessionLocal() as db:
+        try:
+            await AppointmentService.sync_my_schedules(user_id, db)
+        except Exception:
+            LOGGER.exception("Failed to recompute availability for user %s", user_id)
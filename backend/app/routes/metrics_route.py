@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+
+from app.services.appointment_service import AppointmentService
+from app.services.calendar_sync_service import CalendarSyncService
+from app.services.compute_executor import ComputeExecutor
+from app.services.google_calendar_service import GoogleCalendarService
+from app.services.schedule_analyzer import ScheduleAnalyzer
+from app.utils.jwt import get_current_user
+
+# 운영 지표는 로그인한 사용자만 조회
+router = APIRouter(prefix="/metrics", dependencies=[Depends(get_current_user)])
+
+
+@router.get("/")
+async def get_metrics():
+    # 운영 지표 조회 (프로세스 풀 크기 조정 등)
+    return {
+        "compute_executor": ComputeExecutor.stats(),
+        "optimal_times_cache": AppointmentService.optimal_times_cache_stats(),
+        "calendar_sync": CalendarSyncService.stats(),
+        "google_token_cache": GoogleCalendarService.token_cache_stats(),
+        "google_token_refresh": GoogleCalendarService.token_refresh_stats(),
+        "google_http_pool": GoogleCalendarService.http_pool_stats(),
+        "google_rate_limit": GoogleCalendarService.rate_limit_stats(),
+        "availability_coalescing": ScheduleAnalyzer.coalescing_stats(),
+    }
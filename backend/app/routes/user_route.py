@@ -27,12 +27,12 @@ async def google_login(force: int | None = None):
 async def google_callback(code: str, db: AsyncSession = Depends(get_db)):
     try:
         # Google OAuth 토큰 교환
-        tokens = GoogleOAuthService.exchange_code_for_tokens(code)
+        tokens = await GoogleOAuthService.exchange_code_for_tokens(code)
         access_token = tokens["access_token"]
         refresh_token = tokens["refresh_token"]
 
         # 사용자 정보 조회
-        user_info = GoogleOAuthService.get_user_info(access_token)
+        user_info = await GoogleOAuthService.get_user_info(access_token)
         google_id = user_info["google_id"]
         email = user_info["email"]
         name = user_info["name"]
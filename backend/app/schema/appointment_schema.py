@@ -116,7 +116,42 @@ class AppointmentListResponse(BaseModel):
         from_attributes = True
 
 
+class AppointmentSyncResult(BaseModel):
+    appointment_id: int
+    status: str  # "updated" | "failed" | "timeout"
+    error: Optional[str] = None
+
+
 class SyncMySchedulesResponse(BaseModel):
     total_appointments: int
     updated_count: int
     failed_count: int
+    results: List[AppointmentSyncResult] = []
+
+
+class AppointmentConfirmRequest(BaseModel):
+    date: date
+    start_time: str  # HH:MM
+    end_time: str  # HH:MM
+    timezone: str = "Asia/Seoul"
+
+
+class ParticipantEventResult(BaseModel):
+    user_id: str
+    status: str  # "created" | "failed" | "timeout" | "pending"
+    event_id: Optional[str] = None
+    html_link: Optional[str] = None
+    error: Optional[str] = None
+
+
+class AppointmentConfirmResponse(BaseModel):
+    appointment_id: int
+    status: str
+    date: date
+    start_time: str
+    end_time: str
+    timezone: str
+    total_participants: int
+    created_count: int
+    failed_count: int
+    results: List[ParticipantEventResult] = []
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 
 class EventDateTime(BaseModel):
@@ -41,3 +41,31 @@ class EventCreateResponse(BaseModel):
     summary: str
     htmlLink: str
     status: str
+
+
+# 배치 요청 하나로 처리할 수 있는 최대 이벤트 수 (Google 배치 제한)
+MAX_BATCH_EVENTS = 50
+
+
+class EventBatchCreateRequest(BaseModel):
+    events: List[EventCreateRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_EVENTS
+    )
+
+
+class EventBatchDeleteRequest(BaseModel):
+    event_ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_EVENTS)
+
+
+class EventBatchItemResult(BaseModel):
+    index: int
+    success: bool
+    id: Optional[str] = None
+    event: Optional[EventCreateResponse] = None
+    error: Optional[str] = None
+
+
+class EventBatchResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[EventBatchItemResult]
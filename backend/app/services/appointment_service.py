@@ -1,17 +1,55 @@
 import secrets
 import string
 import json
-from typing import List
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.models.appointment_model import Appointments, AppointmentDates, Participations
-from app.schema.appointment_schema import AppointmentCreateRequest
+from app.models.appointment_model import (
+    Appointments,
+    AppointmentAvailability,
+    AppointmentAvailabilityDay,
+    AppointmentConfirmation,
+    AppointmentConfirmationEvent,
+    AppointmentDates,
+    Participations,
+)
+from app.models.user_model import User
+from app.schema.appointment_schema import (
+    AppointmentConfirmRequest,
+    AppointmentCreateRequest,
+)
+from app.services.availability_aggregate import AvailabilityAggregate
+from app.services.compute_executor import ComputeExecutor
+from app.services.google_calendar_service import GoogleCalendarService
 from app.services.schedule_analyzer import ScheduleAnalyzer
 from app.services.user_service import UserService
+from app.utils.concurrency import run_bounded
+from app.utils.time_interval import get_zone
+from app.utils.ttl_cache import TTLCache
+from app.variable import (
+    CONFIRM_CONCURRENCY_LIMIT,
+    CONFIRM_PARTICIPANT_TIMEOUT_SECONDS,
+    CONFIRM_PENDING_STALE_SECONDS,
+    OPTIMAL_TIMES_CACHE_SIZE,
+    OPTIMAL_TIMES_CACHE_TTL_SECONDS,
+    OPTIMAL_TIMES_ENGINE,
+    SYNC_APPOINTMENT_TIMEOUT_SECONDS,
+    SYNC_CONCURRENCY_LIMIT,
+)
 
 
 class AppointmentService:
+    # (약속 id, 집계 버전, 조회 조건) -> 최적 시간 결과
+    _optimal_times_cache = TTLCache(
+        OPTIMAL_TIMES_CACHE_SIZE, OPTIMAL_TIMES_CACHE_TTL_SECONDS
+    )
+
     @staticmethod
     def generate_invite_code(length: int = 8) -> str:
         # 랜덤 초대 코드 생성
@@ -63,20 +101,39 @@ class AppointmentService:
         db.add(creator_participation)
 
         # 생성자의 가용 시간 계산
+        aggregate = AvailabilityAggregate()
         try:
             user = await UserService.get_user_by_google_id(str(creator_id), db)
             if user and user.google_refresh_token:
                 available_slots = await ScheduleAnalyzer.calculate_available_slots(
-                    user=user, candidate_dates=candidate_dates
+                    user=user, candidate_dates=candidate_dates, db=db
                 )
 
+                # 집계에 먼저 반영하고 성공한 경우에만 가용시간 저장
                 if available_slots:
+                    aggregate.set_member_slots(
+                        str(creator_id),
+                        available_slots["slots"],
+                        available_slots.get("timezone"),
+                    )
                     creator_participation.available_slots = json.dumps(
                         available_slots, ensure_ascii=False
                     )
         except Exception:
             pass
 
+        # 약속 가용시간 집계 생성
+        db.add(
+            AppointmentAvailability(
+                appointment_id=appointment.id,
+                members=aggregate.header_json(),
+                version=1,
+            )
+        )
+        await AppointmentService._store_days(
+            appointment.id, aggregate, aggregate.day_rows().keys(), {}, db
+        )
+
         await db.commit()
         await db.refresh(appointment)
 
@@ -161,12 +218,19 @@ class AppointmentService:
                 available_slots = await ScheduleAnalyzer.calculate_available_slots(
                     user=user,
                     candidate_dates=[ad.candidate_date for ad in candidate_dates],
+                    db=db,
                 )
 
+                # 집계 반영에 실패하면 가용시간도 저장하지 않음 (집계와 참여 정보 일치)
                 if available_slots:
-                    participation.available_slots = json.dumps(
-                        available_slots, ensure_ascii=False
-                    )
+                    async with db.begin_nested():
+                        participation.available_slots = json.dumps(
+                            available_slots, ensure_ascii=False
+                        )
+                        await db.flush()
+                        await AppointmentService._apply_availability_delta(
+                            appointment.id, user_id, available_slots, db
+                        )
         except Exception:
             pass
 
@@ -221,6 +285,194 @@ class AppointmentService:
 
         return True
 
+    @staticmethod
+    async def confirm_appointment(
+        appointment: Appointments,
+        request: AppointmentConfirmRequest,
+        user_id: str,
+        db: AsyncSession,
+    ) -> dict:
+        """
+        약속을 선택한 시간으로 확정하고 참석자 전원의 구글 캘린더에 일정 생성
+
+        확정은 먼저 커밋하고, 일정 생성은 참석자마다 동시에(최대
+        CONFIRM_CONCURRENCY_LIMIT명) 진행해 참석자별 결과를 저장하고 돌려준다.
+        이미 같은 시간으로 확정된 약속이면 일정 생성에 실패했거나 시간 초과된
+        참석자만 다시 시도한다.
+        """
+        start_time = AppointmentService._parse_clock(request.start_time)
+        end_time = AppointmentService._parse_clock(request.end_time)
+        if start_time >= end_time:
+            raise ValueError("종료 시간은 시작 시간보다 늦어야 합니다")
+        try:
+            get_zone(request.timezone)
+        except (KeyError, ValueError):
+            raise ValueError("지원하지 않는 타임존입니다")
+
+        appointment_dates = await AppointmentService.get_appointment_dates(
+            appointment.id, db
+        )
+        if request.date not in {ad.candidate_date for ad in appointment_dates}:
+            raise ValueError("후보 날짜 중에서 선택해야 합니다")
+
+        # 동시에 두 번 확정되지 않도록 투표 중인 경우에만 상태 변경
+        result = await db.execute(
+            update(Appointments)
+            .where(Appointments.id == appointment.id)
+            .where(Appointments.status == "VOTING")
+            .values(status="CONFIRMED")
+        )
+        if result.rowcount == 1:
+            db.add(
+                AppointmentConfirmation(
+                    appointment_id=appointment.id,
+                    confirmed_date=request.date,
+                    start_time=start_time,
+                    end_time=end_time,
+                    timezone=request.timezone,
+                    confirmed_by=user_id,
+                )
+            )
+        else:
+            # 같은 시간으로 다시 확정하면 재시도 (동시 재시도는 확정 정보 잠금으로 순서화)
+            result = await db.execute(
+                select(AppointmentConfirmation)
+                .where(AppointmentConfirmation.appointment_id == appointment.id)
+                .with_for_update()
+            )
+            confirmation = result.scalar_one_or_none()
+            if confirmation is None or (
+                confirmation.confirmed_date,
+                confirmation.start_time,
+                confirmation.end_time,
+                confirmation.timezone,
+            ) != (request.date, start_time, end_time, request.timezone):
+                raise ValueError("투표 중인 약속만 확정할 수 있습니다")
+
+        # 참석자와 구글 refresh token (연동하지 않은 참석자는 None)
+        result = await db.execute(
+            select(Participations.user_id, User.google_refresh_token)
+            .outerjoin(User, User.user_id == Participations.user_id)
+            .where(Participations.appointment_id == appointment.id)
+            .where(Participations.status == "ATTENDING")
+        )
+        refresh_tokens = dict(result.all())
+
+        # 이미 일정을 만들었거나 다른 요청이 만드는 중인 참석자는 제외하고 나머지를 선점
+        result = await db.execute(
+            select(AppointmentConfirmationEvent).where(
+                AppointmentConfirmationEvent.appointment_id == appointment.id
+            )
+        )
+        records = {record.user_id: record for record in result.scalars()}
+        now = datetime.now()
+        stale_before = now - timedelta(seconds=CONFIRM_PENDING_STALE_SECONDS)
+        targets = []
+        for participant_id in refresh_tokens:
+            record = records.get(participant_id)
+            if record is None:
+                record = AppointmentConfirmationEvent(
+                    appointment_id=appointment.id, user_id=participant_id
+                )
+                db.add(record)
+                records[participant_id] = record
+            elif record.status == "created" or (
+                record.status == "pending" and record.updated_at > stale_before
+            ):
+                continue
+            record.status = "pending"
+            record.error = None
+            record.updated_at = now
+            targets.append(participant_id)
+        await db.commit()
+
+        event_data = {
+            "summary": appointment.name,
+            "start": {
+                "dateTime": f"{request.date.isoformat()}T{start_time}:00",
+                "timeZone": request.timezone,
+            },
+            "end": {
+                "dateTime": f"{request.date.isoformat()}T{end_time}:00",
+                "timeZone": request.timezone,
+            },
+        }
+
+        async def _create_event(participant_id: str) -> dict:
+            # 참석자 한 명의 일정 생성 (세션을 쓰지 않으므로 동시에 실행 가능)
+            refresh_token = refresh_tokens.get(participant_id)
+            if not refresh_token:
+                raise ValueError("구글 캘린더 연동이 필요합니다")
+
+            access_token = await GoogleCalendarService.refresh_access_token(
+                refresh_token
+            )
+            try:
+                return await GoogleCalendarService.create_event(
+                    access_token, event_data
+                )
+            except HTTPException as exc:
+                if exc.status_code == 401:
+                    GoogleCalendarService.invalidate_access_token(refresh_token)
+                raise
+
+        outcomes = await run_bounded(
+            targets,
+            _create_event,
+            limit=CONFIRM_CONCURRENCY_LIMIT,
+            timeout=CONFIRM_PARTICIPANT_TIMEOUT_SECONDS,
+        )
+
+        # 참석자별 결과를 저장해 실패한 참석자만 나중에 다시 시도할 수 있게 함
+        for participant_id, outcome in outcomes.items():
+            record = records[participant_id]
+            if outcome.ok:
+                record.status = "created"
+                record.event_id = outcome.value.get("id")
+                record.html_link = outcome.value.get("htmlLink")
+                continue
+
+            error = outcome.error
+            record.status = "timeout" if outcome.timed_out else "failed"
+            record.error = (
+                str(error.detail)
+                if isinstance(error, HTTPException)
+                else str(error) or type(error).__name__
+            )[:255]
+        await db.commit()
+
+        results = []
+        for participant_id in refresh_tokens:
+            record = records[participant_id]
+            entry = {"user_id": participant_id, "status": record.status}
+            if record.status == "created":
+                entry.update(event_id=record.event_id, html_link=record.html_link)
+            elif record.error:
+                entry["error"] = record.error
+            results.append(entry)
+
+        created_count = sum(1 for entry in results if entry["status"] == "created")
+        return {
+            "appointment_id": appointment.id,
+            "status": "CONFIRMED",
+            "date": request.date,
+            "start_time": start_time,
+            "end_time": end_time,
+            "timezone": request.timezone,
+            "total_participants": len(results),
+            "created_count": created_count,
+            "failed_count": len(results) - created_count,
+            "results": results,
+        }
+
+    @staticmethod
+    def _parse_clock(value: str) -> str:
+        # "9:00", "09:00" -> "09:00"
+        try:
+            return datetime.strptime(value, "%H:%M").strftime("%H:%M")
+        except (TypeError, ValueError):
+            raise ValueError(f"시간 형식이 올바르지 않습니다: {value}")
+
     @staticmethod
     async def get_appointment_detail_with_availability(
         invite_code: str, db: AsyncSession
@@ -310,7 +562,94 @@ class AppointmentService:
         db: AsyncSession,
         time_range_start: str = None,
         time_range_end: str = None,
+        engine: Optional[str] = None,
+        limit: Optional[int] = None,
+        min_participants: int = 1,
     ) -> List[dict]:
+        # 집계 버전이 같으면 결과도 같으므로 캐시된 결과 반환
+        # (참여자 가용시간이 바뀔 때마다 버전이 올라가 이전 항목은 자동으로 무효화)
+        cache = AppointmentService._optimal_times_cache
+        params = (
+            min_duration_minutes,
+            time_range_start,
+            time_range_end,
+            engine,
+            limit,
+            min_participants,
+        )
+        version = await AppointmentService._get_availability_version(appointment_id, db)
+        if version is not None:
+            cached = cache.get((appointment_id, version, params))
+            if cached is not None:
+                return cached
+
+        # 다른 타임존 참여자의 구간이 후보 날짜 밖으로 넘어가도 후보 날짜만 반환
+        dates = [
+            appointment_date.candidate_date.isoformat()
+            for appointment_date in await AppointmentService.get_appointment_dates(
+                appointment_id, db
+            )
+        ]
+
+        # engine을 지정하면 전체 참여자 데이터로 다시 계산, 아니면 집계에서 블록만 추출
+        if engine is not None:
+            all_slots = await AppointmentService._load_user_slots(appointment_id, db)
+            optimal_times = await ComputeExecutor.run(
+                ScheduleAnalyzer.find_common_slots,
+                all_slots,
+                min_duration_minutes,
+                engine=engine,
+                limit=limit,
+                min_participants=min_participants,
+                time_range_start=time_range_start,
+                time_range_end=time_range_end,
+                dates=dates,
+                size=ScheduleAnalyzer._interval_count(all_slots),
+            )
+        else:
+            row, aggregate, rebuilt = await AppointmentService._load_availability(
+                appointment_id, db
+            )
+            if rebuilt:
+                await db.commit()
+            # 저장하지 못한 재구성 결과는 버전이 없으므로 캐시하지 않음
+            version = row.version if row is not None else None
+
+            optimal_times = await ComputeExecutor.run(
+                aggregate.find_common_slots,
+                min_duration_minutes,
+                time_range_start=time_range_start,
+                time_range_end=time_range_end,
+                limit=limit,
+                min_participants=min_participants,
+                dates=dates,
+                size=len(aggregate.segments),
+            )
+
+        if version is not None:
+            cache.set((appointment_id, version, params), optimal_times)
+
+        return optimal_times
+
+    @staticmethod
+    def optimal_times_cache_stats() -> dict:
+        return AppointmentService._optimal_times_cache.stats()
+
+    @staticmethod
+    async def _get_availability_version(
+        appointment_id: int, db: AsyncSession
+    ) -> Optional[int]:
+        # 약속 가용시간 집계 버전만 조회 (집계가 없으면 None)
+        result = await db.execute(
+            select(AppointmentAvailability.version).where(
+                AppointmentAvailability.appointment_id == appointment_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def _load_user_slots(appointment_id: int, db: AsyncSession) -> List[dict]:
+        # 가용시간 데이터가 있는 참여자들의 슬롯과 타임존 파싱
         result = await db.execute(
             select(Participations)
             .where(Participations.appointment_id == appointment_id)
@@ -318,77 +657,195 @@ class AppointmentService:
         )
         participations = result.scalars().all()
 
-        if not participations:
-            return []
-
-        # JSON 파싱
         all_slots = []
         for p in participations:
             try:
                 slots_data = json.loads(p.available_slots)
-                filtered_slots = AppointmentService._filter_slots_by_time_range(
-                    slots_data["slots"], time_range_start, time_range_end
+                all_slots.append(
+                    {
+                        "user_id": p.user_id,
+                        "slots": slots_data["slots"],
+                        "timezone": slots_data.get("timezone"),
+                    }
                 )
-                all_slots.append({"user_id": p.user_id, "slots": filtered_slots})
             except Exception:
                 pass
 
-        # 교집합 계산
-        optimal_times = ScheduleAnalyzer.find_common_slots(
-            all_slots, min_duration_minutes
+        return all_slots
+
+    @staticmethod
+    async def _load_availability(
+        appointment_id: int, db: AsyncSession
+    ) -> Tuple[Optional[AppointmentAvailability], AvailabilityAggregate, bool]:
+        # 약속 가용시간 집계 전체 조회 (없거나 형식이 맞지 않으면 참여 정보로 재구성)
+        # (재구성 중 다른 요청이 먼저 집계를 저장했으면 행은 None)
+        result = await db.execute(
+            select(AppointmentAvailability).where(
+                AppointmentAvailability.appointment_id == appointment_id
+            )
+        )
+        row = result.scalar_one_or_none()
+
+        if row is not None:
+            try:
+                aggregate = AvailabilityAggregate.from_header_json(row.members)
+                result = await db.execute(
+                    select(AppointmentAvailabilityDay.segments).where(
+                        AppointmentAvailabilityDay.appointment_id == appointment_id
+                    )
+                )
+                aggregate.load_days(result.scalars().all())
+                return row, aggregate, False
+            except (ValueError, KeyError, TypeError):
+                pass
+
+        row, aggregate = await AppointmentService._rebuild_availability(
+            appointment_id, row, db
         )
+        return row, aggregate, True
 
-        return optimal_times
+    @staticmethod
+    async def _rebuild_availability(
+        appointment_id: int,
+        row: Optional[AppointmentAvailability],
+        db: AsyncSession,
+    ) -> Tuple[Optional[AppointmentAvailability], AvailabilityAggregate]:
+        """
+        참여자 전체의 available_slots로 집계와 날짜 행을 모두 다시 생성
+
+        집계가 없던 약속은 savepoint 안에서 새로 저장한다. 동시에 다른 요청이
+        먼저 저장했으면(고유 키 충돌) 저장하지 않고 행 없이 계산 결과만 반환한다.
+        """
+        all_slots = await AppointmentService._load_user_slots(appointment_id, db)
+        aggregate = await ComputeExecutor.run(
+            AvailabilityAggregate.build,
+            all_slots,
+            engine=OPTIMAL_TIMES_ENGINE,
+            size=ScheduleAnalyzer._interval_count(all_slots),
+        )
+
+        if row is None:
+            row = AppointmentAvailability(
+                appointment_id=appointment_id,
+                members=aggregate.header_json(),
+                version=1,
+            )
+            try:
+                async with db.begin_nested():
+                    db.add(row)
+                    await AppointmentService._store_days(
+                        appointment_id, aggregate, aggregate.day_rows().keys(), {}, db
+                    )
+                    await db.flush()
+            except IntegrityError:
+                return None, aggregate
+            return row, aggregate
+
+        row.members = aggregate.header_json()
+        row.version += 1
+
+        await db.execute(
+            delete(AppointmentAvailabilityDay).where(
+                AppointmentAvailabilityDay.appointment_id == appointment_id
+            )
+        )
+        await AppointmentService._store_days(
+            appointment_id, aggregate, aggregate.day_rows().keys(), {}, db
+        )
+        return row, aggregate
 
     @staticmethod
-    def _filter_slots_by_time_range(
-        slots: List[dict], time_range_start: str = None, time_range_end: str = None
-    ) -> List[dict]:
-        #저장된 가용 시간 슬롯을 시간대 필터로 제한
-        if not time_range_start and not time_range_end:
-            return slots
-
-        from datetime import datetime
-
-        filter_start = (
-            datetime.strptime(time_range_start, "%H:%M").time()
-            if time_range_start
-            else datetime.strptime("00:00", "%H:%M").time()
-        )
-        filter_end = (
-            datetime.strptime(time_range_end, "%H:%M").time()
-            if time_range_end
-            else datetime.strptime("23:59", "%H:%M").time()
-        )
-
-        filtered_slots = []
-        for slot in slots:
-            date_str = slot["date"]
-            filtered_times = []
-
-            for time_range in slot.get("available_times", []):
-                start_time = datetime.strptime(time_range["start"], "%H:%M").time()
-                end_time = datetime.strptime(time_range["end"], "%H:%M").time()
-
-                # 필터 범위와 겹치는 부분만 추출
-                new_start = max(start_time, filter_start)
-                new_end = min(end_time, filter_end)
-
-                # 유효한 범위가 있으면 추가
-                if new_start < new_end:
-                    filtered_times.append(
-                        {
-                            "start": new_start.strftime("%H:%M"),
-                            "end": new_end.strftime("%H:%M"),
-                        }
+    async def _store_days(
+        appointment_id: int,
+        aggregate: AvailabilityAggregate,
+        days,
+        existing: Dict[int, AppointmentAvailabilityDay],
+        db: AsyncSession,
+    ) -> None:
+        # 주어진 날짜 행만 집계 내용으로 추가/수정하고 비게 된 날짜 행은 삭제
+        serialized = aggregate.day_rows(days)
+        for day in days:
+            segments = serialized.get(day)
+            row = existing.get(day)
+            if segments is None:
+                if row is not None:
+                    await db.delete(row)
+            elif row is None:
+                db.add(
+                    AppointmentAvailabilityDay(
+                        appointment_id=appointment_id, day=day, segments=segments
                     )
+                )
+            else:
+                row.segments = segments
+
+    @staticmethod
+    async def _apply_availability_delta(
+        appointment_id: int,
+        user_id: str,
+        available_slots: Optional[dict],
+        db: AsyncSession,
+        intervals: Optional[List] = None,
+    ) -> None:
+        """
+        참여자 한 명의 가용시간 변경분만 집계에 반영
+
+        참여자 정보 행을 잠근 뒤 이 참여자의 이전/새 가용시간이 걸친 날짜 행만
+        읽고 쓴다. 집계가 없거나 형식이 맞지 않으면 참여 정보로 재구성하므로,
+        호출 전에 참여 정보의 available_slots를 먼저 갱신해야 한다.
+        """
+        result = await db.execute(
+            select(AppointmentAvailability)
+            .where(AppointmentAvailability.appointment_id == appointment_id)
+            .with_for_update()
+        )
+        row = result.scalar_one_or_none()
+        user_id = str(user_id)
 
-            if filtered_times:
-                filtered_slots.append(
-                    {"date": date_str, "available_times": filtered_times}
+        try:
+            if row is None:
+                raise ValueError("집계가 없습니다")
+            aggregate = AvailabilityAggregate.from_header_json(row.members)
+            if intervals is None:
+                intervals = (
+                    AvailabilityAggregate.member_intervals(
+                        available_slots["slots"], available_slots.get("timezone")
+                    )
+                    if available_slots
+                    else []
+                )
+            days = aggregate.affected_days(user_id, intervals)
+
+            # 날짜 행도 잠금 조회로 읽어 최신 커밋 내용을 기준으로 반영
+            result = await db.execute(
+                select(AppointmentAvailabilityDay)
+                .where(AppointmentAvailabilityDay.appointment_id == appointment_id)
+                .where(AppointmentAvailabilityDay.day.in_(days))
+                .with_for_update()
+            )
+            day_rows = {day_row.day: day_row for day_row in result.scalars()}
+            aggregate.load_days(day_row.segments for day_row in day_rows.values())
+        except (ValueError, KeyError, TypeError):
+            rebuilt, _ = await AppointmentService._rebuild_availability(
+                appointment_id, row, db
+            )
+            if rebuilt is None:
+                # 다른 요청이 먼저 만든 집계에 이 참여자의 변경분을 다시 반영
+                await AppointmentService._apply_availability_delta(
+                    appointment_id, user_id, available_slots, db, intervals
                 )
+            return
 
-        return filtered_slots
+        if available_slots:
+            aggregate.set_member_intervals(user_id, intervals)
+        else:
+            aggregate.remove_member(user_id)
+
+        await AppointmentService._store_days(
+            appointment_id, aggregate, days, day_rows, db
+        )
+        row.members = aggregate.header_json()
+        row.version += 1
 
     @staticmethod
     async def get_my_appointments(user_id: str, db: AsyncSession) -> List[Appointments]:
@@ -406,58 +863,109 @@ class AppointmentService:
     @staticmethod
     async def sync_my_schedules(user_id: str, db: AsyncSession) -> dict:
         # 내가 참여한 모든 약속의 일정 동기화
+        # (참여 정보/후보 날짜는 한 번씩 조회하고 Google 조회도 한 번만 수행)
 
         user = await UserService.get_user_by_google_id(str(user_id), db)
         if not user or not user.google_refresh_token:
             raise ValueError("구글 캘린더 연동이 필요합니다")
 
-        # 참여 중인 약속 조회
+        # 투표 중인 약속의 내 참여 정보 조회
         result = await db.execute(
-            select(Appointments)
-            .join(Participations, Appointments.id == Participations.appointment_id)
+            select(Participations)
+            .join(Appointments, Appointments.id == Participations.appointment_id)
             .where(Participations.user_id == user_id)
             .where(Appointments.status == "VOTING")
         )
-        appointments = result.scalars().all()
-
-        updated_count = 0
-        failed_count = 0
-
-        # 각 약속에 대해 일정 재계산
-        for appointment in appointments:
-            try:
-                participation = await AppointmentService._get_participation(
-                    user_id, appointment.id, db
-                )
-
-                if not participation:
-                    failed_count += 1
-                    continue
+        participations = {p.appointment_id: p for p in result.scalars().all()}
+        if not participations:
+            return {
+                "total_appointments": 0,
+                "updated_count": 0,
+                "failed_count": 0,
+                "results": [],
+            }
+
+        # 모든 약속의 후보 날짜를 한 번에 조회
+        # (집계 잠금은 Google 조회가 끝난 뒤 쓰기 단계에서 약속 id 순서로 잡음)
+        appointment_ids = sorted(participations)
+        result = await db.execute(
+            select(
+                AppointmentDates.appointment_id, AppointmentDates.candidate_date
+            ).where(AppointmentDates.appointment_id.in_(appointment_ids))
+        )
+        candidate_dates: Dict[int, List[date]] = defaultdict(list)
+        for appointment_id, candidate_date in result.all():
+            candidate_dates[appointment_id].append(candidate_date)
+
+        # 전체 후보 날짜 범위를 한 번 조회해 약속별 가용시간 계산
+        available_slots_by_id = await ScheduleAnalyzer.calculate_available_slots_batch(
+            user,
+            {
+                appointment_id: candidate_dates.get(appointment_id, [])
+                for appointment_id in appointment_ids
+            },
+            db=db,
+        )
 
-                candidate_dates_obj = await AppointmentService.get_appointment_dates(
-                    appointment.id, db
-                )
-                candidate_dates = [ad.candidate_date for ad in candidate_dates_obj]
+        async def _merge(appointment_id: int) -> Tuple[dict, List]:
+            # 약속 하나의 집계 반영분 계산 (DB 접근 없이 계산만, 세션은 아래에서 순서대로 사용)
+            available_slots = available_slots_by_id.get(appointment_id)
+            if not available_slots:
+                raise ValueError("가용시간을 계산하지 못했습니다")
+
+            intervals = await ComputeExecutor.run(
+                AvailabilityAggregate.member_intervals,
+                available_slots["slots"],
+                available_slots.get("timezone"),
+                size=ScheduleAnalyzer._interval_count(
+                    [{"slots": available_slots["slots"]}]
+                ),
+            )
+            return available_slots, intervals
 
-                available_slots = await ScheduleAnalyzer.calculate_available_slots(
-                    user=user, candidate_dates=candidate_dates
-                )
+        outcomes = await run_bounded(
+            appointment_ids,
+            _merge,
+            limit=SYNC_CONCURRENCY_LIMIT,
+            timeout=SYNC_APPOINTMENT_TIMEOUT_SECONDS,
+        )
 
-                if available_slots:
-                    participation.available_slots = json.dumps(
-                        available_slots, ensure_ascii=False
+        # 성공한 약속만 잠금 아래에서 최신 집계를 다시 읽어 반영하고 한 번에 커밋
+        # (약속마다 savepoint를 써서 반영에 실패한 약속은 참여 정보도 이전 상태로 유지)
+        results = []
+        for appointment_id, outcome in outcomes.items():
+            if outcome.ok:
+                available_slots, intervals = outcome.value
+                try:
+                    async with db.begin_nested():
+                        participations[appointment_id].available_slots = json.dumps(
+                            available_slots, ensure_ascii=False
+                        )
+                        await db.flush()
+                        await AppointmentService._apply_availability_delta(
+                            appointment_id, user_id, available_slots, db, intervals
+                        )
+                    results.append(
+                        {"appointment_id": appointment_id, "status": "updated"}
                     )
-                    updated_count += 1
-                else:
-                    failed_count += 1
+                    continue
+                except Exception as exc:
+                    outcome = outcome._replace(error=exc)
 
-            except Exception:
-                failed_count += 1
+            results.append(
+                {
+                    "appointment_id": appointment_id,
+                    "status": "timeout" if outcome.timed_out else "failed",
+                    "error": str(outcome.error) or type(outcome.error).__name__,
+                }
+            )
 
         await db.commit()
 
+        updated_count = sum(1 for entry in results if entry["status"] == "updated")
         return {
-            "total_appointments": len(appointments),
+            "total_appointments": len(results),
             "updated_count": updated_count,
-            "failed_count": failed_count,
+            "failed_count": len(results) - updated_count,
+            "results": results,
         }
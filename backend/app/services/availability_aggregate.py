@@ -0,0 +1,271 @@
+import json
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.services.schedule_analyzer import ScheduleAnalyzer
+from app.utils.time_interval import TimeInterval, get_zone
+
+# (시작 epoch 분, 끝 epoch 분, 참여자 비트마스크)
+Segment = Tuple[int, int, int]
+
+
+class AvailabilityAggregate:
+    """
+    약속 단위 가용시간 집계
+
+    절대 시각(epoch 분) 타임라인 위에서 참여자 구성이 같은 최대 구간(segment)과
+    그 구간의 참여자 비트마스크를 보관한다. 참여자별 타임존은 반영 시점에 변환되므로
+    서로 다른 타임존의 참여자도 한 타임라인에서 교집합을 구한다. 참여자 한 명의
+    가용시간이 바뀌면 해당 비트만 갱신하므로 전체 참여자의 available_slots를
+    다시 읽지 않고도 최적 시간 블록을 바로 꺼낼 수 있다.
+
+    저장은 참여자 정보(header) 한 행과 UTC 날짜별 구간 행으로 나눈다. 참여자별로
+    구간이 걸친 날짜를 기억하므로, 한 명의 변경은 그 사람의 이전/새 날짜 행만
+    읽고 쓰면 된다.
+    """
+
+    FORMAT_VERSION = 3
+    DAY_MINUTES = 24 * 60
+
+    def __init__(
+        self,
+        members: Optional[List[Optional[str]]] = None,
+        segments: Optional[List[Segment]] = None,
+        member_days: Optional[Dict[str, List[int]]] = None,
+    ):
+        # 비트 위치 -> user_id (탈퇴한 자리는 None으로 비워두고 재사용)
+        self.members: List[Optional[str]] = members if members is not None else []
+        self.segments: List[Segment] = segments if segments is not None else []
+        # user_id -> 가용 구간이 걸친 UTC 날짜(epoch 일) 목록
+        self.member_days: Dict[str, List[int]] = (
+            member_days if member_days is not None else {}
+        )
+
+    @property
+    def participant_count(self) -> int:
+        return sum(1 for member in self.members if member is not None)
+
+    @classmethod
+    def build(
+        cls, user_slots: List[dict], engine: str = ScheduleAnalyzer.ENGINE_SWEEP
+    ) -> "AvailabilityAggregate":
+        # 전체 참여자의 가용시간으로 집계를 새로 구성
+        user_ids, intervals_by_user = ScheduleAnalyzer._collect_user_intervals(
+            user_slots
+        )
+
+        segments = [
+            (block.start, block.end, mask)
+            for block, mask in ScheduleAnalyzer._iter_common_blocks(
+                intervals_by_user, engine
+            )
+        ]
+
+        member_days = {
+            str(user_id): sorted(cls.days_of(intervals_by_user.get(position, [])))
+            for position, user_id in enumerate(user_ids)
+        }
+        return cls([str(user_id) for user_id in user_ids], segments, member_days)
+
+    @classmethod
+    def from_header_json(cls, raw: str) -> "AvailabilityAggregate":
+        # 참여자 정보만 복원 (구간은 load_days로 필요한 날짜만 채움)
+        data = json.loads(raw)
+        if data.get("format") != cls.FORMAT_VERSION:
+            raise ValueError("지원하지 않는 집계 형식입니다")
+
+        return cls(data["members"], [], data["member_days"])
+
+    def header_json(self) -> str:
+        return json.dumps(
+            {
+                "format": self.FORMAT_VERSION,
+                "members": self.members,
+                "member_days": self.member_days,
+            },
+            ensure_ascii=False,
+        )
+
+    def day_rows(self, days: Optional[Iterable[int]] = None) -> Dict[int, str]:
+        # 구간을 UTC 날짜 경계에서 잘라 날짜별로 직렬화 (days를 주면 그 날짜만)
+        wanted = None if days is None else set(days)
+        pieces: Dict[int, List[list]] = defaultdict(list)
+        for start, end, mask in self.segments:
+            while start < end:
+                day = start // self.DAY_MINUTES
+                cut = min(end, (day + 1) * self.DAY_MINUTES)
+                if wanted is None or day in wanted:
+                    pieces[day].append([start, cut, f"{mask:x}"])
+                start = cut
+
+        return {day: json.dumps(segments) for day, segments in pieces.items()}
+
+    def load_days(self, rows: Iterable[str]) -> None:
+        # 날짜별로 저장된 구간을 합쳐 하나의 타임라인으로 복원
+        pieces = [
+            (start, end, int(mask, 16))
+            for raw in rows
+            for start, end, mask in json.loads(raw)
+        ]
+        self.segments = self._coalesce(sorted(self.segments + pieces))
+
+    @classmethod
+    def days_of(cls, intervals: Iterable[TimeInterval]) -> Set[int]:
+        days: Set[int] = set()
+        for start, end in intervals:
+            if start < end:
+                days.update(
+                    range(start // cls.DAY_MINUTES, (end - 1) // cls.DAY_MINUTES + 1)
+                )
+        return days
+
+    def affected_days(self, user_id: str, intervals: List[TimeInterval]) -> Set[int]:
+        # 참여자 한 명을 갱신할 때 읽고 써야 하는 날짜 (이전 + 새 가용시간)
+        return set(self.member_days.get(user_id, ())) | self.days_of(intervals)
+
+    @staticmethod
+    def member_intervals(
+        slots: List[dict], timezone: Optional[str] = None
+    ) -> List[TimeInterval]:
+        # 참여자 한 명의 available_slots -> 병합된 절대 시각(epoch 분) 구간
+        _, intervals_by_user = ScheduleAnalyzer._collect_user_intervals(
+            [{"user_id": "member", "slots": slots, "timezone": timezone}]
+        )
+        return ScheduleAnalyzer._merge_time_periods(intervals_by_user.get(0, []))
+
+    def set_member_slots(
+        self,
+        user_id: str,
+        slots: Optional[List[dict]],
+        timezone: Optional[str] = None,
+    ) -> None:
+        # 한 참여자의 가용시간만 교체 (None이면 집계에서 제외)
+        if slots is None:
+            self.remove_member(user_id)
+            return
+
+        self.set_member_intervals(user_id, self.member_intervals(slots, timezone))
+
+    def set_member_intervals(self, user_id: str, intervals: List[TimeInterval]) -> None:
+        self.remove_member(user_id)
+        bit = 1 << self._allocate(user_id)
+        self.segments = self._add_bit(self.segments, intervals, bit)
+        self.member_days[user_id] = sorted(self.days_of(intervals))
+
+    def remove_member(self, user_id: str) -> None:
+        self.member_days.pop(user_id, None)
+        if user_id not in self.members:
+            return
+
+        position = self.members.index(user_id)
+        self.members[position] = None
+        keep = ~(1 << position)
+
+        self.segments = self._coalesce(
+            (start, end, mask & keep) for start, end, mask in self.segments
+        )
+
+        while self.members and self.members[-1] is None:
+            self.members.pop()
+
+    def iter_blocks(
+        self,
+        time_range_start: Optional[str] = None,
+        time_range_end: Optional[str] = None,
+        timezone: str = ScheduleAnalyzer.DEFAULT_TIMEZONE,
+        dates: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[str, TimeInterval, int]]:
+        # timezone 기준 날짜별 최대 블록 반환 (시간대 필터가 있으면 구간을 잘라서 반환)
+        # dates를 지정하면 후보 날짜의 블록만 반환
+        return ScheduleAnalyzer._localize_blocks(
+            ((TimeInterval(start, end), mask) for start, end, mask in self.segments),
+            get_zone(timezone),
+            ScheduleAnalyzer._time_range_clip(time_range_start, time_range_end),
+            dates,
+        )
+
+    def find_common_slots(
+        self,
+        min_duration_minutes: int,
+        time_range_start: Optional[str] = None,
+        time_range_end: Optional[str] = None,
+        limit: Optional[int] = None,
+        min_participants: int = 1,
+        timezone: str = ScheduleAnalyzer.DEFAULT_TIMEZONE,
+        dates: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        # ScheduleAnalyzer.find_common_slots와 같은 형태의 결과를 집계에서 바로 계산
+        total_participants = self.participant_count
+        if not total_participants:
+            return []
+
+        blocks = ScheduleAnalyzer._rank_blocks(
+            self.iter_blocks(time_range_start, time_range_end, timezone, dates),
+            min_duration_minutes,
+            min_participants,
+            limit,
+        )
+
+        return [
+            ScheduleAnalyzer._format_block(
+                date_str, block, mask, self.members, total_participants
+            )
+            for date_str, block, mask in blocks
+        ]
+
+    def _allocate(self, user_id: str) -> int:
+        try:
+            position = self.members.index(None)
+        except ValueError:
+            self.members.append(user_id)
+            return len(self.members) - 1
+
+        self.members[position] = user_id
+        return position
+
+    @staticmethod
+    def _add_bit(
+        segments: List[Segment], intervals: List[TimeInterval], bit: int
+    ) -> List[Segment]:
+        # 기존 구간과 새 구간의 경계를 합쳐 조각마다 비트를 더한 뒤 다시 병합
+        boundaries = sorted(
+            {point for start, end, _ in segments for point in (start, end)}
+            | {point for interval in intervals for point in interval}
+        )
+
+        pieces: List[Segment] = []
+        segment_index = interval_index = 0
+        for left, right in zip(boundaries, boundaries[1:]):
+            while segment_index < len(segments) and segments[segment_index][1] <= left:
+                segment_index += 1
+            while (
+                interval_index < len(intervals)
+                and intervals[interval_index].end <= left
+            ):
+                interval_index += 1
+
+            mask = 0
+            if segment_index < len(segments) and segments[segment_index][0] <= left:
+                mask = segments[segment_index][2]
+            if (
+                interval_index < len(intervals)
+                and intervals[interval_index].start <= left
+            ):
+                mask |= bit
+
+            pieces.append((left, right, mask))
+
+        return AvailabilityAggregate._coalesce(pieces)
+
+    @staticmethod
+    def _coalesce(segments: Iterable[Segment]) -> List[Segment]:
+        # 빈 구간은 버리고 맞닿은 같은 구성의 구간은 하나로 병합
+        result: List[Segment] = []
+        for start, end, mask in segments:
+            if not mask or start >= end:
+                continue
+            if result and result[-1][1] == start and result[-1][2] == mask:
+                result[-1] = (result[-1][0], end, mask)
+            else:
+                result.append((start, end, mask))
+        return result
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.calendar_sync_model import CalendarSyncState
+from app.services.calendar_watch_service import CalendarWatchService
+from app.services.google_calendar_service import GoogleCalendarService
+from app.utils.time_interval import (
+    MINUTES_PER_DAY,
+    TimeInterval,
+    epoch_minutes_to_rfc3339,
+    get_zone,
+)
+from app.variable import (
+    CALENDAR_SYNC_FRESHNESS_SECONDS,
+    CALENDAR_SYNC_HORIZON_DAYS,
+    CALENDAR_SYNC_WATCHED_FRESHNESS_SECONDS,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CalendarSyncService:
+    """
+    사용자별 바쁜 구간 저장소
+
+    처음에는 동기화 범위 전체를 받아 오고, 이후에는 Google syncToken으로 바뀌거나
+    삭제된 이벤트만 받아 저장된 바쁜 구간에 반영한다. 토큰이 만료되면(410)
+    전체 동기화를 다시 수행한다. 변경 알림 채널이 살아 있고 그 뒤로 알림이
+    없었다면 CALENDAR_SYNC_WATCHED_FRESHNESS_SECONDS 동안 Google을 호출하지 않고
+    저장된 구간을 그대로 사용한다. 채널이 없어도 마지막 동기화 후
+    CALENDAR_SYNC_FRESHNESS_SECONDS 이내면 다시 동기화하지 않아 여러 약속이
+    같은 사용자의 구간을 연달아 조회해도 Google 호출은 한 번이다.
+    """
+
+    # 증분 동기화에 필요한 필드만 요청 (취소 이벤트는 id/status만 내려옴)
+    SYNC_EVENT_FIELDS = (
+        "items(id,status,start,end,transparency),nextPageToken,nextSyncToken"
+    )
+    _stats: Dict[str, int] = {"fresh_hits": 0, "incremental_syncs": 0, "full_syncs": 0}
+
+    @staticmethod
+    async def get_busy_timeline(
+        user_id: str,
+        access_token: str,
+        window: TimeInterval,
+        timezone: str,
+        db: AsyncSession,
+    ) -> List[TimeInterval]:
+        # 저장소를 최신 상태로 맞춘 뒤 window와 겹치는 바쁜 구간 반환 (epoch 분)
+        # (첫 저장이 충돌하면 세션을 롤백하므로 db는 저장소 전용 세션이어야 함)
+        result = await db.execute(
+            select(CalendarSyncState).where(CalendarSyncState.user_id == user_id)
+        )
+        state = result.scalar_one_or_none()
+        watching = CalendarWatchService.is_enabled() and (
+            await CalendarWatchService.is_watching(user_id, db)
+        )
+        if state is None:
+            # 첫 동기화가 성공한 뒤에만 세션에 추가
+            state = CalendarSyncState(
+                user_id=user_id,
+                busy_events="{}",
+                change_count=0,
+                synced_change_count=0,
+            )
+            await CalendarSyncService.sync(state, access_token, window, timezone)
+            db.add(state)
+            try:
+                await db.flush()
+            except IntegrityError:
+                # 동시에 첫 동기화한 다른 요청이 먼저 저장한 경우 그 행을 그대로 두고
+                # 방금 받아 온 구간으로 응답
+                await db.rollback()
+                LOGGER.info("Sync state for user %s already created", user_id)
+                return CalendarSyncService.busy_timeline(state, window)
+        elif CalendarSyncService.is_fresh(state, window, timezone, watching):
+            CalendarSyncService._stats["fresh_hits"] += 1
+        else:
+            await CalendarSyncService.sync(state, access_token, window, timezone)
+
+        if CalendarWatchService.is_enabled() and not watching:
+            # 채널 등록에 실패해도 조회는 계속 (다음 조회 때 다시 시도)
+            try:
+                await CalendarWatchService.ensure_channel(user_id, access_token, db)
+            except HTTPException as exc:
+                LOGGER.warning(
+                    "Failed to watch calendar for user %s: %s", user_id, exc.detail
+                )
+
+        return CalendarSyncService.busy_timeline(state, window)
+
+    @staticmethod
+    async def sync(
+        state: CalendarSyncState,
+        access_token: str,
+        window: TimeInterval,
+        timezone: str,
+    ) -> None:
+        # 동기화 도중 들어온 알림은 다음 조회 때 다시 반영되도록 시작 시점 값 기록
+        change_count = state.change_count or 0
+        if CalendarSyncService._covers(state, window, timezone):
+            try:
+                await CalendarSyncService._incremental_sync(state, access_token)
+                CalendarSyncService._mark_synced(state, change_count)
+                CalendarSyncService._stats["incremental_syncs"] += 1
+                return
+            except HTTPException as exc:
+                if exc.status_code != 410:
+                    raise
+                LOGGER.info(
+                    "Sync token expired for user %s; full resync", state.user_id
+                )
+
+        await CalendarSyncService._full_sync(state, access_token, window, timezone)
+        CalendarSyncService._mark_synced(state, change_count)
+        CalendarSyncService._stats["full_syncs"] += 1
+
+    @staticmethod
+    def is_fresh(
+        state: CalendarSyncState,
+        window: TimeInterval,
+        timezone: str,
+        watching: bool = False,
+        now: Optional[float] = None,
+    ) -> bool:
+        # 요청 범위를 이미 동기화했고 그 뒤로 변경 알림이 없으며,
+        # 마지막 동기화가 유효기간 이내인 상태
+        # (알림 채널이 살아 있으면 더 긴 유효기간, 알림이 유실돼도 결국 다시 동기화)
+        if not CalendarSyncService._covers(state, window, timezone):
+            return False
+        if (state.change_count or 0) != (state.synced_change_count or 0):
+            return False
+
+        max_age = (
+            CALENDAR_SYNC_WATCHED_FRESHNESS_SECONDS
+            if watching
+            else CALENDAR_SYNC_FRESHNESS_SECONDS
+        )
+        now = time.time() if now is None else now
+        return state.synced_at is not None and now - state.synced_at < max_age
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        return dict(CalendarSyncService._stats)
+
+    @staticmethod
+    def _mark_synced(state: CalendarSyncState, change_count: int) -> None:
+        state.synced_change_count = change_count
+        state.synced_at = int(time.time())
+
+    @staticmethod
+    def _covers(state: CalendarSyncState, window: TimeInterval, timezone: str) -> bool:
+        return bool(
+            state.sync_token
+            and state.timezone == timezone
+            and state.window_start <= window.start
+            and window.end <= state.window_end
+        )
+
+    @staticmethod
+    def busy_timeline(
+        state: CalendarSyncState, window: Optional[TimeInterval] = None
+    ) -> List[TimeInterval]:
+        from app.services.schedule_analyzer import ScheduleAnalyzer
+
+        busy = ScheduleAnalyzer._merge_time_periods(
+            [
+                TimeInterval(start, end)
+                for start, end in json.loads(state.busy_events or "{}").values()
+            ]
+        )
+        if window is None:
+            return busy
+        return ScheduleAnalyzer._overlapping(busy, window)
+
+    @staticmethod
+    async def _full_sync(
+        state: CalendarSyncState,
+        access_token: str,
+        window: TimeInterval,
+        timezone: str,
+    ) -> None:
+        # 요청 범위와 (어제 ~ 동기화 기간) 중 넓은 범위를 처음부터 동기화
+        now = int(time.time()) // 60
+        window_start = min(window.start, now - MINUTES_PER_DAY)
+        window_end = max(window.end, now + CALENDAR_SYNC_HORIZON_DAYS * MINUTES_PER_DAY)
+
+        busy_events: Dict[str, List[int]] = {}
+        sync_token = await CalendarSyncService._consume_pages(
+            GoogleCalendarService.iter_primary_events(
+                access_token,
+                time_min=epoch_minutes_to_rfc3339(window_start),
+                time_max=epoch_minutes_to_rfc3339(window_end),
+                time_zone=timezone,
+                fields=CalendarSyncService.SYNC_EVENT_FIELDS,
+                order_by=None,
+            ),
+            busy_events,
+            timezone,
+        )
+
+        state.sync_token = sync_token
+        state.timezone = timezone
+        state.window_start = window_start
+        state.window_end = window_end
+        state.busy_events = json.dumps(busy_events)
+
+    @staticmethod
+    async def _incremental_sync(state: CalendarSyncState, access_token: str) -> None:
+        # 마지막 동기화 이후 바뀐 이벤트만 반영
+        busy_events: Dict[str, List[int]] = json.loads(state.busy_events or "{}")
+        sync_token = await CalendarSyncService._consume_pages(
+            GoogleCalendarService.iter_primary_events(
+                access_token,
+                time_min=None,
+                time_max=None,
+                time_zone=state.timezone,
+                fields=CalendarSyncService.SYNC_EVENT_FIELDS,
+                sync_token=state.sync_token,
+                order_by=None,
+            ),
+            busy_events,
+            state.timezone,
+        )
+
+        state.sync_token = sync_token
+        state.busy_events = json.dumps(busy_events)
+
+    @staticmethod
+    async def _consume_pages(
+        pages: Any, busy_events: Dict[str, List[int]], timezone: str
+    ) -> Optional[str]:
+        # 페이지가 도착하는 대로 반영하고 마지막 페이지의 nextSyncToken 반환
+        sync_token = None
+        async for page in pages:
+            CalendarSyncService._apply_events(page["events"], busy_events, timezone)
+            sync_token = page.get("nextSyncToken") or sync_token
+        return sync_token
+
+    @staticmethod
+    def _apply_events(
+        events: Iterable[Dict[str, Any]],
+        busy_events: Dict[str, List[int]],
+        timezone: str,
+    ) -> None:
+        from app.services.schedule_analyzer import ScheduleAnalyzer
+
+        zone = get_zone(timezone)
+        for event in events:
+            event_id = event.get("id")
+            if not event_id:
+                continue
+
+            # 삭제/취소되었거나 "한가함"으로 바뀐 이벤트는 저장소에서 제거
+            interval = None
+            if (
+                event.get("status") != "cancelled"
+                and event.get("transparency") != "transparent"
+            ):
+                interval = ScheduleAnalyzer._event_interval(event, zone)
+
+            if interval is not None and interval.start < interval.end:
+                busy_events[event_id] = [interval.start, interval.end]
+            else:
+                busy_events.pop(event_id, None)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import hmac
+import logging
+import secrets
+import time
+import uuid
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import insert, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.calendar_sync_model import CalendarSyncState, CalendarWatchChannel
+from app.models.user_model import User
+from app.services.google_calendar_service import GoogleCalendarService
+from app.variable import (
+    CALENDAR_WATCH_RENEW_BEFORE_SECONDS,
+    CALENDAR_WATCH_RENEW_INTERVAL_SECONDS,
+    CALENDAR_WATCH_TTL_SECONDS,
+    GOOGLE_WEBHOOK_URL,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CalendarWatchService:
+    """
+    사용자별 Google 캘린더 변경 알림(events.watch) 채널 관리
+
+    알림을 받으면 바쁜 구간 저장소를 오래된 상태로 표시해 다음 조회 때만
+    Google과 다시 동기화한다. 채널은 만료 전에 백그라운드 작업이 갱신한다.
+    """
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return bool(GOOGLE_WEBHOOK_URL)
+
+    @staticmethod
+    async def ensure_channel(
+        user_id: str, access_token: str, db: AsyncSession
+    ) -> Optional[CalendarWatchChannel]:
+        # 유효한 채널이 있으면 그대로, 없거나 곧 만료되면 새 채널 등록
+        if not CalendarWatchService.is_enabled():
+            return None
+
+        result = await db.execute(
+            select(CalendarWatchChannel).where(CalendarWatchChannel.user_id == user_id)
+        )
+        channel = result.scalar_one_or_none()
+        now = int(time.time())
+        if channel and channel.expires_at - now > CALENDAR_WATCH_RENEW_BEFORE_SECONDS:
+            return channel
+
+        channel_id = uuid.uuid4().hex
+        token = secrets.token_urlsafe(32)
+        created = await GoogleCalendarService.watch_events(
+            access_token,
+            channel_id=channel_id,
+            address=GOOGLE_WEBHOOK_URL,
+            token=token,
+            ttl_seconds=CALENDAR_WATCH_TTL_SECONDS,
+        )
+        expires_at = created["expiration"] // 1000 or now + CALENDAR_WATCH_TTL_SECONDS
+
+        if channel is None:
+            # 동시에 첫 등록한 요청과 경쟁하면 먼저 저장된 채널을 쓰고 새 채널은 해제
+            await db.execute(
+                CalendarWatchService._insert_if_absent(
+                    db,
+                    user_id=user_id,
+                    channel_id=channel_id,
+                    resource_id=created["resourceId"],
+                    token=token,
+                    expires_at=expires_at,
+                )
+            )
+            result = await db.execute(
+                select(CalendarWatchChannel)
+                .where(CalendarWatchChannel.user_id == user_id)
+                .execution_options(populate_existing=True)
+            )
+            channel = result.scalar_one()
+            if channel.channel_id != channel_id:
+                await CalendarWatchService._stop_channel(
+                    access_token, channel_id, created["resourceId"]
+                )
+            return channel
+
+        # 이전 채널 해제 실패는 만료되면 정리되므로 무시
+        await CalendarWatchService._stop_channel(
+            access_token, channel.channel_id, channel.resource_id
+        )
+        channel.channel_id = channel_id
+        channel.resource_id = created["resourceId"]
+        channel.token = token
+        channel.expires_at = expires_at
+        return channel
+
+    @staticmethod
+    async def _stop_channel(
+        access_token: str, channel_id: str, resource_id: str
+    ) -> None:
+        # 해제 실패는 채널이 만료되면 정리되므로 기록만 남김
+        try:
+            await GoogleCalendarService.stop_channel(
+                access_token, channel_id=channel_id, resource_id=resource_id
+            )
+        except HTTPException as exc:
+            LOGGER.warning("Failed to stop channel %s: %s", channel_id, exc.detail)
+
+    @staticmethod
+    def _insert_if_absent(db: AsyncSession, **values):
+        # user_id 행이 이미 있으면 바꾸지 않는 INSERT (DB별 upsert 구문)
+        dialect = db.bind.dialect.name if db.bind is not None else None
+        if dialect == "mysql":
+            statement = mysql_insert(CalendarWatchChannel).values(**values)
+            return statement.on_duplicate_key_update(
+                user_id=CalendarWatchChannel.user_id
+            )
+        if dialect == "sqlite":
+            return (
+                sqlite_insert(CalendarWatchChannel)
+                .values(**values)
+                .on_conflict_do_nothing(index_elements=["user_id"])
+            )
+        return insert(CalendarWatchChannel).values(**values)
+
+    @staticmethod
+    async def is_watching(user_id: str, db: AsyncSession) -> bool:
+        result = await db.execute(
+            select(CalendarWatchChannel.expires_at).where(
+                CalendarWatchChannel.user_id == user_id
+            )
+        )
+        expires_at = result.scalar_one_or_none()
+        return expires_at is not None and expires_at > time.time()
+
+    @staticmethod
+    async def handle_notification(
+        channel_id: str,
+        channel_token: Optional[str],
+        resource_id: Optional[str],
+        resource_state: Optional[str],
+        db: AsyncSession,
+    ) -> Optional[str]:
+        """
+        웹훅 알림 처리
+
+        변경 알림이면 해당 사용자의 저장소를 오래된 상태로 표시하고 user_id를
+        반환한다. 채널 등록 직후의 sync 알림이면 None을 반환한다.
+        """
+        result = await db.execute(
+            select(CalendarWatchChannel).where(
+                CalendarWatchChannel.channel_id == channel_id
+            )
+        )
+        channel = result.scalar_one_or_none()
+        if (
+            channel is None
+            or not hmac.compare_digest(channel.token, channel_token or "")
+            or (resource_id and resource_id != channel.resource_id)
+        ):
+            raise HTTPException(status_code=404, detail="unknown_channel")
+
+        if resource_state == "sync":
+            return None
+
+        # 동기화 중인 세션과 충돌하지 않도록 카운터만 원자적으로 증가
+        await db.execute(
+            update(CalendarSyncState)
+            .where(CalendarSyncState.user_id == channel.user_id)
+            .values(change_count=CalendarSyncState.change_count + 1)
+        )
+        await db.commit()
+        return channel.user_id
+
+    @staticmethod
+    async def renew_expiring_channels(db: AsyncSession) -> int:
+        # 곧 만료되는 채널을 새로 등록하고 갱신한 채널 수 반환
+        deadline = int(time.time()) + CALENDAR_WATCH_RENEW_BEFORE_SECONDS
+        result = await db.execute(
+            select(CalendarWatchChannel.user_id, User.google_refresh_token)
+            .join(User, User.user_id == CalendarWatchChannel.user_id)
+            .where(CalendarWatchChannel.expires_at <= deadline)
+        )
+
+        renewed = 0
+        for user_id, refresh_token in result.all():
+            try:
+                access_token = await GoogleCalendarService.refresh_access_token(
+                    refresh_token
+                )
+                await CalendarWatchService.ensure_channel(user_id, access_token, db)
+                await db.commit()
+                renewed += 1
+            except HTTPException as exc:
+                await db.rollback()
+                LOGGER.warning(
+                    "Failed to renew calendar channel for %s: %s", user_id, exc.detail
+                )
+
+        return renewed
+
+    @staticmethod
+    async def run_renewal_loop() -> None:
+        # 앱 수명 동안 주기적으로 채널 갱신 (취소되면 종료)
+        from app.db.session import AsyncSessionLocal
+
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    renewed = await CalendarWatchService.renew_expiring_channels(db)
+                if renewed:
+                    LOGGER.info("Renewed %s calendar watch channels", renewed)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                LOGGER.exception("Calendar watch channel renewal failed")
+
+            await asyncio.sleep(CALENDAR_WATCH_RENEW_INTERVAL_SECONDS)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Tuple
+
+from app.variable import COMPUTE_INLINE_THRESHOLD, COMPUTE_POOL_WORKERS
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _timed_call(call: Callable[[], Any]) -> Tuple[Any, float]:
+    # 워커 프로세스에서 실행: 결과와 순수 실행 시간(초) 반환
+    started = time.perf_counter()
+    result = call()
+    return result, time.perf_counter() - started
+
+
+class ComputeExecutor:
+    """
+    스케줄 분석 CPU 작업 실행기
+
+    작업 크기가 COMPUTE_INLINE_THRESHOLD 이상이면 프로세스 풀에서 실행해 이벤트 루프를
+    막지 않고, 작은 작업은 프로세스 간 직렬화 비용이 더 크므로 바로 실행한다.
+    풀로 보내는 함수와 인자는 pickle 가능해야 한다.
+    """
+
+    MODE_INLINE = "inline"
+    MODE_POOL = "pool"
+    _pool: ProcessPoolExecutor | None = None
+    _in_flight = 0
+    _stats: Dict[str, Dict[str, float]] = {}
+
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        if cls._pool is None:
+            # 이벤트 루프/DB 커넥션 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+            cls._pool = ProcessPoolExecutor(
+                max_workers=COMPUTE_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return cls._pool
+
+    @classmethod
+    def shutdown(cls) -> None:
+        pool = cls._pool
+        cls._pool = None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    async def run(cls, func: Callable[..., Any], *args: Any, size: int = 0, **kwargs):
+        call = functools.partial(func, *args, **kwargs)
+
+        if COMPUTE_POOL_WORKERS <= 0 or size < COMPUTE_INLINE_THRESHOLD:
+            result, elapsed = _timed_call(call)
+            cls._record(cls.MODE_INLINE, elapsed, 0.0)
+            return result
+
+        loop = asyncio.get_running_loop()
+        cls._in_flight += 1
+        started = time.perf_counter()
+        try:
+            result, elapsed = await loop.run_in_executor(
+                cls._get_pool(), _timed_call, call
+            )
+        except BrokenProcessPool:
+            # 워커가 비정상 종료되면 풀을 버리고 이번 작업은 바로 실행
+            LOGGER.exception("Compute pool broken; running job inline")
+            cls.shutdown()
+            result, elapsed = _timed_call(call)
+            cls._record(cls.MODE_INLINE, elapsed, 0.0)
+            return result
+        finally:
+            cls._in_flight -= 1
+
+        waited = max(time.perf_counter() - started - elapsed, 0.0)
+        cls._record(cls.MODE_POOL, elapsed, waited)
+        return result
+
+    @classmethod
+    def _record(cls, mode: str, elapsed: float, waited: float) -> None:
+        stats = cls._stats.setdefault(
+            mode,
+            {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0, "wait_seconds": 0.0},
+        )
+        stats["count"] += 1
+        stats["total_seconds"] += elapsed
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+        stats["wait_seconds"] += waited
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        # 풀 크기 조정용 지표: 대기 중인 작업 수와 모드별 실행/대기 시간
+        workers = max(COMPUTE_POOL_WORKERS, 0)
+        return {
+            "workers": workers,
+            "inline_threshold": COMPUTE_INLINE_THRESHOLD,
+            "in_flight": cls._in_flight,
+            "queue_depth": max(cls._in_flight - workers, 0),
+            "jobs": {mode: dict(values) for mode, values in cls._stats.items()},
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        cls._stats = {}
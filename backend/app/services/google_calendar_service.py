@@ -1,13 +1,49 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import importlib.util
+import json
 import logging
-from typing import Any, Dict, Optional, Set
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from email import policy
+from email.parser import BytesParser
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+from urllib.parse import quote, urlsplit
 
 import httpx
 from fastapi import HTTPException
 
-from app.variable import GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET
+from app.utils.rate_limiter import RateLimiter
+from app.utils.single_flight import SingleFlight
+from app.utils.ttl_cache import TTLCache
+from app.variable import (
+    GOOGLE_CLIENT_ID,
+    GOOGLE_CLIENT_SECRET,
+    GOOGLE_HTTP2,
+    GOOGLE_HTTP_CONNECT_TIMEOUT,
+    GOOGLE_HTTP_KEEPALIVE_EXPIRY,
+    GOOGLE_HTTP_MAX_CONNECTIONS,
+    GOOGLE_HTTP_MAX_KEEPALIVE,
+    GOOGLE_HTTP_POOL_TIMEOUT,
+    GOOGLE_HTTP_READ_TIMEOUT,
+    GOOGLE_HTTP_WRITE_TIMEOUT,
+    GOOGLE_RATE_LIMIT_BURST,
+    GOOGLE_RATE_LIMIT_MAX_WAIT_SECONDS,
+    GOOGLE_RATE_LIMIT_PER_SECOND,
+    GOOGLE_RETRY_BASE_DELAY_SECONDS,
+    GOOGLE_RETRY_BUDGET_SECONDS,
+    GOOGLE_RETRY_MAX_ATTEMPTS,
+    GOOGLE_RETRY_MAX_DELAY_SECONDS,
+    GOOGLE_TOKEN_CACHE_SIZE,
+    GOOGLE_TOKEN_EXPIRY_MARGIN_SECONDS,
+    GOOGLE_USER_RATE_LIMIT_BURST,
+    GOOGLE_USER_RATE_LIMIT_PER_SECOND,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -15,9 +51,56 @@ LOGGER = logging.getLogger(__name__)
 class GoogleCalendarService:
     TOKEN_URL = "https://oauth2.googleapis.com/token"
     EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
-    _TIMEOUT = 10
+    FREE_BUSY_URL = "https://www.googleapis.com/calendar/v3/freeBusy"
+    WATCH_URL = f"{EVENTS_URL}/watch"
+    CHANNELS_STOP_URL = "https://www.googleapis.com/calendar/v3/channels/stop"
+    BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
+    # Google Calendar 배치 요청 하나에 담을 수 있는 최대 요청 수
+    BATCH_MAX_REQUESTS = 50
+    EVENT_FIELDS = (
+        "items("
+        "id,status,summary,description,location,start,end,htmlLink,"
+        "organizer,creator,attendees,updated"
+        "),nextPageToken"
+    )
+    _TIMEOUT = httpx.Timeout(
+        10,
+        connect=GOOGLE_HTTP_CONNECT_TIMEOUT,
+        read=GOOGLE_HTTP_READ_TIMEOUT,
+        write=GOOGLE_HTTP_WRITE_TIMEOUT,
+        pool=GOOGLE_HTTP_POOL_TIMEOUT,
+    )
+    _LIMITS = httpx.Limits(
+        max_connections=GOOGLE_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=GOOGLE_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=GOOGLE_HTTP_KEEPALIVE_EXPIRY,
+    )
+    _RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # 테스트에서 대기 없이 재시도를 확인할 수 있도록 분리
+    _sleep = staticmethod(asyncio.sleep)
     _client: httpx.AsyncClient | None = None
     _client_lock: asyncio.Lock | None = None
+    # refresh token 해시 -> access token (만료 expires_in - 여유 시간)
+    _token_cache = TTLCache(GOOGLE_TOKEN_CACHE_SIZE, ttl_seconds=3600)
+    _token_flights = SingleFlight()
+    # 프로젝트 전체 + 사용자(access token)별 호출 속도 제한
+    _rate_limiter = RateLimiter(
+        GOOGLE_RATE_LIMIT_PER_SECOND,
+        GOOGLE_RATE_LIMIT_BURST,
+        GOOGLE_USER_RATE_LIMIT_PER_SECOND,
+        GOOGLE_USER_RATE_LIMIT_BURST,
+        max_keys=GOOGLE_TOKEN_CACHE_SIZE,
+    )
+    # 연결 풀 대기 지표 (대기 시간은 초 단위 합계/최댓값)
+    _pool_stats: Dict[str, Any] = {
+        "requests": 0,
+        "in_flight": 0,
+        "acquired": 0,
+        "new_connections": 0,
+        "pool_timeouts": 0,
+        "pool_wait_total": 0.0,
+        "pool_wait_max": 0.0,
+    }
 
     @classmethod
     def _ensure_lock(cls) -> asyncio.Lock:
@@ -32,9 +115,37 @@ class GoogleCalendarService:
         if cls._client is None:
             async with cls._ensure_lock():
                 if cls._client is None:
-                    cls._client = httpx.AsyncClient(timeout=cls._TIMEOUT)
+                    http2 = cls._http2_enabled()
+                    if GOOGLE_HTTP2 and not http2:
+                        LOGGER.warning(
+                            "GOOGLE_HTTP2 is set but h2 is not installed; "
+                            "install httpx[http2] to enable HTTP/2"
+                        )
+                    cls._client = httpx.AsyncClient(
+                        timeout=cls._TIMEOUT, limits=cls._LIMITS, http2=http2
+                    )
         return cls._client
 
+    @staticmethod
+    def _http2_enabled() -> bool:
+        # HTTP/2는 선택 의존성(h2)이 설치되어 있을 때만 사용
+        return GOOGLE_HTTP2 and importlib.util.find_spec("h2") is not None
+
+    @classmethod
+    def rate_limit_stats(cls) -> Dict[str, Any]:
+        return cls._rate_limiter.stats()
+
+    @classmethod
+    def http_pool_stats(cls) -> Dict[str, Any]:
+        stats = dict(cls._pool_stats)
+        stats["pool_wait_avg"] = (
+            round(stats["pool_wait_total"] / stats["acquired"], 6)
+            if stats["acquired"]
+            else 0.0
+        )
+        stats["http2"] = cls._http2_enabled()
+        return stats
+
     @classmethod
     async def close_client(cls) -> None:
         client: httpx.AsyncClient | None = None
@@ -54,6 +165,37 @@ class GoogleCalendarService:
 
     @classmethod
     async def refresh_access_token(cls, refresh_token: str) -> str:
+        # 유효한 access token이 캐시에 있으면 재사용하고,
+        # 같은 사용자의 동시 갱신 요청은 진행 중인 요청 하나를 함께 기다림
+        key = cls._token_cache_key(refresh_token)
+        access_token = cls._token_cache.get(key)
+        if access_token is not None:
+            return access_token
+
+        return await cls._token_flights.do(
+            key, lambda: cls._request_access_token(refresh_token, key)
+        )
+
+    @classmethod
+    def invalidate_access_token(cls, refresh_token: str) -> None:
+        # Google이 access token을 거부(401)하면 캐시에서 제거
+        cls._token_cache.pop(cls._token_cache_key(refresh_token))
+
+    @classmethod
+    def token_cache_stats(cls) -> Dict[str, Any]:
+        return cls._token_cache.stats()
+
+    @classmethod
+    def token_refresh_stats(cls) -> Dict[str, Any]:
+        return cls._token_flights.stats()
+
+    @staticmethod
+    def _token_cache_key(refresh_token: str) -> str:
+        # refresh token 원문은 메모리 캐시 키로도 보관하지 않음
+        return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+    @classmethod
+    async def _request_access_token(cls, refresh_token: str, key: str) -> str:
         payload = {
             "client_id": GOOGLE_CLIENT_ID,
             "client_secret": GOOGLE_CLIENT_SECRET,
@@ -61,10 +203,10 @@ class GoogleCalendarService:
             "refresh_token": refresh_token,
         }
 
-        client = await cls._get_client()
-
         try:
-            response = await client.post(cls.TOKEN_URL, data=payload)
+            response = await cls._send(
+                "post", cls.TOKEN_URL, idempotent=True, data=payload
+            )
         except httpx.RequestError as exc:  # pragma: no cover - network guard
             LOGGER.exception("Failed to refresh Google access token: %s", exc)
             raise HTTPException(
@@ -73,6 +215,9 @@ class GoogleCalendarService:
 
         data: Dict[str, Any] = cls._safe_json(response)
         if response.is_success and data.get("access_token"):
+            ttl = int(data.get("expires_in") or 0) - GOOGLE_TOKEN_EXPIRY_MARGIN_SECONDS
+            if ttl > 0:
+                cls._token_cache.set(key, data["access_token"], ttl=ttl)
             return data["access_token"]
 
         error = data.get("error")
@@ -99,19 +244,21 @@ class GoogleCalendarService:
         max_results: int = 50,
         page_token: Optional[str] = None,
         time_zone: str = "Asia/Seoul",
+        fields: Optional[str] = None,
+        sync_token: Optional[str] = None,
+        order_by: Optional[str] = "startTime",
     ) -> Dict[str, Any]:
         params: Dict[str, str] = {
             "singleEvents": "true",
-            "orderBy": "startTime",
             "timeZone": time_zone,
             "maxResults": str(max_results),
-            "fields": (
-                "items("
-                "id,status,summary,description,location,start,end,htmlLink,"
-                "organizer,creator,attendees,updated"
-                "),nextPageToken"
-            ),
+            "fields": fields or cls.EVENT_FIELDS,
         }
+        # syncToken 요청에는 orderBy/timeMin/timeMax를 함께 보낼 수 없음
+        if order_by is not None:
+            params["orderBy"] = order_by
+        if sync_token is not None:
+            params["syncToken"] = sync_token
         if time_min is not None:
             params["timeMin"] = time_min
         if time_max is not None:
@@ -121,10 +268,10 @@ class GoogleCalendarService:
 
         headers = {"Authorization": f"Bearer {access_token}"}
 
-        client = await cls._get_client()
-
         try:
-            response = await client.get(cls.EVENTS_URL, headers=headers, params=params)
+            response = await cls._send(
+                "get", cls.EVENTS_URL, idempotent=True, headers=headers, params=params
+            )
         except httpx.RequestError as exc:  # pragma: no cover - network guard
             LOGGER.exception("Failed to fetch Google Calendar events: %s", exc)
             raise HTTPException(
@@ -133,10 +280,14 @@ class GoogleCalendarService:
 
         data: Dict[str, Any] = cls._safe_json(response)
         if response.is_success:
-            return {
+            result = {
                 "events": data.get("items", []),
                 "nextPageToken": data.get("nextPageToken"),
             }
+            # 마지막 페이지에만 포함되는 증분 동기화 토큰
+            if data.get("nextSyncToken"):
+                result["nextSyncToken"] = data["nextSyncToken"]
+            return result
 
         error_info = cls._extract_calendar_error(data)
         error_tokens = cls._extract_calendar_error_tokens(data)
@@ -148,7 +299,9 @@ class GoogleCalendarService:
 
         if response.status_code == 401:
             raise HTTPException(status_code=401, detail="google_reauth_required")
-        if response.status_code == 429:
+        if response.status_code == 410:
+            raise HTTPException(status_code=410, detail="sync_token_expired")
+        if response.status_code == 429 or cls._matches_rate_limited(error_tokens):
             raise HTTPException(status_code=429, detail="rate_limited")
 
         if cls._matches_scope_missing(error_tokens):
@@ -159,6 +312,368 @@ class GoogleCalendarService:
 
         raise HTTPException(status_code=500, detail="구글 캘린더 조회에 실패했습니다.")
 
+    @classmethod
+    async def iter_primary_events(
+        cls,
+        access_token: str,
+        *,
+        time_min: Optional[str],
+        time_max: Optional[str],
+        page_size: int = 250,
+        time_zone: str = "Asia/Seoul",
+        fields: Optional[str] = None,
+        sync_token: Optional[str] = None,
+        order_by: Optional[str] = "startTime",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # nextPageToken을 따라가며 페이지 단위로 반환
+        # (마지막 페이지에 nextSyncToken이 있으면 함께 포함)
+        page_token: Optional[str] = None
+        while True:
+            page = await cls.list_primary_events(
+                access_token,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=page_size,
+                page_token=page_token,
+                time_zone=time_zone,
+                fields=fields,
+                sync_token=sync_token,
+                order_by=order_by,
+            )
+            yield page
+
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                return
+
+    @classmethod
+    async def query_free_busy(
+        cls,
+        access_token: str,
+        *,
+        time_min: str,
+        time_max: str,
+        time_zone: str = "Asia/Seoul",
+        calendar_id: str = "primary",
+    ) -> List[Dict[str, str]]:
+        # 기간 내 바쁜 구간만 조회 (Google이 병합한 {"start", "end"} 목록)
+        payload = {
+            "timeMin": time_min,
+            "timeMax": time_max,
+            "timeZone": time_zone,
+            "items": [{"id": calendar_id}],
+        }
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        # freeBusy는 조회 전용이므로 POST여도 재시도 가능
+        try:
+            response = await cls._send(
+                "post",
+                cls.FREE_BUSY_URL,
+                idempotent=True,
+                headers=headers,
+                json=payload,
+            )
+        except httpx.RequestError as exc:  # pragma: no cover - network guard
+            LOGGER.exception("Failed to query Google Calendar free/busy: %s", exc)
+            raise HTTPException(
+                status_code=500, detail="구글 캘린더 바쁜 시간 조회에 실패했습니다."
+            ) from exc
+
+        data: Dict[str, Any] = cls._safe_json(response)
+        if response.is_success:
+            calendar = data.get("calendars", {}).get(calendar_id, {})
+            errors = calendar.get("errors")
+            if not errors:
+                return calendar.get("busy", [])
+
+            # 캘린더 단위 오류 (응답 자체는 200)
+            LOGGER.error("Google Calendar free/busy calendar error: %s", errors)
+            tokens = {
+                cls._normalize_error_token(entry.get("reason", ""))
+                for entry in errors
+                if isinstance(entry, dict)
+            }
+            if cls._matches_scope_missing(tokens) or "notfound" in tokens:
+                raise HTTPException(status_code=403, detail="insufficient_scope")
+            raise HTTPException(
+                status_code=500, detail="구글 캘린더 바쁜 시간 조회에 실패했습니다."
+            )
+
+        error_info = cls._extract_calendar_error(data)
+        error_tokens = cls._extract_calendar_error_tokens(data)
+        LOGGER.error(
+            "Google Calendar free/busy error (status=%s, error=%s)",
+            response.status_code,
+            error_info,
+        )
+
+        if response.status_code == 401:
+            raise HTTPException(status_code=401, detail="google_reauth_required")
+        if response.status_code == 429 or cls._matches_rate_limited(error_tokens):
+            raise HTTPException(status_code=429, detail="rate_limited")
+
+        if cls._matches_scope_missing(error_tokens):
+            raise HTTPException(status_code=400, detail="calendar_scope_missing")
+
+        if response.status_code == 403 or cls._matches_insufficient_scope(error_tokens):
+            raise HTTPException(status_code=403, detail="insufficient_scope")
+
+        raise HTTPException(
+            status_code=500, detail="구글 캘린더 바쁜 시간 조회에 실패했습니다."
+        )
+
+    @classmethod
+    async def watch_events(
+        cls,
+        access_token: str,
+        *,
+        channel_id: str,
+        address: str,
+        token: str,
+        ttl_seconds: int,
+    ) -> Dict[str, Any]:
+        # 기본 캘린더 변경 알림 채널 등록 (expiration은 epoch 밀리초)
+        payload = {
+            "id": channel_id,
+            "type": "web_hook",
+            "address": address,
+            "token": token,
+            "params": {"ttl": str(ttl_seconds)},
+        }
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        # 같은 채널 id로 다시 등록하면 실패하므로 재시도하지 않음
+        try:
+            response = await cls._send(
+                "post", cls.WATCH_URL, idempotent=False, headers=headers, json=payload
+            )
+        except httpx.RequestError as exc:  # pragma: no cover - network guard
+            LOGGER.exception("Failed to watch Google Calendar events: %s", exc)
+            raise HTTPException(
+                status_code=500,
+                detail="구글 캘린더 알림 채널 등록 요청에 실패했습니다.",
+            ) from exc
+
+        data: Dict[str, Any] = cls._safe_json(response)
+        if response.is_success:
+            return {
+                "id": data.get("id"),
+                "resourceId": data.get("resourceId"),
+                "expiration": int(data.get("expiration") or 0),
+            }
+
+        error_info = cls._extract_calendar_error(data)
+        error_tokens = cls._extract_calendar_error_tokens(data)
+        LOGGER.error(
+            "Google Calendar watch error (status=%s, error=%s)",
+            response.status_code,
+            error_info,
+        )
+
+        if response.status_code == 401:
+            raise HTTPException(status_code=401, detail="google_reauth_required")
+        if response.status_code == 429 or cls._matches_rate_limited(error_tokens):
+            raise HTTPException(status_code=429, detail="rate_limited")
+
+        if cls._matches_scope_missing(error_tokens):
+            raise HTTPException(status_code=400, detail="calendar_scope_missing")
+
+        if response.status_code == 403 or cls._matches_insufficient_scope(error_tokens):
+            raise HTTPException(status_code=403, detail="insufficient_scope")
+
+        raise HTTPException(
+            status_code=500, detail="구글 캘린더 알림 채널 등록에 실패했습니다."
+        )
+
+    @classmethod
+    async def stop_channel(
+        cls,
+        access_token: str,
+        *,
+        channel_id: str,
+        resource_id: str,
+    ) -> None:
+        # 더 이상 쓰지 않는 알림 채널 해제 (이미 만료된 채널은 404)
+        payload = {"id": channel_id, "resourceId": resource_id}
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        try:
+            response = await cls._send(
+                "post",
+                cls.CHANNELS_STOP_URL,
+                idempotent=True,
+                headers=headers,
+                json=payload,
+            )
+        except httpx.RequestError as exc:  # pragma: no cover - network guard
+            LOGGER.exception("Failed to stop Google Calendar channel: %s", exc)
+            raise HTTPException(
+                status_code=500,
+                detail="구글 캘린더 알림 채널 해제 요청에 실패했습니다.",
+            ) from exc
+
+        if response.is_success or response.status_code == 404:
+            return
+
+        LOGGER.error(
+            "Google Calendar channel stop error (status=%s, error=%s)",
+            response.status_code,
+            cls._extract_calendar_error(cls._safe_json(response)),
+        )
+
+        if response.status_code == 401:
+            raise HTTPException(status_code=401, detail="google_reauth_required")
+
+        raise HTTPException(
+            status_code=500, detail="구글 캘린더 알림 채널 해제에 실패했습니다."
+        )
+
+    @classmethod
+    async def request(
+        cls, method: str, url: str, *, idempotent: bool = False, **kwargs
+    ) -> httpx.Response:
+        # 다른 Google API(OAuth 등)도 공용 클라이언트로 전송
+        # (연결 풀 지표와 재시도는 적용하되 Calendar 호출 속도 제한은 거치지 않음:
+        #  로그인 요청이 캘린더 호출 폭주에 밀려 rate_limited로 실패하지 않도록)
+        return await cls._send(
+            method, url, idempotent=idempotent, rate_limited=False, **kwargs
+        )
+
+    @classmethod
+    async def _send(
+        cls,
+        method: str,
+        url: str,
+        *,
+        idempotent: bool,
+        cost: int = 1,
+        rate_limited: bool = True,
+        **kwargs,
+    ) -> Any:
+        """
+        Google API 요청 전송
+
+        idempotent 요청은 429/5xx/사용량 초과 403과 네트워크 오류를 지터를 넣은
+        지수 백오프로 재시도한다. Retry-After가 있으면 그 시간을 따르고, 요청 하나의
+        재시도 대기 합계는 GOOGLE_RETRY_BUDGET_SECONDS를 넘지 않는다.
+        매 시도 전에 호출 속도 제한 토큰 cost개(batch는 포함된 요청 수)를 기다리며,
+        제한 시간 안에 얻지 못하면 Google에 보내지 않고 429(rate_limited)로 실패한다.
+        rate_limited=False면 호출 속도 제한 없이 바로 전송한다 (Calendar 외 API용).
+        """
+        client = await cls._get_client()
+        send = getattr(client, method)
+        max_attempts = GOOGLE_RETRY_MAX_ATTEMPTS if idempotent else 1
+        budget = GOOGLE_RETRY_BUDGET_SECONDS
+        rate_key = cls._rate_limit_key(kwargs.get("headers"))
+
+        attempt = 0
+        while True:
+            if rate_limited and not await cls._rate_limiter.acquire(
+                rate_key, GOOGLE_RATE_LIMIT_MAX_WAIT_SECONDS, cost
+            ):
+                LOGGER.warning("Dropped Google API %s %s (rate limited)", method, url)
+                raise HTTPException(status_code=429, detail="rate_limited")
+
+            response = None
+            error: Optional[httpx.RequestError] = None
+            try:
+                response = await cls._send_traced(send, url, kwargs)
+            except httpx.RequestError as exc:
+                error = exc
+
+            if response is not None and not cls._is_retryable(response):
+                return response
+
+            attempt += 1
+            delay = cls._retry_delay(attempt, response)
+            if attempt >= max_attempts or delay > budget:
+                if error is not None:
+                    raise error
+                return response
+
+            budget -= delay
+            LOGGER.warning(
+                "Retrying Google API %s %s in %.2fs (attempt %s, cause=%s)",
+                method.upper(),
+                url,
+                delay,
+                attempt,
+                error if error is not None else response.status_code,
+            )
+            await cls._sleep(delay)
+
+    @classmethod
+    def _rate_limit_key(cls, headers: Optional[Dict[str, str]]) -> Optional[str]:
+        # 사용자별 버킷은 access token 해시로 구분 (토큰 갱신 요청은 전체 버킷만)
+        authorization = (headers or {}).get("Authorization")
+        return cls._token_cache_key(authorization) if authorization else None
+
+    @classmethod
+    async def _send_traced(cls, send: Any, url: str, kwargs: Dict[str, Any]) -> Any:
+        # httpcore trace 이벤트로 연결 풀에서 연결을 얻기까지 기다린 시간 측정:
+        # 요청 시작부터 첫 이벤트(새 연결 생성 또는 기존 연결로 전송)까지
+        stats = cls._pool_stats
+        started = time.perf_counter()
+        acquired = False
+
+        async def _trace(event: str, info: Dict[str, Any]) -> None:
+            nonlocal acquired
+            if not acquired:
+                acquired = True
+                stats["acquired"] += 1
+                wait = time.perf_counter() - started
+                stats["pool_wait_total"] += wait
+                stats["pool_wait_max"] = max(stats["pool_wait_max"], wait)
+            if event == "connection.connect_tcp.started":
+                stats["new_connections"] += 1
+
+        extensions = {**kwargs.get("extensions", {}), "trace": _trace}
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        try:
+            return await send(url, **{**kwargs, "extensions": extensions})
+        except httpx.PoolTimeout:
+            stats["pool_timeouts"] += 1
+            raise
+        finally:
+            stats["in_flight"] -= 1
+
+    @classmethod
+    def _is_retryable(cls, response: Any) -> bool:
+        if response.status_code in cls._RETRYABLE_STATUSES:
+            return True
+        # Google은 사용량 초과를 403으로도 응답
+        return response.status_code == 403 and cls._matches_rate_limited(
+            cls._extract_calendar_error_tokens(cls._safe_json(response))
+        )
+
+    @staticmethod
+    def _retry_delay(attempt: int, response: Any) -> float:
+        # Retry-After(초 또는 HTTP 날짜)가 있으면 우선, 없으면 full jitter 백오프
+        headers = getattr(response, "headers", None) or {}
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                except (TypeError, ValueError):
+                    retry_at = None
+                if retry_at is not None:
+                    if retry_at.tzinfo is None:
+                        retry_at = retry_at.replace(tzinfo=timezone.utc)
+                    return max(
+                        0.0, (retry_at - datetime.now(timezone.utc)).total_seconds()
+                    )
+
+        ceiling = min(
+            GOOGLE_RETRY_MAX_DELAY_SECONDS,
+            GOOGLE_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1),
+        )
+        return random.uniform(0, ceiling)
+
     @staticmethod
     def _safe_json(response: Any) -> Dict[str, Any]:
         try:
@@ -220,6 +735,15 @@ class GoogleCalendarService:
         }
         return any(token in scope_missing_errors for token in tokens)
 
+    @classmethod
+    def _matches_rate_limited(cls, tokens: Set[str]) -> bool:
+        rate_limited_errors = {
+            "ratelimitexceeded",
+            "userratelimitexceeded",
+            "quotaexceeded",
+        }
+        return any(token in rate_limited_errors for token in tokens)
+
     @classmethod
     def _matches_insufficient_scope(cls, tokens: Set[str]) -> bool:
         insufficient_scope_errors = {
@@ -239,11 +763,12 @@ class GoogleCalendarService:
             "Content-Type": "application/json",
         }
 
-        client = await cls._get_client()
-
+        # 재시도하면 이벤트가 중복 생성될 수 있으므로 한 번만 요청
         try:
-            response = await client.post(
+            response = await cls._send(
+                "post",
                 cls.EVENTS_URL,
+                idempotent=False,
                 headers=headers,
                 json=event_data,
             )
@@ -272,7 +797,7 @@ class GoogleCalendarService:
 
         if response.status_code == 401:
             raise HTTPException(status_code=401, detail="google_reauth_required")
-        if response.status_code == 429:
+        if response.status_code == 429 or cls._matches_rate_limited(error_tokens):
             raise HTTPException(status_code=429, detail="rate_limited")
 
         if cls._matches_scope_missing(error_tokens):
@@ -296,10 +821,8 @@ class GoogleCalendarService:
         }
         url = f"{cls.EVENTS_URL}/{event_id}"
 
-        client = await cls._get_client()
-
         try:
-            response = await client.delete(url, headers=headers)
+            response = await cls._send("delete", url, idempotent=True, headers=headers)
         except httpx.RequestError as exc:  # pragma: no cover - network guard
             LOGGER.exception("Failed to delete Google Calendar event: %s", exc)
             raise HTTPException(
@@ -322,7 +845,7 @@ class GoogleCalendarService:
             raise HTTPException(status_code=401, detail="google_reauth_required")
         if response.status_code == 404:
             raise HTTPException(status_code=404, detail="event_not_found")
-        if response.status_code == 429:
+        if response.status_code == 429 or cls._matches_rate_limited(error_tokens):
             raise HTTPException(status_code=429, detail="rate_limited")
 
         if cls._matches_scope_missing(error_tokens):
@@ -334,3 +857,222 @@ class GoogleCalendarService:
         raise HTTPException(
             status_code=500, detail="구글 캘린더 이벤트 삭제에 실패했습니다."
         )
+
+    @classmethod
+    async def batch_create_events(
+        cls,
+        access_token: str,
+        events: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 이벤트를 배치 요청(최대 50개씩)으로 생성하고 입력 순서대로 결과 반환
+
+        일부 이벤트가 실패해도 나머지 결과는 그대로 돌려주며, 실패한 항목에는
+        error 코드가 담긴다. 이벤트가 중복 생성될 수 있으므로 재시도하지 않는다.
+        """
+        path = urlsplit(cls.EVENTS_URL).path
+        responses = await cls._send_batch(
+            access_token,
+            [("POST", path, event) for event in events],
+            idempotent=False,
+        )
+
+        results: List[Dict[str, Any]] = []
+        for index, (status_code, data) in enumerate(responses):
+            if 200 <= status_code < 300:
+                event = {
+                    "id": data.get("id"),
+                    "summary": data.get("summary"),
+                    "htmlLink": data.get("htmlLink"),
+                    "status": data.get("status"),
+                }
+                results.append(
+                    {"index": index, "success": True, "id": event["id"], "event": event}
+                )
+            else:
+                results.append(
+                    {
+                        "index": index,
+                        "success": False,
+                        "error": cls._batch_item_error(status_code, data),
+                    }
+                )
+        return results
+
+    @classmethod
+    async def batch_delete_events(
+        cls,
+        access_token: str,
+        event_ids: List[str],
+    ) -> List[Dict[str, Any]]:
+        # 여러 이벤트를 배치 요청으로 삭제하고 입력 순서대로 결과 반환
+        path = urlsplit(cls.EVENTS_URL).path
+        responses = await cls._send_batch(
+            access_token,
+            [
+                ("DELETE", f"{path}/{quote(event_id, safe='')}", None)
+                for event_id in event_ids
+            ],
+            idempotent=True,
+        )
+
+        results: List[Dict[str, Any]] = []
+        for index, (event_id, (status_code, data)) in enumerate(
+            zip(event_ids, responses)
+        ):
+            item: Dict[str, Any] = {
+                "index": index,
+                "success": 200 <= status_code < 300,
+                "id": event_id,
+            }
+            if not item["success"]:
+                item["error"] = cls._batch_item_error(status_code, data)
+            results.append(item)
+        return results
+
+    @classmethod
+    async def _send_batch(
+        cls,
+        access_token: str,
+        operations: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+        *,
+        idempotent: bool,
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        # 작업을 BATCH_MAX_REQUESTS개씩 multipart/mixed 요청으로 보내고
+        # 작업 순서대로 (상태 코드, 응답 본문) 반환
+        results: List[Tuple[int, Dict[str, Any]]] = []
+        for start in range(0, len(operations), cls.BATCH_MAX_REQUESTS):
+            chunk = operations[start : start + cls.BATCH_MAX_REQUESTS]
+            boundary = f"batch_{uuid.uuid4().hex}"
+            headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": f"multipart/mixed; boundary={boundary}",
+            }
+
+            try:
+                response = await cls._send(
+                    "post",
+                    cls.BATCH_URL,
+                    idempotent=idempotent,
+                    cost=len(chunk),
+                    headers=headers,
+                    content=cls._encode_batch(chunk, boundary),
+                )
+            except httpx.RequestError as exc:
+                LOGGER.exception("Failed to send Google Calendar batch: %s", exc)
+                raise HTTPException(
+                    status_code=500,
+                    detail="구글 캘린더 일괄 처리 요청에 실패했습니다.",
+                ) from exc
+
+            if not response.is_success:
+                data: Dict[str, Any] = cls._safe_json(response)
+                error_tokens = cls._extract_calendar_error_tokens(data)
+                LOGGER.error(
+                    "Google Calendar batch error (status=%s, error=%s)",
+                    response.status_code,
+                    cls._extract_calendar_error(data),
+                )
+
+                if response.status_code == 401:
+                    raise HTTPException(
+                        status_code=401, detail="google_reauth_required"
+                    )
+                if response.status_code == 429 or cls._matches_rate_limited(
+                    error_tokens
+                ):
+                    raise HTTPException(status_code=429, detail="rate_limited")
+                if cls._matches_scope_missing(error_tokens):
+                    raise HTTPException(
+                        status_code=400, detail="calendar_scope_missing"
+                    )
+                if response.status_code == 403 or cls._matches_insufficient_scope(
+                    error_tokens
+                ):
+                    raise HTTPException(status_code=403, detail="insufficient_scope")
+                raise HTTPException(
+                    status_code=500, detail="구글 캘린더 일괄 처리에 실패했습니다."
+                )
+
+            results.extend(cls._decode_batch(response, len(chunk)))
+        return results
+
+    @staticmethod
+    def _encode_batch(
+        operations: List[Tuple[str, str, Optional[Dict[str, Any]]]], boundary: str
+    ) -> bytes:
+        parts: List[str] = []
+        for index, (method, path, body) in enumerate(operations):
+            lines = [
+                f"--{boundary}",
+                "Content-Type: application/http",
+                f"Content-ID: <item-{index}>",
+                "",
+                f"{method} {path} HTTP/1.1",
+            ]
+            if body is None:
+                lines += ["", ""]
+            else:
+                lines += [
+                    "Content-Type: application/json; charset=UTF-8",
+                    "",
+                    json.dumps(body),
+                ]
+            parts.append("\r\n".join(lines))
+        parts.append(f"--{boundary}--\r\n")
+        return "\r\n".join(parts).encode("utf-8")
+
+    @classmethod
+    def _decode_batch(
+        cls, response: Any, count: int
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        # Content-ID(<response-item-N>)로 요청 순서를 맞추고, 응답에 없는 항목은 실패(0)
+        results: List[Tuple[int, Dict[str, Any]]] = [(0, {})] * count
+        content_type = response.headers.get("Content-Type", "")
+        message = BytesParser(policy=policy.HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + response.content
+        )
+        if not message.is_multipart():
+            LOGGER.error("Unexpected Google Calendar batch response: %s", content_type)
+            return results
+
+        for position, part in enumerate(message.iter_parts()):
+            content_id = (part.get("Content-ID") or "").strip("<> ")
+            _, _, suffix = content_id.rpartition("item-")
+            index = int(suffix) if suffix.isdigit() else position
+            if not 0 <= index < count:
+                continue
+
+            payload = part.get_payload(decode=True) or b""
+            head, _, body = (
+                payload.decode("utf-8", "replace")
+                .replace("\r\n", "\n")
+                .partition("\n\n")
+            )
+            status_line = head.split("\n", 1)[0].split()
+            try:
+                status_code = int(status_line[1])
+            except (IndexError, ValueError):
+                continue
+            try:
+                data = json.loads(body) if body.strip() else {}
+            except ValueError:
+                data = {}
+            results[index] = (status_code, data if isinstance(data, dict) else {})
+        return results
+
+    @classmethod
+    def _batch_item_error(cls, status_code: int, data: Dict[str, Any]) -> str:
+        # 배치 항목 하나의 실패를 단건 API와 같은 오류 코드로 변환
+        error_tokens = cls._extract_calendar_error_tokens(data)
+        if status_code == 401:
+            return "google_reauth_required"
+        if status_code in (404, 410):
+            return "event_not_found"
+        if status_code == 429 or cls._matches_rate_limited(error_tokens):
+            return "rate_limited"
+        if cls._matches_scope_missing(error_tokens):
+            return "calendar_scope_missing"
+        if status_code == 403 or cls._matches_insufficient_scope(error_tokens):
+            return "insufficient_scope"
+        return "failed"
@@ -1,6 +1,7 @@
 import urllib.parse
-import requests
+import httpx
 from fastapi import HTTPException
+from app.services.google_calendar_service import GoogleCalendarService
 from app.variable import (
     GOOGLE_CLIENT_ID,
     GOOGLE_CLIENT_SECRET,
@@ -14,7 +15,9 @@ class GoogleOAuthService:
     def generate_auth_url(force_prompt_consent: bool = False):
         # Google OAuth 인증 URL 생성
         scope = (
-            "openid email profile " "https://www.googleapis.com/auth/calendar.events"
+            "openid email profile "
+            "https://www.googleapis.com/auth/calendar.events "
+            "https://www.googleapis.com/auth/calendar.freebusy"
         )
         params = {
             "client_id": GOOGLE_CLIENT_ID,
@@ -31,8 +34,9 @@ class GoogleOAuthService:
         )
 
     @staticmethod
-    def exchange_code_for_tokens(code: str):
+    async def exchange_code_for_tokens(code: str):
         # 인증 코드를 액세스 토큰과 리프레시 토큰으로 교환
+        # (Google API 공용 클라이언트로 전송, 인증 코드는 한 번만 쓸 수 있어 재시도 없음)
         token_data = {
             "client_id": GOOGLE_CLIENT_ID,
             "client_secret": GOOGLE_CLIENT_SECRET,
@@ -42,8 +46,8 @@ class GoogleOAuthService:
         }
 
         try:
-            token_response = requests.post(
-                "https://oauth2.googleapis.com/token", data=token_data
+            token_response = await GoogleCalendarService.request(
+                "post", GoogleCalendarService.TOKEN_URL, data=token_data
             )
             token_response.raise_for_status()
             tokens = token_response.json()
@@ -54,17 +58,19 @@ class GoogleOAuthService:
             if not access_token:
                 raise HTTPException(status_code=400, detail="토큰을 받을 수 없습니다.")
             return {"access_token": access_token, "refresh_token": refresh_token}
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise HTTPException(
                 status_code=500, detail=f"구글 토큰 요청 실패: {str(e)}"
             )
 
     @staticmethod
-    def get_user_info(access_token: str):
-        # 액세스 토큰으로 사용자 정보 조회
+    async def get_user_info(access_token: str):
+        # 액세스 토큰으로 사용자 정보 조회 (토큰은 URL 대신 Authorization 헤더로 전달)
         try:
-            user_info_response = requests.get(
-                f"https://www.googleapis.com/oauth2/v2/userinfo?access_token={access_token}"
+            user_info_response = await GoogleCalendarService.request(
+                "get",
+                "https://www.googleapis.com/oauth2/v2/userinfo",
+                headers={"Authorization": f"Bearer {access_token}"},
             )
             user_info_response.raise_for_status()
             user_info = user_info_response.json()
@@ -79,7 +85,7 @@ class GoogleOAuthService:
                 )
 
             return {"google_id": google_id, "email": email, "name": name}
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise HTTPException(
                 status_code=500, detail=f"구글 사용자 정보 요청 실패: {str(e)}"
             )
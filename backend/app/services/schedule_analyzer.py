@@ -1,16 +1,56 @@
-from datetime import date, datetime, time, timedelta
-from typing import List, Dict, Set, Optional, Any
+import asyncio
+import heapq
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Iterable, Iterator, Optional, Any, Tuple
 from collections import defaultdict
+from zoneinfo import ZoneInfo
+
+try:  # 대규모 약속용 벡터화 엔진 (선택 의존성)
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 미설치 환경
+    np = None
+
+from fastapi import HTTPException
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from app.models.user_model import User
+from app.services.calendar_sync_service import CalendarSyncService
+from app.services.compute_executor import ComputeExecutor
 from app.services.google_calendar_service import GoogleCalendarService
+from app.utils.concurrency import run_bounded
+from app.utils.single_flight import SingleFlight
+from app.utils.time_interval import (
+    MINUTES_PER_DAY,
+    TimeInterval,
+    epoch_minutes_to_local,
+    epoch_minutes_to_rfc3339,
+    format_hhmm,
+    get_zone,
+    local_to_epoch_minutes,
+    parse_hhmm,
+    to_epoch_minutes,
+)
+from app.variable import SYNC_APPOINTMENT_TIMEOUT_SECONDS, SYNC_CONCURRENCY_LIMIT
+
+LOGGER = logging.getLogger(__name__)
 
 
 class ScheduleAnalyzer:
     DEFAULT_WORK_START = "00:00"
     DEFAULT_WORK_END = "23:59"
+    DEFAULT_TIMEZONE = "Asia/Seoul"
     MIN_SLOT_DURATION_MINUTES = 30
-    GRID_INTERVAL_MINUTES = 15
+    ENGINE_SWEEP = "sweep"
+    ENGINE_NUMPY = "numpy"
+    # 가용 시간 계산에 필요한 이벤트 필드만 요청
+    BUSY_EVENT_FIELDS = "items(start,end,transparency),nextPageToken"
+    # 이 일수 이내로 떨어진 후보 날짜는 한 번에 조회
+    FETCH_MERGE_GAP_DAYS = 7
+    # (사용자, 후보 날짜 전체, 근무 시간, 타임존)이 같은 동시 바쁜 구간 조회 합치기
+    _flights = SingleFlight()
 
     @staticmethod
     async def calculate_available_slots(
@@ -18,381 +58,704 @@ class ScheduleAnalyzer:
         candidate_dates: List[date],
         work_hours_start: str = DEFAULT_WORK_START,
         work_hours_end: str = DEFAULT_WORK_END,
-        timezone: str = "Asia/Seoul",
+        timezone: str = DEFAULT_TIMEZONE,
+        db: Optional[AsyncSession] = None,
     ) -> Optional[dict]:
-        if not candidate_dates:
-            return None
+        results = await ScheduleAnalyzer.calculate_available_slots_batch(
+            user,
+            {None: candidate_dates},
+            work_hours_start,
+            work_hours_end,
+            timezone,
+            db,
+        )
+        return results[None]
 
-        try:
-            # Access token 갱신
-            access_token = await GoogleCalendarService.refresh_access_token(
-                user.google_refresh_token
+    @staticmethod
+    async def calculate_available_slots_batch(
+        user: User,
+        candidate_dates_by_key: Dict[Any, List[date]],
+        work_hours_start: str = DEFAULT_WORK_START,
+        work_hours_end: str = DEFAULT_WORK_END,
+        timezone: str = DEFAULT_TIMEZONE,
+        db: Optional[AsyncSession] = None,
+    ) -> Dict[Any, Optional[dict]]:
+        """
+        여러 약속(key별 후보 날짜)의 가용시간을 한 번에 계산
+
+        토큰 갱신과 바쁜 구간 조회는 전체 후보 날짜에 대해 한 번만 수행하고,
+        각 약속의 가용시간은 같은 타임라인에서 계산한다. 계산할 수 없는 key는 None.
+        같은 사용자/후보 날짜 전체/조건의 조회가 진행 중이면 그 바쁜 구간을 함께
+        받아 쓰고, key별 결과는 호출자마다 따로 만든다.
+        """
+        results: Dict[Any, Optional[dict]] = {
+            key: None for key in candidate_dates_by_key
+        }
+        candidate_dates_by_key = {
+            key: dates for key, dates in candidate_dates_by_key.items() if dates
+        }
+        if not candidate_dates_by_key:
+            return results
+
+        all_dates = tuple(
+            sorted(
+                {
+                    candidate_date
+                    for dates in candidate_dates_by_key.values()
+                    for candidate_date in dates
+                }
             )
+        )
+        # 공유 조회에는 호출자의 세션 대신 엔진만 넘김 (세션은 조회 안에서 따로 열기)
+        bind = db.bind if db is not None else None
+        user_id = user.user_id
+        refresh_token = user.google_refresh_token
 
-            # 시간 범위 설정
-            time_min = (
-                datetime.combine(min(candidate_dates), time.min).isoformat() + "Z"
+        try:
+            zone = get_zone(timezone)
+            busy = await ScheduleAnalyzer._flights.do(
+                (user_id, all_dates, work_hours_start, work_hours_end, timezone),
+                lambda: ScheduleAnalyzer._load_shared_busy_timeline(
+                    user_id, refresh_token, all_dates, timezone, bind
+                ),
             )
-            time_max = (
-                datetime.combine(max(candidate_dates), time.max).isoformat() + "Z"
+        except HTTPException as exc:
+            # 캐시된 access token이 거부되면 다음 호출에서 새로 발급
+            if exc.status_code == 401:
+                GoogleCalendarService.invalidate_access_token(refresh_token)
+            return results
+        except Exception:
+            return results
+
+        async def _build(key: Any) -> List[dict]:
+            # 약속의 날짜 범위와 겹치는 바쁜 구간만 넘겨 계산
+            # (큰 작업은 프로세스 풀에서 실행)
+            dates = candidate_dates_by_key[key]
+            key_busy = ScheduleAnalyzer._overlapping(
+                busy,
+                TimeInterval(
+                    local_to_epoch_minutes(min(dates), 0, zone),
+                    local_to_epoch_minutes(max(dates) + timedelta(days=1), 0, zone),
+                ),
             )
-
-            # Google Calendar 이벤트 조회
-            calendar_response = await GoogleCalendarService.list_primary_events(
-                access_token=access_token,
-                time_min=time_min,
-                time_max=time_max,
-                max_results=250,
-                time_zone=timezone,
+            return await ComputeExecutor.run(
+                ScheduleAnalyzer._build_slots,
+                key_busy,
+                dates,
+                work_hours_start,
+                work_hours_end,
+                timezone,
+                size=len(key_busy) + len(dates),
             )
 
-            events = calendar_response.get("events", [])
+        # 약속별로 동시에 계산 (하나가 느리거나 실패해도 나머지는 계속)
+        outcomes = await run_bounded(
+            candidate_dates_by_key,
+            _build,
+            limit=SYNC_CONCURRENCY_LIMIT,
+            timeout=SYNC_APPOINTMENT_TIMEOUT_SECONDS,
+        )
 
-            # 날짜별 이벤트 그룹화
-            events_by_date = ScheduleAnalyzer._group_events_by_date(
-                events, candidate_dates, timezone
-            )
+        calculated_at = datetime.now().isoformat()
+        for key, outcome in outcomes.items():
+            if outcome.ok:
+                results[key] = {
+                    "timezone": timezone,
+                    "slots": outcome.value,
+                    "calculated_at": calculated_at,
+                }
 
-            # 각 날짜별 가용 시간 계산
-            work_start = ScheduleAnalyzer._parse_time(work_hours_start)
-            work_end = ScheduleAnalyzer._parse_time(work_hours_end)
-
-            slots = []
-            for candidate_date in sorted(candidate_dates):
-                available_times = ScheduleAnalyzer._calculate_available_times_for_date(
-                    candidate_date,
-                    events_by_date.get(candidate_date, []),
-                    work_start,
-                    work_end,
+        return results
+
+    @staticmethod
+    def coalescing_stats() -> Dict[str, Any]:
+        return ScheduleAnalyzer._flights.stats()
+
+    @staticmethod
+    async def _load_shared_busy_timeline(
+        user_id: str,
+        refresh_token: str,
+        candidate_dates: Tuple[date, ...],
+        timezone: str,
+        bind: Optional[AsyncEngine],
+    ) -> List[TimeInterval]:
+        # 토큰 갱신 후 모든 후보 날짜를 덮는 바쁜 구간 조회 (동시 호출자가 함께 사용)
+        access_token = await GoogleCalendarService.refresh_access_token(refresh_token)
+
+        # 모든 후보 날짜를 덮는 조회 구간 (멀리 떨어진 날짜 묶음은 따로)
+        windows = ScheduleAnalyzer._fetch_windows(candidate_dates, get_zone(timezone))
+        return await ScheduleAnalyzer._load_busy_timeline(
+            user_id, access_token, windows, timezone, bind
+        )
+
+    @staticmethod
+    def _fetch_windows(
+        candidate_dates: Iterable[date], zone: ZoneInfo
+    ) -> List[TimeInterval]:
+        # 현지 자정 기준 날짜 구간을 만들고 FETCH_MERGE_GAP_DAYS 이내 간격은 하나로 묶음
+        windows: List[TimeInterval] = []
+        last_date: Optional[date] = None
+        for candidate_date in sorted(set(candidate_dates)):
+            end = local_to_epoch_minutes(candidate_date + timedelta(days=1), 0, zone)
+            if (
+                last_date is not None
+                and (candidate_date - last_date).days
+                <= ScheduleAnalyzer.FETCH_MERGE_GAP_DAYS
+            ):
+                windows[-1] = TimeInterval(windows[-1].start, end)
+            else:
+                windows.append(
+                    TimeInterval(local_to_epoch_minutes(candidate_date, 0, zone), end)
                 )
+            last_date = candidate_date
+        return windows
 
-                if available_times:
-                    slots.append(
-                        {
-                            "date": candidate_date.isoformat(),
-                            "available_times": available_times,
-                        }
+    @staticmethod
+    async def _load_busy_timeline(
+        user_id: str,
+        access_token: str,
+        windows: List[TimeInterval],
+        timezone: str,
+        bind: Optional[AsyncEngine],
+    ) -> List[TimeInterval]:
+        # 바쁜 구간을 epoch 분 타임라인으로 조회
+        # (DB 엔진이 있으면 별도 세션으로 증분 동기화 저장소, 실패 시 Google에서 직접 조회)
+        if bind is not None:
+            try:
+                async with AsyncSession(bind=bind, expire_on_commit=False) as session:
+                    busy = await CalendarSyncService.get_busy_timeline(
+                        user_id,
+                        access_token,
+                        TimeInterval(windows[0].start, windows[-1].end),
+                        timezone,
+                        session,
                     )
+                    await session.commit()
+                    return busy
+            except HTTPException as exc:
+                if exc.status_code == 401:
+                    raise
+            except SQLAlchemyError:
+                # 저장소 장애는 호출자의 트랜잭션과 무관하게 직접 조회로 대체
+                LOGGER.exception("Calendar sync store failed for user %s", user_id)
+
+        # 날짜 묶음별로 동시에 조회한 뒤 하나의 타임라인으로 병합
+        timelines = await asyncio.gather(
+            *(
+                ScheduleAnalyzer._fetch_busy_timeline(
+                    access_token,
+                    epoch_minutes_to_rfc3339(window.start),
+                    epoch_minutes_to_rfc3339(window.end),
+                    timezone,
+                )
+                for window in windows
+            )
+        )
+        if len(timelines) == 1:
+            return timelines[0]
+        return ScheduleAnalyzer._merge_time_periods(
+            [interval for timeline in timelines for interval in timeline]
+        )
 
-            return {
-                "timezone": timezone,
-                "slots": slots,
-                "calculated_at": datetime.now().isoformat(),
-            }
+    @staticmethod
+    async def _fetch_busy_timeline(
+        access_token: str, time_min: str, time_max: str, timezone: str
+    ) -> List[TimeInterval]:
+        zone = get_zone(timezone)
 
-        except Exception:
-            return None
+        # freeBusy로 병합된 바쁜 구간만 조회
+        try:
+            busy_periods = await GoogleCalendarService.query_free_busy(
+                access_token,
+                time_min=time_min,
+                time_max=time_max,
+                time_zone=timezone,
+            )
+            return ScheduleAnalyzer._busy_timeline(
+                (
+                    {
+                        "start": {"dateTime": period["start"]},
+                        "end": {"dateTime": period["end"]},
+                    }
+                    for period in busy_periods
+                ),
+                zone,
+            )
+        except HTTPException as exc:
+            if exc.status_code not in (400, 403):
+                raise
+
+        # freeBusy 권한 동의 전 사용자는 이벤트 목록 조회로 대체
+        # 페이지가 도착할 때마다 병합하므로 메모리는 페이지 크기 + 병합 구간 수로 제한
+        busy: List[TimeInterval] = []
+        async for page in GoogleCalendarService.iter_primary_events(
+            access_token,
+            time_min=time_min,
+            time_max=time_max,
+            time_zone=timezone,
+            fields=ScheduleAnalyzer.BUSY_EVENT_FIELDS,
+        ):
+            busy = ScheduleAnalyzer._busy_timeline(page["events"], zone, busy)
+
+        return busy
 
     @staticmethod
-    def _group_events_by_date(
-        events: List[Dict[str, Any]], candidate_dates: List[date], timezone: str
-    ) -> Dict[date, List[Dict[str, Any]]]:
-        events_by_date = defaultdict(list)
-
-        for event in events:
-            # All-day 이벤트 처리
-            if "date" in event.get("start", {}):
-                start_date_str = event["start"]["date"]
-                end_date_str = event["end"]["date"]
-                start_date = datetime.fromisoformat(start_date_str).date()
-                end_date = datetime.fromisoformat(end_date_str).date()
-
-                current = start_date
-                while current < end_date:
-                    if current in candidate_dates:
-                        events_by_date[current].append(
-                            {"start": "00:00", "end": "23:59", "all_day": True}
-                        )
-                    current += timedelta(days=1)
+    def _overlapping(
+        busy: List[TimeInterval], window: TimeInterval
+    ) -> List[TimeInterval]:
+        # 병합된(시작/끝 모두 정렬된) 구간 중 window와 겹치는 부분 목록
+        first = bisect_right(busy, window.start, key=lambda interval: interval.end)
+        last = bisect_left(
+            busy, window.end, lo=first, key=lambda interval: interval.start
+        )
+        return busy[first:last]
 
-            # 시간 기반 이벤트 처리
-            elif "dateTime" in event.get("start", {}):
-                start_dt = datetime.fromisoformat(
-                    event["start"]["dateTime"].replace("Z", "+00:00")
-                )
-                end_dt = datetime.fromisoformat(
-                    event["end"]["dateTime"].replace("Z", "+00:00")
+    @staticmethod
+    def _build_slots(
+        busy: List[TimeInterval],
+        candidate_dates: List[date],
+        work_hours_start: str,
+        work_hours_end: str,
+        timezone: str,
+    ) -> List[dict]:
+        zone = get_zone(timezone)
+
+        # 각 날짜의 근무 시간 창에서 바쁜 구간을 빼고 현지 시각으로 변환
+        work_hours = TimeInterval.parse(work_hours_start, work_hours_end)
+
+        slots = []
+        for candidate_date in sorted(set(candidate_dates)):
+            window = TimeInterval(
+                local_to_epoch_minutes(candidate_date, work_hours.start, zone),
+                local_to_epoch_minutes(candidate_date, work_hours.end, zone),
+            )
+            available_times = ScheduleAnalyzer._calculate_available_times(window, busy)
+
+            if available_times:
+                slots.append(
+                    {
+                        "date": candidate_date.isoformat(),
+                        "available_times": [
+                            ScheduleAnalyzer._to_local_interval(
+                                interval, candidate_date, zone
+                            ).format()
+                            for interval in available_times
+                        ],
+                    }
                 )
 
-                start_date = start_dt.date()
-                end_date = end_dt.date()
-
-                # 같은 날짜 내의 이벤트
-                if start_date == end_date:
-                    if start_date in candidate_dates:
-                        events_by_date[start_date].append(
-                            {
-                                "start": start_dt.strftime("%H:%M"),
-                                "end": end_dt.strftime("%H:%M"),
-                                "all_day": False,
-                            }
-                        )
-                # 여러 날에 걸친 이벤트
-                else:
-                    current_date = start_date
-                    while current_date <= end_date:
-                        if current_date in candidate_dates:
-                            if current_date == start_date:
-                                events_by_date[current_date].append(
-                                    {
-                                        "start": start_dt.strftime("%H:%M"),
-                                        "end": "23:59",
-                                        "all_day": False,
-                                    }
-                                )
-                            elif current_date == end_date:
-                                events_by_date[current_date].append(
-                                    {
-                                        "start": "00:00",
-                                        "end": end_dt.strftime("%H:%M"),
-                                        "all_day": False,
-                                    }
-                                )
-                            # 중간 날들: 종일로 처리
-                            else:
-                                events_by_date[current_date].append(
-                                    {"start": "00:00", "end": "23:59", "all_day": True}
-                                )
-                        current_date += timedelta(days=1)
-
-        return events_by_date
+        return slots
 
     @staticmethod
-    def _calculate_available_times_for_date(
-        target_date: date,
-        events: List[Dict[str, Any]],
-        work_start: time,
-        work_end: time,
-    ) -> List[Dict[str, str]]:
-        # All-day 이벤트가 있으면 해당 날짜 전체 불가
-        if any(event.get("all_day") for event in events):
-            return []
-
-        # 기본 가용 시간: work_start부터 work_end까지
-        busy_periods = []
+    def _busy_timeline(
+        events: Iterable[Dict[str, Any]],
+        zone: ZoneInfo,
+        merged: Optional[List[TimeInterval]] = None,
+    ) -> List[TimeInterval]:
+        # 모든 이벤트를 하나의 epoch 분 타임라인에 올려 병합 (merged에 이어서 병합)
+        # (여러 날에 걸친 이벤트도 구간 하나이므로 날짜별로 쪼개지 않음)
+        busy = list(merged) if merged else []
         for event in events:
-            start = ScheduleAnalyzer._parse_time(event["start"])
-            end = ScheduleAnalyzer._parse_time(event["end"])
-            busy_periods.append((start, end))
+            # "한가함"으로 표시된 이벤트는 freeBusy와 같이 바쁜 시간에서 제외
+            if event.get("transparency") == "transparent":
+                continue
+            interval = ScheduleAnalyzer._event_interval(event, zone)
+            if interval is not None and interval.start < interval.end:
+                busy.append(interval)
+
+        return ScheduleAnalyzer._merge_time_periods(busy)
+
+    @staticmethod
+    def _event_interval(
+        event: Dict[str, Any], zone: ZoneInfo
+    ) -> Optional[TimeInterval]:
+        start = event.get("start", {})
+        end = event.get("end", {})
+
+        # All-day 이벤트: 사용자 타임존의 시작일 자정 ~ 종료일 자정 (종료일 미포함)
+        if "date" in start:
+            return TimeInterval(
+                local_to_epoch_minutes(date.fromisoformat(start["date"]), 0, zone),
+                local_to_epoch_minutes(date.fromisoformat(end["date"]), 0, zone),
+            )
 
-        busy_periods = ScheduleAnalyzer._merge_time_periods(busy_periods)
+        # 시간 기반 이벤트: 이벤트에 포함된 오프셋 기준 절대 시각
+        if "dateTime" in start:
+            start_dt = datetime.fromisoformat(start["dateTime"].replace("Z", "+00:00"))
+            end_dt = datetime.fromisoformat(end["dateTime"].replace("Z", "+00:00"))
+            if start_dt.tzinfo is None:
+                start_dt = start_dt.replace(tzinfo=zone)
+            if end_dt.tzinfo is None:
+                end_dt = end_dt.replace(tzinfo=zone)
+            return TimeInterval(to_epoch_minutes(start_dt), to_epoch_minutes(end_dt))
 
-        # 가용 시간 계산
+        return None
+
+    @staticmethod
+    def _calculate_available_times(
+        window: TimeInterval, busy: List[TimeInterval]
+    ) -> List[TimeInterval]:
+        # 병합·정렬된 바쁜 구간에서 window와 겹칠 수 있는 첫 구간부터 탐색
         available_periods = []
-        current_time = work_start
+        current_time = window.start
 
-        for busy_start, busy_end in sorted(busy_periods):
+        index = bisect_right(busy, window.start, key=lambda interval: interval.end)
+        for busy_start, busy_end in busy[index:]:
+            if busy_start >= window.end:
+                break
             # 현재 시간과 바쁜 시간 시작 사이가 가용 시간
             if current_time < busy_start:
-                available_periods.append((current_time, busy_start))
+                available_periods.append(TimeInterval(current_time, busy_start))
             current_time = max(current_time, busy_end)
+            if current_time >= window.end:
+                break
 
-        # 마지막 바쁜 시간 이후부터 work_end까지
-        if current_time < work_end:
-            available_periods.append((current_time, work_end))
-
-        # 30분 미만 슬롯 필터링 및 포맷 변환
-        result = []
-        for start, end in available_periods:
-            duration = ScheduleAnalyzer._time_diff_minutes(start, end)
-            if duration >= ScheduleAnalyzer.MIN_SLOT_DURATION_MINUTES:
-                result.append(
-                    {"start": start.strftime("%H:%M"), "end": end.strftime("%H:%M")}
-                )
+        # 마지막 바쁜 시간 이후부터 window 끝까지
+        if current_time < window.end:
+            available_periods.append(TimeInterval(current_time, window.end))
+
+        # 30분 미만 슬롯 필터링
+        return [
+            period
+            for period in available_periods
+            if period.duration >= ScheduleAnalyzer.MIN_SLOT_DURATION_MINUTES
+        ]
+
+    @staticmethod
+    def _to_local_interval(
+        interval: TimeInterval, day: date, zone: ZoneInfo
+    ) -> TimeInterval:
+        # 같은 현지 날짜 안의 epoch 분 구간 -> 자정 기준 분 구간
+        # (끝은 23:59까지로 제한: "24:00"은 HH:MM 형식으로 다룰 수 없음)
+        last_minute = MINUTES_PER_DAY - 1
+        anchor = local_to_epoch_minutes(day, 0, zone)
+        next_anchor = local_to_epoch_minutes(day + timedelta(days=1), 0, zone)
+        if next_anchor - anchor == MINUTES_PER_DAY:
+            return TimeInterval(
+                interval.start - anchor, min(interval.end - anchor, last_minute)
+            )
 
-        return result
+        # 서머타임 전환일은 벽시계 시각으로 변환
+        start = epoch_minutes_to_local(interval.start, zone)[1]
+        if interval.end >= next_anchor:
+            return TimeInterval(start, last_minute)
+        return TimeInterval(
+            start, min(epoch_minutes_to_local(interval.end, zone)[1], last_minute)
+        )
 
     @staticmethod
     def find_common_slots(
-        user_slots: List[dict], min_duration_minutes: int
+        user_slots: List[dict],
+        min_duration_minutes: int,
+        engine: str = ENGINE_SWEEP,
+        limit: Optional[int] = None,
+        min_participants: int = 1,
+        time_range_start: Optional[str] = None,
+        time_range_end: Optional[str] = None,
+        timezone: str = DEFAULT_TIMEZONE,
+        dates: Optional[Iterable[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         여러 사용자의 가용시간 교집합 계산
 
-        1. 15분 단위 그리드로 변환
-        2. 각 시간대별 참여 가능 인원 카운트
-        3. 연속된 블록 병합
-        4. 정렬: 참여 인원 DESC, 시간 길이 DESC
+        1. 참여자를 비트 위치에 한 번 매핑하고 각자의 타임존 기준 가용 구간을
+           하나의 epoch 분 타임라인으로 수집
+        2. 참여자 비트마스크가 유지되는 최대 블록을 한 번에 추출
+           - sweep: 시작/끝 이벤트를 시각순으로 훑으며 현재 마스크 유지
+           - numpy: 참여자 x 시간 셀 행렬로 인원 합계와 경계를 벡터 연산
+             (numpy 미설치 시 sweep으로 대체)
+        3. 블록을 timezone 기준 날짜별 현지 시각으로 자르고 시간대 필터 적용
+           (후보 날짜 dates 밖의 블록은 제외, 생략하면 참여자 슬롯의 날짜)
+        4. min_duration_minutes / min_participants 미만 블록은 추출 즉시 제외
+        5. 정렬: 참여 인원 DESC, 시간 길이 DESC (limit 지정 시 상위 K개만 힙으로 유지)
+        6. 반환할 블록만 participant_ids로 디코딩
         """
         if not user_slots:
             return []
 
-        total_participants = len(user_slots)
+        user_ids, intervals_by_user = ScheduleAnalyzer._collect_user_intervals(
+            user_slots
+        )
+        if dates is None:
+            dates = {
+                slot["date"] for user_data in user_slots for slot in user_data["slots"]
+            }
 
-        time_grid: Dict[str, Dict[str, Set[int]]] = defaultdict(
-            lambda: defaultdict(set)
+        blocks = ScheduleAnalyzer._rank_blocks(
+            ScheduleAnalyzer._localize_blocks(
+                ScheduleAnalyzer._iter_common_blocks(intervals_by_user, engine),
+                get_zone(timezone),
+                ScheduleAnalyzer._time_range_clip(time_range_start, time_range_end),
+                dates,
+            ),
+            min_duration_minutes,
+            min_participants,
+            limit,
         )
 
+        return [
+            ScheduleAnalyzer._format_block(
+                date_str, block, mask, user_ids, len(user_slots)
+            )
+            for date_str, block, mask in blocks
+        ]
+
+    @staticmethod
+    def _collect_user_intervals(
+        user_slots: List[dict],
+    ) -> Tuple[List[Any], Dict[int, List[TimeInterval]]]:
+        # 참여자 -> 비트 위치 (정렬 순서이므로 디코딩 결과도 정렬된 상태)
+        user_ids = sorted({user_data["user_id"] for user_data in user_slots})
+        bit_of = {user_id: position for position, user_id in enumerate(user_ids)}
+
+        intervals_by_user: Dict[int, List[TimeInterval]] = defaultdict(list)
+
         for user_data in user_slots:
-            user_id = user_data["user_id"]
-            slots = user_data["slots"]
-
-            for slot in slots:
-                date_str = slot["date"]
-                available_times = slot["available_times"]
-
-                for time_range in available_times:
-                    start = ScheduleAnalyzer._parse_time(time_range["start"])
-                    end = ScheduleAnalyzer._parse_time(time_range["end"])
-
-                    # 15분 단위로 그리드 채우기
-                    current = start
-                    while current < end:
-                        time_str = current.strftime("%H:%M")
-                        time_grid[date_str][time_str].add(user_id)
-                        current = ScheduleAnalyzer._add_minutes(
-                            current, ScheduleAnalyzer.GRID_INTERVAL_MINUTES
+            user_intervals = intervals_by_user[bit_of[user_data["user_id"]]]
+            zone = get_zone(
+                user_data.get("timezone") or ScheduleAnalyzer.DEFAULT_TIMEZONE
+            )
+
+            for slot in user_data["slots"]:
+                day = date.fromisoformat(slot["date"])
+
+                for time_range in slot["available_times"]:
+                    start = parse_hhmm(time_range["start"])
+                    end = parse_hhmm(time_range["end"])
+                    if start < end:
+                        user_intervals.append(
+                            TimeInterval(
+                                local_to_epoch_minutes(day, start, zone),
+                                local_to_epoch_minutes(day, end, zone),
+                            )
                         )
 
-        # 연속된 블록 찾기 및 병합
-        optimal_slots = []
-        for date_str, time_slots in time_grid.items():
-            merged_blocks = ScheduleAnalyzer._merge_consecutive_time_blocks(
-                date_str, time_slots, min_duration_minutes, total_participants
-            )
-            optimal_slots.extend(merged_blocks)
+        return user_ids, intervals_by_user
 
-        # 정렬: 참여 인원 DESC, 시간 길이 DESC
-        optimal_slots.sort(
-            key=lambda x: (-x["participant_count"], -x["duration_minutes"])
+    @staticmethod
+    def _interval_count(user_slots: List[dict]) -> int:
+        # 실행기 선택용 작업 크기 (전체 가용 구간 수)
+        return sum(
+            len(slot["available_times"])
+            for user_data in user_slots
+            for slot in user_data["slots"]
         )
 
-        return optimal_slots
+    @staticmethod
+    def _iter_common_blocks(
+        intervals_by_user: Dict[int, List[TimeInterval]],
+        engine: str = ENGINE_SWEEP,
+    ) -> List[Tuple[TimeInterval, int]]:
+        if engine == ScheduleAnalyzer.ENGINE_NUMPY and np is not None:
+            extract_blocks = ScheduleAnalyzer._matrix_common_blocks
+        else:
+            extract_blocks = ScheduleAnalyzer._sweep_common_blocks
+
+        # 전체 타임라인에서 최대 블록 추출 (참여자별 구간은 겹치지 않도록 먼저 병합)
+        intervals = [
+            (interval, position)
+            for position, user_intervals in intervals_by_user.items()
+            for interval in ScheduleAnalyzer._merge_time_periods(user_intervals)
+        ]
+        return extract_blocks(intervals)
 
     @staticmethod
-    def _merge_consecutive_time_blocks(
-        date_str: str,
-        time_slots: Dict[str, Set[int]],
-        min_duration_minutes: int,
-        total_participants: int,
-    ) -> List[Dict[str, Any]]:
-        if not time_slots:
-            return []
+    def _time_range_clip(
+        time_range_start: Optional[str], time_range_end: Optional[str]
+    ) -> Optional[TimeInterval]:
+        # 시간대 필터 (한쪽만 있으면 나머지는 기본 근무 시간 경계)
+        if not time_range_start and not time_range_end:
+            return None
+
+        return TimeInterval.parse(
+            time_range_start or ScheduleAnalyzer.DEFAULT_WORK_START,
+            time_range_end or ScheduleAnalyzer.DEFAULT_WORK_END,
+        )
+
+    @staticmethod
+    def _localize_blocks(
+        blocks: Iterable[Tuple[TimeInterval, int]],
+        zone: ZoneInfo,
+        clip: Optional[TimeInterval] = None,
+        dates: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[str, TimeInterval, int]]:
+        # epoch 분 블록을 zone의 현지 날짜 경계에서 잘라 날짜별 자정 기준 분으로 변환
+        # (dates가 있으면 그 날짜의 조각만 반환)
+        allowed = set(dates) if dates is not None else None
+        for block, mask in blocks:
+            start = block.start
+            while start < block.end:
+                day, _ = epoch_minutes_to_local(start, zone)
+                day_end = local_to_epoch_minutes(day + timedelta(days=1), 0, zone)
+                if allowed is not None and day.isoformat() not in allowed:
+                    start = day_end
+                    continue
+                piece = ScheduleAnalyzer._to_local_interval(
+                    TimeInterval(start, min(block.end, day_end)), day, zone
+                )
+                start = day_end
 
-        # 시간순 정렬
-        sorted_times = sorted(time_slots.keys())
+                if clip is not None:
+                    piece = TimeInterval(
+                        max(piece.start, clip.start), min(piece.end, clip.end)
+                    )
+                if piece.start < piece.end:
+                    yield day.isoformat(), piece, mask
 
-        results: List[Dict[str, Any]] = []
-        current_start: Optional[str] = None
-        current_participants: Optional[Set[int]] = None
-        prev_time: Optional[time] = None
+    @staticmethod
+    def _rank_blocks(
+        blocks: Iterable[Tuple[str, TimeInterval, int]],
+        min_duration_minutes: int,
+        min_participants: int,
+        limit: Optional[int],
+    ) -> List[Tuple[str, TimeInterval, int]]:
+        # 조건 미달 블록은 바로 버리고 (참여 인원, 길이) 내림차순으로 정렬
+        # limit이 있으면 크기 K의 힙만 유지 (동률은 추출 순서 유지)
+        ranked = (
+            (mask.bit_count(), block.duration, date_str, block, mask)
+            for date_str, block, mask in blocks
+            if block.duration >= min_duration_minutes
+            and mask.bit_count() >= min_participants
+        )
 
-        for time_str in sorted_times:
-            participants = time_slots[time_str]
-            current_time = ScheduleAnalyzer._parse_time(time_str)
+        def _key(item: Tuple[int, int, str, TimeInterval, int]) -> Tuple[int, int]:
+            return item[0], item[1]
 
-            # 새로운 블록 시작
-            if current_start is None:
-                current_start = time_str
-                current_participants = participants
-                prev_time = current_time
-                continue
+        if limit is None:
+            selected = sorted(ranked, key=_key, reverse=True)
+        else:
+            selected = heapq.nlargest(limit, ranked, key=_key)
 
-            assert prev_time is not None
-            assert current_participants is not None
+        return [(date_str, block, mask) for _, _, date_str, block, mask in selected]
 
-            time_diff = ScheduleAnalyzer._time_diff_minutes(prev_time, current_time)
-            if (
-                time_diff == ScheduleAnalyzer.GRID_INTERVAL_MINUTES
-                and participants == current_participants
-            ):
-                prev_time = current_time
-            else:
-                end_time = ScheduleAnalyzer._add_minutes(
-                    prev_time, ScheduleAnalyzer.GRID_INTERVAL_MINUTES
-                )
-                ScheduleAnalyzer._add_block_if_valid(
-                    results,
-                    date_str,
-                    current_start,
-                    end_time.strftime("%H:%M"),
-                    current_participants,
-                    total_participants,
-                    min_duration_minutes,
-                )
+    @staticmethod
+    def _sweep_common_blocks(
+        intervals: List[Tuple[TimeInterval, int]],
+    ) -> List[Tuple[TimeInterval, int]]:
+        # (시각, 비트) 이벤트를 정렬해 참여자 마스크가 유지되는 최대 구간 계산
+        # 참여자별 구간은 겹치지 않으므로 시작/끝 모두 XOR 한 번으로 반영된다
+        events: List[Tuple[int, int]] = []
+        for (start, end), position in intervals:
+            bit = 1 << position
+            events.append((start, bit))
+            events.append((end, bit))
+        events.sort(key=lambda event: event[0])
+
+        blocks: List[Tuple[TimeInterval, int]] = []
+        current_start = 0
+        current_mask = 0
+        mask = 0
+
+        index = 0
+        while index < len(events):
+            minute = events[index][0]
+
+            # 같은 시각의 이벤트를 한 번에 반영
+            while index < len(events) and events[index][0] == minute:
+                mask ^= events[index][1]
+                index += 1
+
+            if mask == current_mask:
+                continue
 
-                current_start = time_str
-                current_participants = participants
-                prev_time = current_time
+            if current_mask:
+                blocks.append((TimeInterval(current_start, minute), current_mask))
 
-        # 마지막 블록 처리
-        if current_start is not None and prev_time is not None:
-            assert current_participants is not None
-            end_time = ScheduleAnalyzer._add_minutes(
-                prev_time, ScheduleAnalyzer.GRID_INTERVAL_MINUTES
-            )
-            ScheduleAnalyzer._add_block_if_valid(
-                results,
-                date_str,
-                current_start,
-                end_time.strftime("%H:%M"),
-                current_participants,
-                total_participants,
-                min_duration_minutes,
-            )
+            current_start = minute
+            current_mask = mask
 
-        return results
+        return blocks
 
     @staticmethod
-    def _add_block_if_valid(
-        results: List[Dict[str, Any]],
-        date_str: str,
-        start_str: str,
-        end_str: str,
-        participants: Set[int],
-        total_participants: int,
-        min_duration_minutes: int,
-    ):
-        start = ScheduleAnalyzer._parse_time(start_str)
-        end = ScheduleAnalyzer._parse_time(end_str)
-        duration = ScheduleAnalyzer._time_diff_minutes(start, end)
-
-        if duration >= min_duration_minutes:
-            participant_count = len(participants)
-            results.append(
-                {
-                    "date": date_str,
-                    "start_time": start_str,
-                    "end_time": end_str,
-                    "duration_minutes": duration,
-                    "participant_count": participant_count,
-                    "total_participants": total_participants,
-                    "participant_ids": sorted(list(participants)),
-                    "availability_percentage": round(
-                        (participant_count / total_participants) * 100, 2
+    def _matrix_common_blocks(
+        intervals: List[Tuple[TimeInterval, int]],
+    ) -> List[Tuple[TimeInterval, int]]:
+        # 참여자 x 시간 셀 불리언 행렬로 최대 구간 계산 (셀 = 인접한 구간 경계 사이)
+        if not intervals:
+            return []
+
+        rows = np.fromiter(
+            (position for _, position in intervals),
+            dtype=np.intp,
+            count=len(intervals),
+        )
+        spans = np.fromiter(
+            (minute for interval, _ in intervals for minute in interval),
+            dtype=np.int64,
+            count=2 * len(intervals),
+        ).reshape(-1, 2)
+        boundaries = np.unique(spans)
+        start_cells = np.searchsorted(boundaries, spans[:, 0])
+        end_cells = np.searchsorted(boundaries, spans[:, 1])
+
+        # 차분 배열 누적합으로 참여자별 가용 셀 표시 (행 = 비트 위치)
+        cell_count = len(boundaries) - 1
+        diff = np.zeros((int(rows.max()) + 1, cell_count + 1), dtype=np.int32)
+        np.add.at(diff, (rows, start_cells), 1)
+        np.add.at(diff, (rows, end_cells), -1)
+        matrix = np.cumsum(diff, axis=1)[:, :cell_count] > 0
+
+        # 셀별 참여 인원과 참여자 구성이 바뀌는 경계
+        counts = matrix.sum(axis=0)
+        breaks = np.flatnonzero(np.any(matrix[:, 1:] != matrix[:, :-1], axis=0)) + 1
+        block_starts = np.concatenate(([0], breaks))
+        block_ends = np.concatenate((breaks, [cell_count]))
+
+        occupied = counts[block_starts] > 0
+        block_starts = block_starts[occupied]
+        block_ends = block_ends[occupied]
+
+        # 블록 시작 셀의 열을 비트마스크 정수로 변환
+        packed = np.packbits(matrix[:, block_starts], axis=0, bitorder="little")
+
+        blocks: List[Tuple[TimeInterval, int]] = []
+        for column, (start_cell, end_cell) in enumerate(
+            zip(block_starts.tolist(), block_ends.tolist())
+        ):
+            mask = int.from_bytes(packed[:, column].tobytes(), "little")
+            blocks.append(
+                (
+                    TimeInterval(
+                        int(boundaries[start_cell]), int(boundaries[end_cell])
                     ),
-                }
+                    mask,
+                )
             )
 
-    @staticmethod
-    def _parse_time(time_str: str) -> time:
-        # 시간 문자열을 time 객체로 파싱
-        try:
-            return datetime.strptime(time_str, "%H:%M").time()
-        except ValueError:
-            return time(0, 0)
+        return blocks
 
     @staticmethod
-    def _time_diff_minutes(start: time, end: time) -> int:
-        # 두 시간의 차이를 분 단위로 계산
-        start_minutes = start.hour * 60 + start.minute
-        end_minutes = end.hour * 60 + end.minute
-        return end_minutes - start_minutes
+    def _format_block(
+        date_str: str,
+        block: TimeInterval,
+        mask: int,
+        user_ids: List[Any],
+        total_participants: int,
+    ) -> Dict[str, Any]:
+        participant_count = mask.bit_count()
+        return {
+            "date": date_str,
+            "start_time": format_hhmm(block.start),
+            "end_time": format_hhmm(block.end),
+            "duration_minutes": block.duration,
+            "participant_count": participant_count,
+            "total_participants": total_participants,
+            "participant_ids": sorted(
+                ScheduleAnalyzer._decode_participants(mask, user_ids)
+            ),
+            "availability_percentage": round(
+                (participant_count / total_participants) * 100, 2
+            ),
+        }
 
     @staticmethod
-    def _add_minutes(t: time, minutes: int) -> time:
-        dt = datetime.combine(date.today(), t)
-        dt += timedelta(minutes=minutes)
-        result = dt.time()
-
-        # 자정을 넘어가면 23:59로 제한
-        if dt.date() > date.today():
-            return time(23, 59)
-
-        return result
+    def _decode_participants(mask: int, user_ids: List[Any]) -> List[Any]:
+        # 비트마스크를 참여자 ID 목록으로 변환 (낮은 비트부터)
+        bits = bin(mask)[:1:-1]
+        return [user_ids[position] for position, bit in enumerate(bits) if bit == "1"]
 
     @staticmethod
-    def _merge_time_periods(periods: List[tuple]) -> List[tuple]:
+    def _merge_time_periods(periods: List[TimeInterval]) -> List[TimeInterval]:
         # 겹치는 시간 구간들을 병합
         if not periods:
             return []
@@ -404,8 +767,8 @@ class ScheduleAnalyzer:
             last_start, last_end = merged[-1]
 
             if current_start <= last_end:
-                merged[-1] = (last_start, max(last_end, current_end))
+                merged[-1] = TimeInterval(last_start, max(last_end, current_end))
             else:
-                merged.append((current_start, current_end))
+                merged.append(TimeInterval(current_start, current_end))
 
         return merged
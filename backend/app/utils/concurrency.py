@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+
+
+class TaskOutcome(NamedTuple):
+    """run_bounded 작업 하나의 결과 (실패하면 error에 예외 보관)"""
+
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def timed_out(self) -> bool:
+        return isinstance(self.error, TimeoutError)
+
+
+async def run_bounded(
+    keys: Iterable[K],
+    func: Callable[[K], Awaitable[Any]],
+    *,
+    limit: int,
+    timeout: Optional[float] = None,
+) -> Dict[K, TaskOutcome]:
+    """
+    key마다 func(key)를 최대 limit개까지 동시에 실행하고 key 순서대로 결과 반환
+
+    작업 하나가 실패하거나 timeout(초)을 넘겨도 나머지는 계속 진행한다.
+    호출자가 취소되면 TaskGroup이 실행 중인 작업을 모두 취소한다.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+    outcomes: Dict[K, TaskOutcome] = {}
+
+    async def _run(key: K) -> None:
+        async with semaphore:
+            try:
+                # 제한 시간은 슬롯을 얻은 뒤 실제 실행 시간에만 적용
+                async with asyncio.timeout(timeout):
+                    outcomes[key] = TaskOutcome(value=await func(key))
+            except Exception as exc:
+                outcomes[key] = TaskOutcome(error=exc)
+
+    ordered = list(dict.fromkeys(keys))
+    async with asyncio.TaskGroup() as group:
+        for key in ordered:
+            group.create_task(_run(key))
+
+    return {key: outcomes[key] for key in ordered}
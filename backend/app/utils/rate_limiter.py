@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷
+
+    take()는 토큰이 모자라도 미리 예약(잔량이 음수가 됨)하고 기다릴 시간을
+    돌려주므로, 대기자는 예약한 순서대로 차례를 얻는다. capacity보다 많은
+    토큰은 capacity만큼 모이면 바로 내주고 나머지는 빚으로 남겨 다음 요청이
+    기다리게 한다 (한 번에 모을 수 없는 요청도 결국 처리되도록).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def delay(self, cost: float = 1) -> float:
+        # 지금 토큰 cost개를 예약하면 기다려야 하는 시간 (초)
+        self._refill()
+        return max(0.0, (min(cost, self.capacity) - self._tokens) / self.rate)
+
+    def take(self, cost: float = 1) -> float:
+        wait = self.delay(cost)
+        self._tokens -= cost
+        return wait
+
+
+class RateLimiter:
+    """
+    전체 버킷 + key별 버킷을 함께 적용하는 비동기 제한기
+
+    두 버킷 모두 max_wait(초) 안에 토큰을 얻을 수 있을 때만 예약하고 기다린다.
+    그보다 오래 기다려야 하면 어느 버킷도 소모하지 않고 바로 False를 반환한다.
+    rate가 0 이하인 버킷은 제한하지 않는다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        key_rate: float,
+        key_burst: float,
+        *,
+        max_keys: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self._clock = clock
+        self._sleep = sleep
+        self._global = TokenBucket(rate, burst, clock) if rate > 0 else None
+        self.key_rate = key_rate
+        self.key_burst = key_burst
+        self.max_keys = max_keys
+        # 최근 사용 순서로 유지하며 max_keys를 넘으면 가장 오래된 버킷부터 제거
+        self._buckets: "OrderedDict[Hashable, TokenBucket]" = OrderedDict()
+        self.acquired = 0
+        self.throttled = 0
+        self.dropped = 0
+        self.throttled_seconds = 0.0
+
+    def _bucket_for(self, key: Optional[Hashable]) -> Optional[TokenBucket]:
+        if key is None or self.key_rate <= 0 or self.max_keys <= 0:
+            return None
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.key_rate, self.key_burst, self._clock)
+            self._buckets[key] = bucket
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    async def acquire(
+        self, key: Optional[Hashable], max_wait: float, cost: int = 1
+    ) -> bool:
+        # cost: 소모할 토큰 수 (batch 요청은 포함된 요청 수만큼)
+        buckets = [
+            bucket
+            for bucket in (self._global, self._bucket_for(key))
+            if bucket is not None
+        ]
+        if any(bucket.delay(cost) > max_wait for bucket in buckets):
+            self.dropped += cost
+            return False
+
+        delay = max((bucket.take(cost) for bucket in buckets), default=0.0)
+        self.acquired += cost
+        if delay > 0:
+            self.throttled += 1
+            self.throttled_seconds += delay
+            await self._sleep(delay)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "dropped": self.dropped,
+            "throttled_seconds": round(self.throttled_seconds, 6),
+            "keys": len(self._buckets),
+        }
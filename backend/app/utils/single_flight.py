@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    같은 key의 동시 호출을 하나로 합치는 도우미
+
+    진행 중인 호출이 있으면 새로 실행하지 않고 그 결과(또는 예외)를 함께 기다린다.
+    기다리던 호출자 하나가 취소되어도 공유 작업은 계속 진행된다.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        # 전체 호출 수 / 진행 중인 호출에 합류한 수
+        self.calls = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executions": self.calls - self.coalesced,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+            "coalesced_rate": (
+                round(self.coalesced / self.calls, 4) if self.calls else 0.0
+            ),
+        }
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        # 모든 대기자가 취소된 경우에도 예외 미확인 경고가 남지 않도록 확인 처리
+        if not future.cancelled():
+            future.exception()
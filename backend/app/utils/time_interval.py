@@ -0,0 +1,87 @@
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+from zoneinfo import ZoneInfo
+
+MINUTES_PER_DAY = 24 * 60
+
+
+class TimeInterval(NamedTuple):
+    # 자정 기준 분(minute) 단위 반열린 구간 [start, end)
+    start: int
+    end: int
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+    @classmethod
+    def parse(cls, start: str, end: str) -> "TimeInterval":
+        return cls(parse_hhmm(start), parse_hhmm(end))
+
+    def format(self) -> dict:
+        return {"start": format_hhmm(self.start), "end": format_hhmm(self.end)}
+
+
+def parse_hhmm(value: str) -> int:
+    # "HH:MM" 문자열을 자정 기준 분으로 변환 (형식 오류 시 00:00)
+    try:
+        hour_str, minute_str = value.split(":")
+        hour, minute = int(hour_str), int(minute_str)
+    except (AttributeError, ValueError):
+        return 0
+
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return 0
+
+    return hour * 60 + minute
+
+
+def format_hhmm(minutes: int) -> str:
+    # 자정 기준 분을 "HH:MM" 문자열로 변환
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: str) -> ZoneInfo:
+    # IANA 타임존 이름 -> ZoneInfo (이름별로 한 번만 생성)
+    return ZoneInfo(name)
+
+
+def to_epoch_minutes(value: datetime) -> int:
+    # aware datetime을 UTC 기준 epoch 분으로 변환 (초 단위는 버림)
+    return int(value.timestamp()) // 60
+
+
+@lru_cache(maxsize=4096)
+def _day_anchor(day: date, zone: ZoneInfo) -> Tuple[int, bool]:
+    # 현지 자정의 epoch 분과, 그날 하루 UTC 오프셋이 일정한지 여부
+    midnight = datetime.combine(day, time.min, tzinfo=zone)
+    next_midnight = datetime.combine(day + timedelta(days=1), time.min, tzinfo=zone)
+    return to_epoch_minutes(midnight), midnight.utcoffset() == next_midnight.utcoffset()
+
+
+def local_to_epoch_minutes(day: date, minutes: int, zone: ZoneInfo) -> int:
+    # 현지 날짜 + 자정 기준 분 -> epoch 분
+    anchor, uniform = _day_anchor(day, zone)
+    if uniform:
+        return anchor + minutes
+
+    # 서머타임 전환일은 벽시계 시각을 직접 변환
+    if minutes >= MINUTES_PER_DAY:
+        return _day_anchor(day + timedelta(days=1), zone)[0]
+    hour, minute = divmod(minutes, 60)
+    return to_epoch_minutes(datetime.combine(day, time(hour, minute), tzinfo=zone))
+
+
+def epoch_minutes_to_local(value: int, zone: ZoneInfo) -> Tuple[date, int]:
+    # epoch 분 -> (현지 날짜, 자정 기준 분)
+    local = datetime.fromtimestamp(value * 60, zone)
+    return local.date(), local.hour * 60 + local.minute
+
+
+def epoch_minutes_to_rfc3339(value: int) -> str:
+    # epoch 분 -> Google API용 UTC RFC3339 문자열
+    return datetime.fromtimestamp(value * 60, timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
@@ -70,3 +70,92 @@ GOOGLE_FORCE_PROMPT_CONSENT = (
 FRONTEND_URL = _normalize_frontend_url(
     os.getenv("FRONTEND_URL", "http://localhost:5173")
 )
+
+# 최적 시간 계산 엔진 ("sweep" | "numpy", numpy 미설치 시 sweep으로 대체)
+OPTIMAL_TIMES_ENGINE = os.getenv("OPTIMAL_TIMES_ENGINE", "sweep").lower()
+
+# CPU 연산 프로세스 풀 (워커 0이면 항상 이벤트 루프에서 바로 실행)
+COMPUTE_POOL_WORKERS = int(os.getenv("COMPUTE_POOL_WORKERS", "2"))
+# 작업 크기(구간/이벤트 수)가 이 값 미만이면 풀로 보내지 않고 바로 실행
+COMPUTE_INLINE_THRESHOLD = int(os.getenv("COMPUTE_INLINE_THRESHOLD", "2000"))
+
+# 최적 시간 결과 캐시 (크기 0이면 비활성화)
+OPTIMAL_TIMES_CACHE_SIZE = int(os.getenv("OPTIMAL_TIMES_CACHE_SIZE", "512"))
+OPTIMAL_TIMES_CACHE_TTL_SECONDS = float(
+    os.getenv("OPTIMAL_TIMES_CACHE_TTL_SECONDS", "60")
+)
+
+# 캘린더 증분 동기화 저장소가 전체 동기화 시 확보하는 미래 범위 (일)
+CALENDAR_SYNC_HORIZON_DAYS = int(os.getenv("CALENDAR_SYNC_HORIZON_DAYS", "180"))
+# 동기화 후 이 시간(초) 동안은 Google을 다시 조회하지 않고 저장된 구간 사용
+CALENDAR_SYNC_FRESHNESS_SECONDS = int(
+    os.getenv("CALENDAR_SYNC_FRESHNESS_SECONDS", "60")
+)
+# 알림 채널이 살아 있을 때의 최대 유효기간 (초, 알림 유실 대비)
+CALENDAR_SYNC_WATCHED_FRESHNESS_SECONDS = int(
+    os.getenv("CALENDAR_SYNC_WATCHED_FRESHNESS_SECONDS", "3600")
+)
+
+# 캘린더 푸시 알림(events.watch) 수신 주소 (비어 있으면 채널을 만들지 않음)
+GOOGLE_WEBHOOK_URL = os.getenv("GOOGLE_WEBHOOK_URL")
+# 채널 요청 유효기간 / 만료 전 갱신 여유 / 갱신 작업 주기 (초)
+CALENDAR_WATCH_TTL_SECONDS = int(os.getenv("CALENDAR_WATCH_TTL_SECONDS", "604800"))
+CALENDAR_WATCH_RENEW_BEFORE_SECONDS = int(
+    os.getenv("CALENDAR_WATCH_RENEW_BEFORE_SECONDS", "86400")
+)
+CALENDAR_WATCH_RENEW_INTERVAL_SECONDS = int(
+    os.getenv("CALENDAR_WATCH_RENEW_INTERVAL_SECONDS", "3600")
+)
+
+# 여러 약속 동시 처리 한도 / 약속 하나당 처리 제한 시간 (초)
+SYNC_CONCURRENCY_LIMIT = int(os.getenv("SYNC_CONCURRENCY_LIMIT", "8"))
+SYNC_APPOINTMENT_TIMEOUT_SECONDS = float(
+    os.getenv("SYNC_APPOINTMENT_TIMEOUT_SECONDS", "10")
+)
+
+# Google access token 캐시 크기 / 만료(expires_in) 전에 미리 갱신할 여유 시간 (초)
+GOOGLE_TOKEN_CACHE_SIZE = int(os.getenv("GOOGLE_TOKEN_CACHE_SIZE", "1024"))
+GOOGLE_TOKEN_EXPIRY_MARGIN_SECONDS = int(
+    os.getenv("GOOGLE_TOKEN_EXPIRY_MARGIN_SECONDS", "300")
+)
+
+# Google API 재시도 (idempotent 요청만): 최대 시도 횟수 / 백오프 시작·최대 간격 /
+# 요청 하나의 재시도 대기 합계 한도 (초)
+GOOGLE_RETRY_MAX_ATTEMPTS = int(os.getenv("GOOGLE_RETRY_MAX_ATTEMPTS", "3"))
+GOOGLE_RETRY_BASE_DELAY_SECONDS = float(
+    os.getenv("GOOGLE_RETRY_BASE_DELAY_SECONDS", "0.5")
+)
+GOOGLE_RETRY_MAX_DELAY_SECONDS = float(os.getenv("GOOGLE_RETRY_MAX_DELAY_SECONDS", "8"))
+GOOGLE_RETRY_BUDGET_SECONDS = float(os.getenv("GOOGLE_RETRY_BUDGET_SECONDS", "10"))
+
+# Google API 공용 HTTP 클라이언트 연결 풀: 최대 연결 수 / 유지(keep-alive) 연결 수 /
+# 유휴 연결 유지 시간 / 연결·읽기·쓰기·풀 대기 제한 시간 (초)
+GOOGLE_HTTP_MAX_CONNECTIONS = int(os.getenv("GOOGLE_HTTP_MAX_CONNECTIONS", "100"))
+GOOGLE_HTTP_MAX_KEEPALIVE = int(os.getenv("GOOGLE_HTTP_MAX_KEEPALIVE", "20"))
+GOOGLE_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("GOOGLE_HTTP_KEEPALIVE_EXPIRY", "30"))
+GOOGLE_HTTP_CONNECT_TIMEOUT = float(os.getenv("GOOGLE_HTTP_CONNECT_TIMEOUT", "5"))
+GOOGLE_HTTP_READ_TIMEOUT = float(os.getenv("GOOGLE_HTTP_READ_TIMEOUT", "10"))
+GOOGLE_HTTP_WRITE_TIMEOUT = float(os.getenv("GOOGLE_HTTP_WRITE_TIMEOUT", "10"))
+GOOGLE_HTTP_POOL_TIMEOUT = float(os.getenv("GOOGLE_HTTP_POOL_TIMEOUT", "5"))
+# HTTP/2 다중화 사용 여부 (httpx[http2]로 h2 패키지를 설치한 경우에만 적용)
+GOOGLE_HTTP2 = os.getenv("GOOGLE_HTTP2", "false").lower() == "true"
+
+# Google API 호출 속도 제한 (프로젝트 전체 / 사용자별 초당 호출 수와 순간 허용량,
+# 0 이하이면 제한 없음) / 토큰을 기다릴 최대 시간 (초, 넘으면 rate_limited)
+GOOGLE_RATE_LIMIT_PER_SECOND = float(os.getenv("GOOGLE_RATE_LIMIT_PER_SECOND", "50"))
+GOOGLE_RATE_LIMIT_BURST = float(os.getenv("GOOGLE_RATE_LIMIT_BURST", "100"))
+GOOGLE_USER_RATE_LIMIT_PER_SECOND = float(
+    os.getenv("GOOGLE_USER_RATE_LIMIT_PER_SECOND", "5")
+)
+GOOGLE_USER_RATE_LIMIT_BURST = float(os.getenv("GOOGLE_USER_RATE_LIMIT_BURST", "10"))
+GOOGLE_RATE_LIMIT_MAX_WAIT_SECONDS = float(
+    os.getenv("GOOGLE_RATE_LIMIT_MAX_WAIT_SECONDS", "2")
+)
+
+# 약속 확정 시 참석자 캘린더 일정 동시 생성 한도 / 참석자 한 명당 제한 시간 (초)
+CONFIRM_CONCURRENCY_LIMIT = int(os.getenv("CONFIRM_CONCURRENCY_LIMIT", "10"))
+CONFIRM_PARTICIPANT_TIMEOUT_SECONDS = float(
+    os.getenv("CONFIRM_PARTICIPANT_TIMEOUT_SECONDS", "15")
+)
+# 이 시간(초)이 지나도록 끝나지 않은 일정 생성은 중단된 것으로 보고 다시 확정할 때 재시도
+CONFIRM_PENDING_STALE_SECONDS = int(os.getenv("CONFIRM_PENDING_STALE_SECONDS", "600"))
@@ -0,0 +1,94 @@
+"""ScheduleAnalyzer.find_common_slots 엔진 벤치마크
+
+합성 약속(기본 500명, 후보 날짜 7일)에 대해 sweep / numpy 엔진의 실행 시간을
+비교하고 두 엔진의 결과가 같은지 확인한다.
+
+    cd backend
+    python -m benchmarks.benchmark_common_slots --participants 500 --dates 7
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services import schedule_analyzer  # noqa: E402
+from app.services.schedule_analyzer import ScheduleAnalyzer  # noqa: E402
+from app.utils.time_interval import TimeInterval  # noqa: E402
+
+
+def build_user_slots(participants: int, dates: int, seed: int) -> list[dict]:
+    # 참여자별로 날짜마다 0~4개의 일정(30분 단위)을 배치하고
+    # 09:00~22:00 중 남는 시간을 가용 구간으로 사용
+    rng = random.Random(seed)
+    first_date = date(2026, 1, 5)
+    work_hours = TimeInterval.parse("09:00", "22:00")
+
+    user_slots = []
+    for user_id in range(1, participants + 1):
+        slots = []
+        for offset in range(dates):
+            candidate_date = first_date + timedelta(days=offset)
+            busy = []
+            for _ in range(rng.randint(0, 4)):
+                start = rng.randrange(work_hours.start, work_hours.end, 30)
+                busy.append(TimeInterval(start, start + 30 * rng.randint(1, 4)))
+
+            available = ScheduleAnalyzer._calculate_available_times(
+                work_hours, ScheduleAnalyzer._merge_time_periods(busy)
+            )
+            slots.append(
+                {
+                    "date": candidate_date.isoformat(),
+                    "available_times": [interval.format() for interval in available],
+                }
+            )
+        user_slots.append({"user_id": user_id, "slots": slots})
+
+    return user_slots
+
+
+def measure(user_slots: list[dict], engine: str, repeat: int) -> tuple[float, list]:
+    best = float("inf")
+    result: list = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = ScheduleAnalyzer.find_common_slots(user_slots, 30, engine=engine)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--participants", type=int, default=500)
+    parser.add_argument("--dates", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    user_slots = build_user_slots(args.participants, args.dates, args.seed)
+    engines = [ScheduleAnalyzer.ENGINE_SWEEP]
+    if schedule_analyzer.np is not None:
+        engines.append(ScheduleAnalyzer.ENGINE_NUMPY)
+    else:
+        print("numpy 미설치: sweep 엔진만 측정합니다")
+
+    results = {}
+    for engine in engines:
+        elapsed, result = measure(user_slots, engine, args.repeat)
+        results[engine] = result
+        print(f"{engine:>6}: {elapsed * 1000:8.1f} ms ({len(result)} blocks)")
+
+    if len(results) > 1:
+        same = results[ScheduleAnalyzer.ENGINE_SWEEP] == results.get(
+            ScheduleAnalyzer.ENGINE_NUMPY
+        )
+        print(f"results identical: {same}")
+
+
+if __name__ == "__main__":
+    main()
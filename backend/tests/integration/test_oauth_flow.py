@@ -65,7 +65,8 @@ def test_google_login_returns_composed_url(oauth_modules):
     assert query["client_id"] == ["client"]
     assert query["redirect_uri"] == ["http://localhost/callback"]
     assert query["scope"] == [
-        "openid email profile https://www.googleapis.com/auth/calendar.events"
+        "openid email profile https://www.googleapis.com/auth/calendar.events "
+        "https://www.googleapis.com/auth/calendar.freebusy"
     ]
     assert query["access_type"] == ["offline"]
     assert query["include_granted_scopes"] == ["true"]
@@ -77,15 +78,13 @@ def test_google_callback_success_returns_redirect(oauth_modules, monkeypatch):
     monkeypatch.setattr(
         google_service.GoogleOAuthService,
         "exchange_code_for_tokens",
-        staticmethod(
-            lambda code: {"access_token": "access", "refresh_token": "refresh"}
-        ),
+        AsyncMock(return_value={"access_token": "access", "refresh_token": "refresh"}),
     )
     monkeypatch.setattr(
         google_service.GoogleOAuthService,
         "get_user_info",
-        staticmethod(
-            lambda token: {
+        AsyncMock(
+            return_value={
                 "google_id": "gid",
                 "email": "user@example.com",
                 "name": "User",
@@ -115,7 +114,7 @@ def test_google_callback_success_returns_redirect(oauth_modules, monkeypatch):
 def test_google_callback_propagates_http_exception(oauth_modules, monkeypatch):
     google_service = oauth_modules.google_service
 
-    def _raise_http_exc(code: str):
+    async def _raise_http_exc(code: str):
         raise HTTPException(status_code=400, detail="invalid code")
 
     monkeypatch.setattr(
@@ -140,13 +139,13 @@ def test_google_callback_wraps_unexpected_error(oauth_modules, monkeypatch):
     monkeypatch.setattr(
         google_service.GoogleOAuthService,
         "exchange_code_for_tokens",
-        staticmethod(lambda code: {"access_token": "a", "refresh_token": "r"}),
+        AsyncMock(return_value={"access_token": "a", "refresh_token": "r"}),
     )
     monkeypatch.setattr(
         google_service.GoogleOAuthService,
         "get_user_info",
-        staticmethod(
-            lambda token: {
+        AsyncMock(
+            return_value={
                 "google_id": "gid",
                 "email": "user@example.com",
                 "name": "User",
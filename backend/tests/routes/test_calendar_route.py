@@ -26,7 +26,10 @@ def setup_env(monkeypatch):
                 raise RuntimeError("httpx not installed")
 
         stub = types.SimpleNamespace(
-            AsyncClient=_StubAsyncClient, RequestError=_StubRequestError
+            AsyncClient=_StubAsyncClient,
+            RequestError=_StubRequestError,
+            Timeout=lambda *args, **kwargs: None,
+            Limits=lambda **kwargs: None,
         )
         sys.modules["httpx"] = stub
 
@@ -243,3 +246,202 @@ def test_list_events_scope_missing_from_service(route_module, monkeypatch):
     assert response.body == (
         b'{"code":"calendar_scope_missing","reauthUrl":"/user/google/login?force=1"}'
     )
+
+
+def test_webhook_marks_busy_store_stale_and_queues_recompute(
+    route_module, tmp_path, monkeypatch
+):
+    from fastapi import BackgroundTasks
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.future import select
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import NullPool
+
+    from app.db.base import Base
+    from app.models.calendar_sync_model import CalendarSyncState, CalendarWatchChannel
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'webhook.db'}", poolclass=NullPool
+    )
+    session_factory = sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    synced = []
+
+    async def _sync(user_id, db):
+        synced.append(user_id)
+
+    monkeypatch.setattr(route_module.AppointmentService, "sync_my_schedules", _sync)
+
+    monkeypatch.setattr(route_module, "AsyncSessionLocal", session_factory)
+
+    async def _notify(state, token="secret"):
+        background_tasks = BackgroundTasks()
+        async with session_factory() as session:
+            response = await route_module.calendar_webhook(
+                background_tasks=background_tasks,
+                x_goog_channel_id="channel",
+                x_goog_channel_token=token,
+                x_goog_resource_id="resource",
+                x_goog_resource_state=state,
+                db=session,
+            )
+        return response, [(task.func, task.args) for task in background_tasks.tasks]
+
+    async def _scenario():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_factory() as session:
+            session.add_all(
+                [
+                    CalendarWatchChannel(
+                        user_id="user",
+                        channel_id="channel",
+                        resource_id="resource",
+                        token="secret",
+                        expires_at=4_000_000_000,
+                    ),
+                    CalendarSyncState(
+                        user_id="user",
+                        timezone="Asia/Seoul",
+                        window_start=0,
+                        window_end=1,
+                    ),
+                ]
+            )
+            await session.commit()
+
+        # 채널 등록 직후의 sync 알림은 무시
+        assert await _notify("sync") == ({"status": "ignored"}, [])
+
+        assert await _notify("exists") == (
+            {"status": "accepted"},
+            [(route_module.recompute_user_availability, ("user",))],
+        )
+        # 재계산이 시작되기 전 알림은 이미 예약된 재계산에 합침
+        assert await _notify("exists") == ({"status": "accepted"}, [])
+
+        await route_module.recompute_user_availability("user")
+        assert synced == ["user"]
+        assert await _notify("exists") == (
+            {"status": "accepted"},
+            [(route_module.recompute_user_availability, ("user",))],
+        )
+
+        # 토큰이 다른 알림은 거부
+        with pytest.raises(HTTPException) as exc:
+            await _notify("exists", token="forged")
+        assert exc.value.status_code == 404
+
+        async with session_factory() as session:
+            result = await session.execute(
+                select(
+                    CalendarSyncState.change_count,
+                    CalendarSyncState.synced_change_count,
+                )
+            )
+            assert result.one() == (3, 0)
+
+        await engine.dispose()
+
+    asyncio.run(_scenario())
+
+
+def _patch_calendar_user(route_module, monkeypatch):
+    monkeypatch.setattr(route_module, "verify_token", lambda token: {"sub": "user"})
+
+    async def _get_user(*args, **kwargs):
+        return SimpleNamespace(google_refresh_token="refresh")
+
+    async def _refresh(refresh):
+        return "access"
+
+    monkeypatch.setattr(route_module.UserService, "get_user_by_google_id", _get_user)
+    monkeypatch.setattr(
+        route_module.GoogleCalendarService, "refresh_access_token", _refresh
+    )
+
+
+def test_batch_create_reports_per_item_results(route_module, monkeypatch):
+    _patch_calendar_user(route_module, monkeypatch)
+    received = {}
+
+    async def _batch_create(access_token, events):
+        received["events"] = events
+        return [
+            {
+                "index": 0,
+                "success": True,
+                "id": "e1",
+                "event": {
+                    "id": "e1",
+                    "summary": "회의",
+                    "htmlLink": "link",
+                    "status": "confirmed",
+                },
+            },
+            {"index": 1, "success": False, "error": "rate_limited"},
+        ]
+
+    monkeypatch.setattr(
+        route_module.GoogleCalendarService, "batch_create_events", _batch_create
+    )
+    event = {
+        "summary": "회의",
+        "start": {"dateTime": "2026-01-15T10:00:00+09:00"},
+        "end": {"dateTime": "2026-01-15T11:00:00+09:00"},
+    }
+
+    result = asyncio.run(
+        route_module.add_events_batch(
+            route_module.EventBatchCreateRequest(events=[event, event]),
+            db=SimpleNamespace(),
+            credentials=SimpleNamespace(scheme="Bearer", credentials="jwt"),
+        )
+    )
+
+    assert len(received["events"]) == 2
+    assert "description" not in received["events"][0]
+    assert result.succeeded == 1
+    assert result.failed == 1
+    assert result.results[0].event.id == "e1"
+    assert result.results[1].error == "rate_limited"
+
+
+def test_batch_delete_requires_reauth(route_module, monkeypatch):
+    _patch_calendar_user(route_module, monkeypatch)
+    invalidated = []
+
+    async def _batch_delete(access_token, event_ids):
+        raise HTTPException(status_code=401, detail="google_reauth_required")
+
+    monkeypatch.setattr(
+        route_module.GoogleCalendarService, "batch_delete_events", _batch_delete
+    )
+    monkeypatch.setattr(
+        route_module.GoogleCalendarService,
+        "invalidate_access_token",
+        invalidated.append,
+    )
+
+    response = asyncio.run(
+        route_module.delete_events_batch(
+            route_module.EventBatchDeleteRequest(event_ids=["a", "b"]),
+            db=SimpleNamespace(),
+            credentials=SimpleNamespace(scheme="Bearer", credentials="jwt"),
+        )
+    )
+
+    assert isinstance(response, JSONResponse)
+    assert response.status_code == 401
+    assert invalidated == ["refresh"]
+
+
+def test_batch_request_limits_event_count(route_module):
+    from pydantic import ValidationError
+
+    with pytest.raises(ValidationError):
+        route_module.EventBatchDeleteRequest(event_ids=["id"] * 51)
+    with pytest.raises(ValidationError):
+        route_module.EventBatchDeleteRequest(event_ids=[])
@@ -0,0 +1,49 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def client(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.setenv("SECRET_KEY", "secret")
+    monkeypatch.setenv("ALGORITHM", "HS256")
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URL_USER", "sqlite+aiosqlite:///:memory:")
+
+    import app.variable
+
+    importlib.reload(app.variable)
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    import app.routes.metrics_route as module
+
+    application = FastAPI()
+    application.include_router(module.router)
+    return TestClient(application), module
+
+
+def test_metrics_requires_authentication(client):
+    test_client, _ = client
+
+    response = test_client.get("/metrics/")
+
+    assert response.status_code in (401, 403)
+
+
+def test_metrics_returns_stats_for_authenticated_user(client):
+    test_client, module = client
+    test_client.app.dependency_overrides[module.get_current_user] = lambda: {
+        "sub": "user"
+    }
+
+    response = test_client.get("/metrics/")
+
+    assert response.status_code == 200
+    assert "google_rate_limit" in response.json()
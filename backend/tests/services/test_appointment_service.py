@@ -0,0 +1,674 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def service(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URL_USER", "sqlite+aiosqlite:///:memory:")
+
+    from app.services.appointment_service import AppointmentService
+    from app.utils.ttl_cache import TTLCache
+
+    monkeypatch.setattr(
+        AppointmentService, "_optimal_times_cache", TTLCache(16, ttl_seconds=60)
+    )
+    return AppointmentService
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_optimal_times_cached_per_availability_version(service, monkeypatch):
+    from app.services.availability_aggregate import AvailabilityAggregate
+
+    state = {"version": 3, "loads": 0}
+    aggregate = AvailabilityAggregate()
+    aggregate.set_member_slots(
+        "1",
+        [
+            {
+                "date": "2026-01-01",
+                "available_times": [{"start": "09:00", "end": "12:00"}],
+            }
+        ],
+    )
+
+    async def _version(appointment_id, db):
+        return state["version"]
+
+    async def _load(appointment_id, db):
+        state["loads"] += 1
+
+        class _Row:
+            version = state["version"]
+
+        return _Row(), aggregate, False
+
+    async def _dates(appointment_id, db):
+        from datetime import date
+        from types import SimpleNamespace
+
+        return [SimpleNamespace(candidate_date=date(2026, 1, 1))]
+
+    monkeypatch.setattr(service, "_get_availability_version", _version)
+    monkeypatch.setattr(service, "_load_availability", _load)
+    monkeypatch.setattr(service, "get_appointment_dates", _dates)
+
+    first = await service.calculate_optimal_times(1, 60, db=None)
+    second = await service.calculate_optimal_times(1, 60, db=None)
+    other_params = await service.calculate_optimal_times(1, 30, db=None)
+
+    assert second == first
+    assert other_params == first
+    assert state["loads"] == 2
+
+    # 참여자 가용시간이 바뀌어 버전이 올라가면 다시 계산
+    state["version"] = 4
+    await service.calculate_optimal_times(1, 60, db=None)
+
+    assert state["loads"] == 3
+    stats = service.optimal_times_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 3)
+
+
+@pytest.fixture
+async def session_factory(service):
+    from datetime import date, datetime
+
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.db.base import Base
+    from app.models.appointment_model import (
+        AppointmentAvailability,
+        AppointmentDates,
+        Appointments,
+        Participations,
+    )
+    from app.models.user_model import User
+    from app.services.availability_aggregate import AvailabilityAggregate
+
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    # 투표 중인 약속 두 개와 확정된 약속 하나에 참여한 사용자
+    async with factory() as db:
+        db.add(
+            User(
+                user_id="me",
+                email="me@example.com",
+                name="me",
+                google_refresh_token="refresh",
+                created_at=datetime(2026, 1, 1),
+            )
+        )
+        for appointment_id, status, dates in [
+            (1, "VOTING", [date(2026, 1, 2), date(2026, 1, 3)]),
+            (2, "VOTING", [date(2026, 1, 3)]),
+            (3, "CONFIRMED", [date(2026, 1, 4)]),
+        ]:
+            db.add(
+                Appointments(
+                    id=appointment_id,
+                    name=f"appointment {appointment_id}",
+                    creator_id="me",
+                    max_participants=4,
+                    status=status,
+                    invite_link=f"CODE{appointment_id}",
+                )
+            )
+            db.add_all(
+                AppointmentDates(appointment_id=appointment_id, candidate_date=d)
+                for d in dates
+            )
+            db.add(Participations(user_id="me", appointment_id=appointment_id))
+            db.add(
+                AppointmentAvailability(
+                    appointment_id=appointment_id,
+                    members=AvailabilityAggregate().header_json(),
+                    version=1,
+                )
+            )
+        await db.commit()
+
+    yield factory
+    await engine.dispose()
+
+
+def _patch_batch(monkeypatch, calls, failing=()):
+    import app.services.appointment_service as module
+
+    async def _batch(user, candidate_dates_by_key, *args, **kwargs):
+        calls.append(
+            {key: sorted(dates) for key, dates in candidate_dates_by_key.items()}
+        )
+        return {
+            key: (
+                None
+                if key in failing
+                else {
+                    "timezone": "Asia/Seoul",
+                    "slots": [
+                        {
+                            "date": min(dates).isoformat(),
+                            "available_times": [{"start": "09:00", "end": "10:00"}],
+                        }
+                    ],
+                }
+            )
+            for key, dates in candidate_dates_by_key.items()
+        }
+
+    monkeypatch.setattr(
+        module.ScheduleAnalyzer, "calculate_available_slots_batch", _batch
+    )
+
+
+async def _stored(session_factory):
+    import json
+
+    from sqlalchemy.future import select
+
+    from app.models.appointment_model import (
+        AppointmentAvailability,
+        Participations,
+    )
+
+    async with session_factory() as db:
+        rows = await db.execute(
+            select(Participations.appointment_id, Participations.available_slots)
+        )
+        slots = {key: value and json.loads(value) for key, value in rows.all()}
+        rows = await db.execute(
+            select(
+                AppointmentAvailability.appointment_id,
+                AppointmentAvailability.version,
+            )
+        )
+        return slots, dict(rows.all())
+
+
+@pytest.mark.anyio
+async def test_sync_my_schedules_computes_all_appointments_in_one_batch(
+    service, session_factory, monkeypatch
+):
+    from datetime import date
+
+    calls = []
+    _patch_batch(monkeypatch, calls)
+
+    async with session_factory() as db:
+        result = await service.sync_my_schedules("me", db)
+
+    assert result == {
+        "total_appointments": 2,
+        "updated_count": 2,
+        "failed_count": 0,
+        "results": [
+            {"appointment_id": 1, "status": "updated"},
+            {"appointment_id": 2, "status": "updated"},
+        ],
+    }
+    assert calls == [{1: [date(2026, 1, 2), date(2026, 1, 3)], 2: [date(2026, 1, 3)]}]
+
+    slots, versions = await _stored(session_factory)
+    assert slots[1]["slots"][0]["date"] == "2026-01-02"
+    assert slots[2]["slots"][0]["date"] == "2026-01-03"
+    assert slots[3] is None
+    assert versions == {1: 2, 2: 2, 3: 1}
+
+
+@pytest.mark.anyio
+async def test_sync_my_schedules_reports_failed_appointment_separately(
+    service, session_factory, monkeypatch
+):
+    _patch_batch(monkeypatch, [], failing={2})
+
+    async with session_factory() as db:
+        result = await service.sync_my_schedules("me", db)
+
+    assert (result["updated_count"], result["failed_count"]) == (1, 1)
+    assert result["results"][0] == {"appointment_id": 1, "status": "updated"}
+    assert result["results"][1]["appointment_id"] == 2
+    assert result["results"][1]["status"] == "failed"
+
+    slots, versions = await _stored(session_factory)
+    assert slots[2] is None
+    assert versions == {1: 2, 2: 1, 3: 1}
+
+
+@pytest.mark.anyio
+async def test_sync_my_schedules_keeps_slots_when_aggregate_update_fails(
+    service, session_factory, monkeypatch
+):
+    _patch_batch(monkeypatch, [])
+    apply_delta = service._apply_availability_delta
+
+    # 약속 2의 집계 반영이 도중에 실패
+    async def _apply(appointment_id, *args, **kwargs):
+        await apply_delta(appointment_id, *args, **kwargs)
+        if appointment_id == 2:
+            raise RuntimeError("aggregate update failed")
+
+    monkeypatch.setattr(service, "_apply_availability_delta", _apply)
+
+    async with session_factory() as db:
+        result = await service.sync_my_schedules("me", db)
+
+    assert [entry["status"] for entry in result["results"]] == ["updated", "failed"]
+
+    # 실패한 약속은 참여 정보와 집계 모두 이전 상태로 남음
+    slots, versions = await _stored(session_factory)
+    assert slots[1]["slots"][0]["date"] == "2026-01-02"
+    assert slots[2] is None
+    assert versions == {1: 2, 2: 1, 3: 1}
+
+
+@pytest.mark.anyio
+async def test_sync_my_schedules_reads_aggregates_only_after_fetch(
+    service, session_factory, monkeypatch
+):
+    from sqlalchemy import event
+
+    import app.services.appointment_service as module
+
+    calls = []
+    _patch_batch(monkeypatch, calls)
+    fetch = module.ScheduleAnalyzer.calculate_available_slots_batch
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    async def _batch(*args, **kwargs):
+        statements.append("fetch")
+        return await fetch(*args, **kwargs)
+
+    monkeypatch.setattr(
+        module.ScheduleAnalyzer, "calculate_available_slots_batch", _batch
+    )
+    engine = session_factory.kw["bind"].sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        async with session_factory() as db:
+            result = await service.sync_my_schedules("me", db)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    # 집계(잠금 대상)는 Google 조회가 끝난 뒤 약속 id 순서로만 읽음
+    assert result["updated_count"] == 2
+    fetched_at = statements.index("fetch")
+    aggregate_reads = [
+        index
+        for index, statement in enumerate(statements)
+        if statement.lstrip().upper().startswith("SELECT")
+        and "FROM appointment_availability " in statement
+    ]
+    assert len(aggregate_reads) == 2
+    assert min(aggregate_reads) > fetched_at
+
+
+@pytest.mark.anyio
+async def test_join_keeps_slots_out_when_aggregate_update_fails(
+    service, session_factory, monkeypatch
+):
+    from datetime import datetime
+
+    import app.services.appointment_service as module
+    from app.models.user_model import User
+
+    async def _calculate(**kwargs):
+        return {
+            "timezone": "Asia/Seoul",
+            "slots": [
+                {
+                    "date": "2026-01-02",
+                    "available_times": [{"start": "09:00", "end": "10:00"}],
+                }
+            ],
+        }
+
+    async def _fail(*args, **kwargs):
+        raise RuntimeError("aggregate update failed")
+
+    monkeypatch.setattr(
+        module.ScheduleAnalyzer, "calculate_available_slots", _calculate
+    )
+    monkeypatch.setattr(service, "_apply_availability_delta", _fail)
+
+    async with session_factory() as db:
+        db.add(
+            User(
+                user_id="guest",
+                email="guest@example.com",
+                name="guest",
+                google_refresh_token="refresh-guest",
+                created_at=datetime(2026, 1, 1),
+            )
+        )
+        await db.commit()
+        participation = await service.join_appointment("CODE1", "guest", db)
+
+    # 참여는 되지만 집계에 반영하지 못한 가용시간은 저장하지 않음
+    assert participation.available_slots is None
+
+
+@pytest.mark.anyio
+async def test_concurrent_first_rebuild_does_not_fail(service, monkeypatch, tmp_path):
+    import json
+    from datetime import date
+
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.future import select
+    from sqlalchemy.orm import sessionmaker
+
+    from app.db.base import Base
+    from app.models.appointment_model import (
+        AppointmentAvailability,
+        AppointmentDates,
+        Appointments,
+        Participations,
+    )
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'rebuild.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    # 집계가 없던 (이전에 만들어진) 약속
+    async with factory() as db:
+        db.add(
+            Appointments(
+                id=1,
+                name="old",
+                creator_id="me",
+                max_participants=4,
+                status="VOTING",
+                invite_link="OLD",
+            )
+        )
+        db.add(AppointmentDates(appointment_id=1, candidate_date=date(2026, 1, 2)))
+        db.add(
+            Participations(
+                user_id="me",
+                appointment_id=1,
+                available_slots=json.dumps(
+                    {
+                        "timezone": "Asia/Seoul",
+                        "slots": [
+                            {
+                                "date": "2026-01-02",
+                                "available_times": [{"start": "09:00", "end": "11:00"}],
+                            }
+                        ],
+                    }
+                ),
+            )
+        )
+        await db.commit()
+
+    load_user_slots = service._load_user_slots
+
+    # 재구성 도중 다른 요청이 같은 약속의 집계를 먼저 저장
+    async def _racing_load(appointment_id, db):
+        all_slots = await load_user_slots(appointment_id, db)
+        async with factory() as other:
+            other.add(
+                AppointmentAvailability(
+                    appointment_id=appointment_id, members="{}", version=1
+                )
+            )
+            await other.commit()
+        return all_slots
+
+    monkeypatch.setattr(service, "_load_user_slots", _racing_load)
+    try:
+        async with factory() as db:
+            optimal_times = await service.calculate_optimal_times(1, 60, db)
+        async with factory() as db:
+            rows = (await db.execute(select(AppointmentAvailability))).scalars().all()
+    finally:
+        await engine.dispose()
+
+    assert [(slot["start_time"], slot["end_time"]) for slot in optimal_times] == [
+        ("09:00", "11:00")
+    ]
+    assert len(rows) == 1
+
+
+async def _add_participants(session_factory):
+    from datetime import datetime
+
+    from app.models.appointment_model import Participations
+    from app.models.user_model import User
+
+    # a, b: 구글 연동 참석자 / nolink: 연동 정보 없음 / absent: 불참
+    async with session_factory() as db:
+        for user_id in ("a", "b"):
+            db.add(
+                User(
+                    user_id=user_id,
+                    email=f"{user_id}@example.com",
+                    name=user_id,
+                    google_refresh_token=f"refresh-{user_id}",
+                    created_at=datetime(2026, 1, 1),
+                )
+            )
+        db.add(Participations(user_id="nolink", appointment_id=1))
+        db.add(Participations(user_id="a", appointment_id=1))
+        db.add(Participations(user_id="b", appointment_id=1))
+        db.add(
+            Participations(user_id="absent", appointment_id=1, status="NOT_ATTENDING")
+        )
+        await db.commit()
+
+
+def _patch_google(monkeypatch, created, failing=()):
+    import asyncio
+
+    import app.services.appointment_service as module
+
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def _refresh(refresh_token):
+        return f"access-{refresh_token}"
+
+    async def _create(access_token, event_data):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+            if access_token in failing:
+                raise module.HTTPException(status_code=429, detail="rate_limited")
+            created.append((access_token, event_data))
+            return {"id": f"event-{access_token}", "htmlLink": "link"}
+        finally:
+            state["in_flight"] -= 1
+
+    monkeypatch.setattr(module.GoogleCalendarService, "refresh_access_token", _refresh)
+    monkeypatch.setattr(module.GoogleCalendarService, "create_event", _create)
+    return state
+
+
+@pytest.mark.anyio
+async def test_confirm_appointment_creates_events_for_attendees_concurrently(
+    service, session_factory, monkeypatch
+):
+    from datetime import date
+
+    import app.services.appointment_service as module
+    from app.models.appointment_model import AppointmentConfirmation, Appointments
+    from app.schema.appointment_schema import AppointmentConfirmRequest
+
+    await _add_participants(session_factory)
+    created = []
+    state = _patch_google(monkeypatch, created, failing={"access-refresh-b"})
+    monkeypatch.setattr(module, "CONFIRM_CONCURRENCY_LIMIT", 2)
+
+    async with session_factory() as db:
+        appointment = await db.get(Appointments, 1)
+        result = await service.confirm_appointment(
+            appointment,
+            AppointmentConfirmRequest(
+                date=date(2026, 1, 3), start_time="9:00", end_time="10:30"
+            ),
+            "me",
+            db,
+        )
+
+    assert (result["status"], result["start_time"], result["end_time"]) == (
+        "CONFIRMED",
+        "09:00",
+        "10:30",
+    )
+    assert (result["total_participants"], result["created_count"]) == (4, 2)
+    by_user = {entry["user_id"]: entry for entry in result["results"]}
+    assert set(by_user) == {"me", "a", "b", "nolink"}
+    assert by_user["a"]["event_id"] == "event-access-refresh-a"
+    assert by_user["b"] == {"user_id": "b", "status": "failed", "error": "rate_limited"}
+    assert by_user["nolink"]["status"] == "failed"
+
+    # 한도(2)까지만 동시에 생성
+    assert state["max_in_flight"] == 2
+    assert created[0][1]["start"] == {
+        "dateTime": "2026-01-03T09:00:00",
+        "timeZone": "Asia/Seoul",
+    }
+    assert created[0][1]["summary"] == "appointment 1"
+
+    async with session_factory() as db:
+        appointment = await db.get(Appointments, 1)
+        confirmation = await db.get(AppointmentConfirmation, 1)
+    assert appointment.status == "CONFIRMED"
+    assert (confirmation.confirmed_date, confirmation.confirmed_by) == (
+        date(2026, 1, 3),
+        "me",
+    )
+
+
+@pytest.mark.anyio
+async def test_confirm_appointment_rerun_retries_only_failed_participants(
+    service, session_factory, monkeypatch
+):
+    from datetime import date
+
+    from sqlalchemy.future import select
+
+    from app.models.appointment_model import (
+        AppointmentConfirmationEvent,
+        Appointments,
+    )
+    from app.schema.appointment_schema import AppointmentConfirmRequest
+
+    await _add_participants(session_factory)
+    request = AppointmentConfirmRequest(
+        date=date(2026, 1, 3), start_time="09:00", end_time="10:30"
+    )
+
+    async def _confirm(request):
+        async with session_factory() as db:
+            appointment = await db.get(Appointments, 1)
+            return await service.confirm_appointment(appointment, request, "me", db)
+
+    created = []
+    _patch_google(monkeypatch, created, failing={"access-refresh-b"})
+    first = await _confirm(request)
+    assert first["created_count"] == 2
+
+    # 같은 시간으로 다시 확정하면 실패한 참석자(b, 연동 없는 nolink)만 재시도
+    created.clear()
+    _patch_google(monkeypatch, created)
+    second = await _confirm(request)
+
+    assert [access_token for access_token, _ in created] == ["access-refresh-b"]
+    by_user = {entry["user_id"]: entry for entry in second["results"]}
+    assert by_user["a"]["event_id"] == "event-access-refresh-a"
+    assert by_user["b"]["event_id"] == "event-access-refresh-b"
+    assert by_user["nolink"]["status"] == "failed"
+    assert (second["created_count"], second["failed_count"]) == (3, 1)
+
+    async with session_factory() as db:
+        rows = await db.execute(
+            select(
+                AppointmentConfirmationEvent.user_id,
+                AppointmentConfirmationEvent.status,
+            )
+        )
+    assert dict(rows.all()) == {
+        "me": "created",
+        "a": "created",
+        "b": "created",
+        "nolink": "failed",
+    }
+
+    # 다른 시간으로는 다시 확정할 수 없음
+    with pytest.raises(ValueError):
+        await _confirm(
+            AppointmentConfirmRequest(
+                date=date(2026, 1, 3), start_time="11:00", end_time="12:00"
+            )
+        )
+
+
+@pytest.mark.anyio
+async def test_confirm_appointment_rejects_invalid_requests(
+    service, session_factory, monkeypatch
+):
+    from datetime import date
+
+    from app.models.appointment_model import Appointments
+    from app.schema.appointment_schema import AppointmentConfirmRequest
+
+    created = []
+    _patch_google(monkeypatch, created)
+
+    cases = [
+        # 이미 확정된 약속
+        (
+            3,
+            AppointmentConfirmRequest(
+                date=date(2026, 1, 4), start_time="09:00", end_time="10:00"
+            ),
+        ),
+        # 후보 날짜가 아님
+        (
+            1,
+            AppointmentConfirmRequest(
+                date=date(2026, 1, 9), start_time="09:00", end_time="10:00"
+            ),
+        ),
+        # 종료 시간이 시작 시간보다 빠름
+        (
+            1,
+            AppointmentConfirmRequest(
+                date=date(2026, 1, 2), start_time="11:00", end_time="10:00"
+            ),
+        ),
+        (
+            1,
+            AppointmentConfirmRequest(
+                date=date(2026, 1, 2), start_time="9시", end_time="10:00"
+            ),
+        ),
+    ]
+    async with session_factory() as db:
+        for appointment_id, request in cases:
+            appointment = await db.get(Appointments, appointment_id)
+            with pytest.raises(ValueError):
+                await service.confirm_appointment(appointment, request, "me", db)
+
+    async with session_factory() as db:
+        appointment = await db.get(Appointments, 1)
+    assert appointment.status == "VOTING"
+    assert created == []
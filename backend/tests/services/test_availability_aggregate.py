@@ -0,0 +1,199 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def modules():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    from app.services.availability_aggregate import AvailabilityAggregate
+    from app.services.schedule_analyzer import ScheduleAnalyzer
+
+    return AvailabilityAggregate, ScheduleAnalyzer
+
+
+def _slots(*entries):
+    return [
+        {
+            "date": date_str,
+            "available_times": [{"start": s, "end": e} for s, e in ranges],
+        }
+        for date_str, ranges in entries
+    ]
+
+
+USER_SLOTS = [
+    {
+        "user_id": "1",
+        "slots": _slots(("2026-01-01", [("09:00", "12:00"), ("14:00", "18:00")])),
+    },
+    {
+        "user_id": "2",
+        "slots": _slots(
+            ("2026-01-01", [("10:00", "11:30")]), ("2026-01-02", [("09:00", "10:00")])
+        ),
+    },
+    {"user_id": "3", "slots": _slots(("2026-01-01", [("09:30", "15:00")]))},
+]
+
+
+def test_build_matches_find_common_slots(modules):
+    aggregate_cls, analyzer = modules
+
+    aggregate = aggregate_cls.build(USER_SLOTS)
+
+    assert aggregate.find_common_slots(30) == analyzer.find_common_slots(USER_SLOTS, 30)
+
+
+def test_incremental_updates_match_full_rebuild(modules):
+    aggregate_cls, _ = modules
+
+    aggregate = aggregate_cls()
+    for user_data in USER_SLOTS:
+        aggregate.set_member_slots(user_data["user_id"], user_data["slots"])
+
+    assert aggregate.find_common_slots(30) == aggregate_cls.build(
+        USER_SLOTS
+    ).find_common_slots(30)
+
+    # 한 참여자의 가용시간만 교체
+    changed = _slots(("2026-01-01", [("13:00", "16:00")]))
+    aggregate.set_member_slots("1", changed)
+    expected = [USER_SLOTS[1], USER_SLOTS[2], {"user_id": "1", "slots": changed}]
+
+    assert aggregate.find_common_slots(30) == aggregate_cls.build(
+        expected
+    ).find_common_slots(30)
+
+
+def test_remove_member_reuses_bit_position(modules):
+    aggregate_cls, _ = modules
+
+    aggregate = aggregate_cls.build(USER_SLOTS)
+    aggregate.remove_member("1")
+
+    assert aggregate.members == [None, "2", "3"]
+    assert aggregate.participant_count == 2
+    assert all(
+        "1" not in slot["participant_ids"] for slot in aggregate.find_common_slots(0)
+    )
+
+    aggregate.set_member_slots("4", _slots(("2026-01-01", [("10:00", "11:00")])))
+
+    assert aggregate.members[0] == "4"
+    assert aggregate.participant_count == 3
+
+
+def test_day_rows_round_trip(modules):
+    aggregate_cls, _ = modules
+
+    aggregate = aggregate_cls.build(USER_SLOTS)
+    restored = aggregate_cls.from_header_json(aggregate.header_json())
+    restored.load_days(aggregate.day_rows().values())
+
+    assert restored.members == aggregate.members
+    assert restored.segments == aggregate.segments
+
+    with pytest.raises(ValueError):
+        aggregate_cls.from_header_json('{"format": 1, "members": [], "dates": {}}')
+
+
+def test_member_delta_touches_only_affected_days(modules):
+    aggregate_cls, _ = modules
+
+    aggregate = aggregate_cls.build(USER_SLOTS)
+    rows = aggregate.day_rows()
+    changed = _slots(("2026-01-01", [("10:00", "11:00")]))
+    intervals = aggregate_cls.member_intervals(changed)
+
+    # 영향받는 날짜 행만 읽어 변경한 결과가 전체 재구성과 같아야 함
+    partial = aggregate_cls.from_header_json(aggregate.header_json())
+    days = partial.affected_days("3", intervals)
+    partial.load_days(rows[day] for day in days if day in rows)
+    partial.set_member_intervals("3", intervals)
+
+    expected = aggregate_cls.build(
+        [
+            (
+                {**user_data, "slots": changed}
+                if user_data["user_id"] == "3"
+                else user_data
+            )
+            for user_data in USER_SLOTS
+        ]
+    )
+    merged = {**rows, **dict.fromkeys(days)}
+    merged.update(partial.day_rows(days))
+    restored = aggregate_cls.from_header_json(partial.header_json())
+    restored.load_days(value for value in merged.values() if value is not None)
+
+    assert len(days) < len(rows)
+    assert restored.find_common_slots(0) == expected.find_common_slots(0)
+
+
+def test_time_range_filter_matches_clipped_slots(modules):
+    aggregate_cls, analyzer = modules
+
+    # USER_SLOTS를 10:00~15:00으로 잘라낸 가용시간
+    clipped = [
+        {
+            "user_id": "1",
+            "slots": _slots(("2026-01-01", [("10:00", "12:00"), ("14:00", "15:00")])),
+        },
+        {"user_id": "2", "slots": _slots(("2026-01-01", [("10:00", "11:30")]))},
+        {"user_id": "3", "slots": _slots(("2026-01-01", [("10:00", "15:00")]))},
+    ]
+
+    aggregate = aggregate_cls.build(USER_SLOTS)
+
+    assert aggregate.find_common_slots(
+        30, time_range_start="10:00", time_range_end="15:00"
+    ) == analyzer.find_common_slots(clipped, 30)
+
+
+def test_members_in_other_timezones_share_one_timeline(modules):
+    aggregate_cls, analyzer = modules
+
+    user_slots = USER_SLOTS + [
+        {
+            "user_id": "4",
+            "slots": _slots(("2025-12-31", [("19:00", "23:00")])),
+            "timezone": "America/New_York",
+        }
+    ]
+
+    aggregate = aggregate_cls()
+    for user_data in user_slots:
+        aggregate.set_member_slots(
+            user_data["user_id"], user_data["slots"], user_data.get("timezone")
+        )
+
+    result = aggregate.find_common_slots(30, limit=1)
+
+    assert result == analyzer.find_common_slots(user_slots, 30, limit=1)
+    assert result[0]["participant_ids"] == ["1", "2", "3", "4"]
+
+
+def test_blocks_stay_on_candidate_dates(modules):
+    aggregate_cls, analyzer = modules
+
+    # UTC 10:00~20:00 == 서울 19:00~다음날 05:00
+    user_slots = [
+        {
+            "user_id": "1",
+            "slots": _slots(("2026-01-01", [("10:00", "20:00")])),
+            "timezone": "UTC",
+        }
+    ]
+    aggregate = aggregate_cls.build(user_slots)
+
+    result = aggregate.find_common_slots(30, dates=["2026-01-01"])
+
+    assert result == analyzer.find_common_slots(user_slots, 30)
+    assert [(r["date"], r["start_time"], r["end_time"]) for r in result] == [
+        ("2026-01-01", "19:00", "23:59")
+    ]
@@ -0,0 +1,336 @@
+import sys
+from datetime import date
+from pathlib import Path
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def sync_module():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    import app.services.calendar_sync_service as module
+
+    return module
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class _FakeGoogleCalendar:
+    """events.list의 전체/증분 동기화를 흉내 내는 로컬 엔드포인트"""
+
+    def __init__(self):
+        self.requests = []
+        self.expired_tokens = set()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        self.requests.append(params)
+        assert "orderBy" not in params
+
+        sync_token = params.get("syncToken")
+        if sync_token in self.expired_tokens:
+            return httpx.Response(410, json={"error": {"message": "Gone"}})
+
+        if sync_token is None:
+            assert "timeMin" in params and "timeMax" in params
+            if params.get("pageToken") is None:
+                return httpx.Response(
+                    200,
+                    json={
+                        "items": [_event("a", "2026-01-05T10:00:00+09:00", 60)],
+                        "nextPageToken": "page-2",
+                    },
+                )
+            return httpx.Response(
+                200,
+                json={
+                    "items": [
+                        _event("b", "2026-01-05T14:00:00+09:00", 60),
+                        {
+                            **_event("free", "2026-01-05T16:00:00+09:00", 60),
+                            "transparency": "transparent",
+                        },
+                    ],
+                    "nextSyncToken": "token-1",
+                },
+            )
+
+        assert "timeMin" not in params
+        # token-1 이후 변경분: a 삭제, c 추가
+        return httpx.Response(
+            200,
+            json={
+                "items": [
+                    {"id": "a", "status": "cancelled"},
+                    _event("c", "2026-01-05T18:00:00+09:00", 30),
+                ],
+                "nextSyncToken": "token-2",
+            },
+        )
+
+
+def _event(event_id, start, minutes):
+    from datetime import datetime, timedelta
+
+    start_dt = datetime.fromisoformat(start)
+    return {
+        "id": event_id,
+        "status": "confirmed",
+        "start": {"dateTime": start},
+        "end": {"dateTime": (start_dt + timedelta(minutes=minutes)).isoformat()},
+    }
+
+
+@pytest.fixture
+def fake_google(sync_module, monkeypatch):
+    fake = _FakeGoogleCalendar()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))
+    monkeypatch.setattr(sync_module.GoogleCalendarService, "_client", client)
+    return fake
+
+
+def _window(sync_module):
+    from app.utils.time_interval import get_zone, local_to_epoch_minutes
+
+    zone = get_zone("Asia/Seoul")
+    return sync_module.TimeInterval(
+        local_to_epoch_minutes(date(2026, 1, 5), 0, zone),
+        local_to_epoch_minutes(date(2026, 1, 6), 0, zone),
+    )
+
+
+def _local(sync_module, intervals):
+    from app.utils.time_interval import epoch_minutes_to_local, format_hhmm, get_zone
+
+    zone = get_zone("Asia/Seoul")
+    return [
+        tuple(format_hhmm(epoch_minutes_to_local(point, zone)[1]) for point in interval)
+        for interval in intervals
+    ]
+
+
+@pytest.mark.anyio
+async def test_full_sync_then_incremental_delta(sync_module, fake_google):
+    service = sync_module.CalendarSyncService
+    state = sync_module.CalendarSyncState(user_id="user", busy_events="{}")
+    window = _window(sync_module)
+
+    await service.sync(state, "access", window, "Asia/Seoul")
+
+    assert state.sync_token == "token-1"
+    assert [request.get("pageToken") for request in fake_google.requests] == [
+        None,
+        "page-2",
+    ]
+    assert _local(sync_module, service.busy_timeline(state, window)) == [
+        ("10:00", "11:00"),
+        ("14:00", "15:00"),
+    ]
+
+    await service.sync(state, "access", window, "Asia/Seoul")
+
+    assert fake_google.requests[-1]["syncToken"] == "token-1"
+    assert state.sync_token == "token-2"
+    assert _local(sync_module, service.busy_timeline(state, window)) == [
+        ("14:00", "15:00"),
+        ("18:00", "18:30"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_expired_sync_token_triggers_full_resync(sync_module, fake_google):
+    service = sync_module.CalendarSyncService
+    state = sync_module.CalendarSyncState(user_id="user", busy_events="{}")
+    window = _window(sync_module)
+
+    await service.sync(state, "access", window, "Asia/Seoul")
+    fake_google.expired_tokens.add("token-1")
+    fake_google.requests.clear()
+
+    await service.sync(state, "access", window, "Asia/Seoul")
+
+    assert fake_google.requests[0]["syncToken"] == "token-1"
+    assert "syncToken" not in fake_google.requests[1]
+    assert state.sync_token == "token-1"
+    assert _local(sync_module, service.busy_timeline(state, window)) == [
+        ("10:00", "11:00"),
+        ("14:00", "15:00"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_window_outside_synced_range_runs_full_sync(sync_module, fake_google):
+    service = sync_module.CalendarSyncService
+    state = sync_module.CalendarSyncState(user_id="user", busy_events="{}")
+    window = _window(sync_module)
+
+    await service.sync(state, "access", window, "Asia/Seoul")
+    fake_google.requests.clear()
+
+    later = sync_module.TimeInterval(state.window_end, state.window_end + 60)
+    await service.sync(state, "access", later, "Asia/Seoul")
+
+    assert "syncToken" not in fake_google.requests[0]
+    assert state.window_end >= later.end
+
+
+@pytest.mark.anyio
+async def test_notification_marks_store_stale_until_next_sync(sync_module, fake_google):
+    service = sync_module.CalendarSyncService
+    state = sync_module.CalendarSyncState(
+        user_id="user", busy_events="{}", change_count=0, synced_change_count=0
+    )
+    window = _window(sync_module)
+
+    assert not service.is_fresh(state, window, "Asia/Seoul")
+    await service.sync(state, "access", window, "Asia/Seoul")
+    assert service.is_fresh(state, window, "Asia/Seoul")
+
+    # 웹훅이 알림 카운터를 올리면 다음 조회에서 다시 동기화
+    state.change_count += 1
+    assert not service.is_fresh(state, window, "Asia/Seoul")
+
+    await service.sync(state, "access", window, "Asia/Seoul")
+    assert service.is_fresh(state, window, "Asia/Seoul")
+    assert not service.is_fresh(state, window, "America/New_York")
+
+
+@pytest.mark.anyio
+async def test_recent_sync_is_fresh_until_ttl_expires(sync_module, fake_google):
+    service = sync_module.CalendarSyncService
+    state = sync_module.CalendarSyncState(
+        user_id="user", busy_events="{}", change_count=0, synced_change_count=0
+    )
+    window = _window(sync_module)
+
+    await service.sync(state, "access", window, "Asia/Seoul")
+    ttl = sync_module.CALENDAR_SYNC_FRESHNESS_SECONDS
+
+    # 다른 약속의 날짜라도 동기화 범위 안이면 Google을 다시 부르지 않음
+    other_day = sync_module.TimeInterval(window.end, window.end + 24 * 60)
+    assert service.is_fresh(state, other_day, "Asia/Seoul", now=state.synced_at)
+    assert not service.is_fresh(state, window, "Asia/Seoul", now=state.synced_at + ttl)
+    # 알림 채널이 살아 있으면 더 긴 유효기간 적용 (알림 유실 대비 최대 유효기간은 있음)
+    watched_ttl = sync_module.CALENDAR_SYNC_WATCHED_FRESHNESS_SECONDS
+    assert service.is_fresh(
+        state, window, "Asia/Seoul", watching=True, now=state.synced_at + ttl
+    )
+    assert not service.is_fresh(
+        state, window, "Asia/Seoul", watching=True, now=state.synced_at + watched_ttl
+    )
+
+
+@pytest.mark.anyio
+async def test_concurrent_first_sync_keeps_existing_state(
+    sync_module, fake_google, monkeypatch, tmp_path
+):
+    from sqlalchemy import func
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.future import select
+    from sqlalchemy.orm import sessionmaker
+
+    from app.db.base import Base
+
+    monkeypatch.setattr(
+        sync_module.CalendarWatchService, "is_enabled", staticmethod(lambda: False)
+    )
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'sync.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    service = sync_module.CalendarSyncService
+    window = _window(sync_module)
+    sync = service.sync
+
+    # 첫 동기화 도중 다른 요청이 같은 사용자의 저장소를 먼저 생성
+    async def _racing_sync(state, *args):
+        await sync(state, *args)
+        async with factory() as other:
+            other.add(
+                sync_module.CalendarSyncState(
+                    user_id=state.user_id,
+                    busy_events=state.busy_events,
+                    sync_token=state.sync_token,
+                    timezone=state.timezone,
+                    window_start=state.window_start,
+                    window_end=state.window_end,
+                )
+            )
+            await other.commit()
+
+    monkeypatch.setattr(service, "sync", _racing_sync)
+    try:
+        async with factory() as db:
+            busy = await service.get_busy_timeline(
+                "user", "access", window, "Asia/Seoul", db
+            )
+        async with factory() as db:
+            count = await db.scalar(
+                select(func.count()).select_from(sync_module.CalendarSyncState)
+            )
+    finally:
+        await engine.dispose()
+
+    assert _local(sync_module, busy) == [("10:00", "11:00"), ("14:00", "15:00")]
+    assert count == 1
+
+
+@pytest.mark.anyio
+async def test_concurrent_first_watch_keeps_one_channel(
+    sync_module, monkeypatch, tmp_path
+):
+    import app.services.calendar_watch_service as watch_module
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.db.base import Base
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'watch.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    calendar = watch_module.GoogleCalendarService
+    stopped = []
+
+    # 채널 등록 도중 다른 요청이 같은 사용자의 채널을 먼저 저장
+    async def _watch(access_token, channel_id, **kwargs):
+        async with factory() as other:
+            other.add(
+                watch_module.CalendarWatchChannel(
+                    user_id="user",
+                    channel_id="winner",
+                    resource_id="resource-winner",
+                    token="token",
+                    expires_at=4_000_000_000,
+                )
+            )
+            await other.commit()
+        return {"resourceId": "resource-loser", "expiration": 4_000_000_000_000}
+
+    async def _stop(access_token, channel_id, resource_id):
+        stopped.append((channel_id, resource_id))
+
+    monkeypatch.setattr(watch_module, "GOOGLE_WEBHOOK_URL", "https://example.com")
+    monkeypatch.setattr(calendar, "watch_events", _watch)
+    monkeypatch.setattr(calendar, "stop_channel", _stop)
+    try:
+        async with factory() as db:
+            channel = await watch_module.CalendarWatchService.ensure_channel(
+                "user", "access", db
+            )
+            await db.commit()
+    finally:
+        await engine.dispose()
+
+    assert channel.channel_id == "winner"
+    assert stopped == [(stopped[0][0], "resource-loser")]
+    assert stopped[0][0] != "winner"
@@ -0,0 +1,86 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def executor_module(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    import app.services.compute_executor as module
+
+    module.ComputeExecutor.reset_stats()
+    yield module
+    module.ComputeExecutor.shutdown()
+    module.ComputeExecutor.reset_stats()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+USER_SLOTS = [
+    {
+        "user_id": 1,
+        "slots": [
+            {
+                "date": "2026-01-01",
+                "available_times": [{"start": "09:00", "end": "12:00"}],
+            }
+        ],
+    },
+    {
+        "user_id": 2,
+        "slots": [
+            {
+                "date": "2026-01-01",
+                "available_times": [{"start": "10:00", "end": "11:00"}],
+            }
+        ],
+    },
+]
+
+
+@pytest.mark.anyio
+async def test_small_jobs_run_inline(executor_module, monkeypatch):
+    from app.services.schedule_analyzer import ScheduleAnalyzer
+
+    executor = executor_module.ComputeExecutor
+
+    def _fail_pool():
+        raise AssertionError("small jobs must not use the pool")
+
+    monkeypatch.setattr(executor, "_get_pool", _fail_pool)
+
+    result = await executor.run(
+        ScheduleAnalyzer.find_common_slots, USER_SLOTS, 30, limit=1, size=2
+    )
+
+    assert result == ScheduleAnalyzer.find_common_slots(USER_SLOTS, 30, limit=1)
+    stats = executor.stats()
+    assert stats["jobs"]["inline"]["count"] == 1
+    assert "pool" not in stats["jobs"]
+
+
+@pytest.mark.anyio
+async def test_large_jobs_run_in_process_pool(executor_module, monkeypatch):
+    from app.services.availability_aggregate import AvailabilityAggregate
+
+    monkeypatch.setattr(executor_module, "COMPUTE_POOL_WORKERS", 1)
+    monkeypatch.setattr(executor_module, "COMPUTE_INLINE_THRESHOLD", 1)
+    executor = executor_module.ComputeExecutor
+
+    aggregate = AvailabilityAggregate.build(USER_SLOTS)
+    result = await executor.run(
+        aggregate.find_common_slots, 30, limit=1, size=len(aggregate.segments)
+    )
+
+    assert result == aggregate.find_common_slots(30, limit=1)
+    stats = executor.stats()
+    assert stats["jobs"]["pool"]["count"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
@@ -1,6 +1,8 @@
 import asyncio
 import importlib
+import importlib.util
 import inspect
+import json
 import sys
 from pathlib import Path
 from typing import Any, Dict
@@ -16,7 +18,7 @@ def setup_env(monkeypatch):
     if str(root_dir) not in sys.path:
         sys.path.insert(0, str(root_dir))
 
-    if "httpx" not in sys.modules:
+    if "httpx" not in sys.modules and importlib.util.find_spec("httpx") is None:
         import types
 
         class _StubRequestError(Exception):
@@ -30,12 +32,17 @@ def setup_env(monkeypatch):
                 pass
 
         stub = types.SimpleNamespace(
-            AsyncClient=_StubAsyncClient, RequestError=_StubRequestError
+            AsyncClient=_StubAsyncClient,
+            RequestError=_StubRequestError,
+            Timeout=lambda *args, **kwargs: None,
+            Limits=lambda **kwargs: None,
         )
         sys.modules["httpx"] = stub
 
     monkeypatch.setenv("GOOGLE_CLIENT_ID", "client")
     monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "secret")
+    # 재시도 백오프 대기 없이 실행
+    monkeypatch.setenv("GOOGLE_RETRY_BASE_DELAY_SECONDS", "0")
 
     import app.variable
 
@@ -135,6 +142,7 @@ async def test_get_client_reuses_instance(service_module, monkeypatch):
     assert client1 is client2
     assert created["count"] == 1
     assert created["kwargs"]["timeout"] == service_module.GoogleCalendarService._TIMEOUT
+    assert created["kwargs"]["limits"] == service_module.GoogleCalendarService._LIMITS
 
     await service_module.GoogleCalendarService.close_client()
     assert client1.closed is True
@@ -231,6 +239,52 @@ async def test_refresh_access_token_server_error(service_module, monkeypatch):
     assert exc.value.status_code == 500
 
 
+@pytest.mark.anyio
+async def test_refresh_access_token_cached_until_expiry_margin(
+    service_module, monkeypatch
+):
+    responses = [
+        _FakeResponse(data={"access_token": "first", "expires_in": 3599}),
+        _FakeResponse(data={"access_token": "second", "expires_in": 60}),
+    ]
+    client = _FakeClient(post=lambda *args, **kwargs: responses.pop(0))
+    _override_client(monkeypatch, service_module, client)
+    service = service_module.GoogleCalendarService
+
+    assert await service.refresh_access_token("refresh") == "first"
+    assert await service.refresh_access_token("refresh") == "first"
+    assert len(client.post_calls) == 1
+
+    # 401을 받으면 캐시를 비우고, 여유 시간보다 짧게 남은 토큰은 캐시하지 않음
+    service.invalidate_access_token("refresh")
+    assert await service.refresh_access_token("refresh") == "second"
+    assert "second" not in service._token_cache._entries.values()
+
+
+@pytest.mark.anyio
+async def test_concurrent_refreshes_share_one_request(service_module, monkeypatch):
+    release = asyncio.Event()
+
+    async def _post(*args, **kwargs):
+        await release.wait()
+        return _FakeResponse(data={"access_token": "token", "expires_in": 3599})
+
+    client = _FakeClient(post=_post)
+    _override_client(monkeypatch, service_module, client)
+    service = service_module.GoogleCalendarService
+
+    tasks = [
+        asyncio.create_task(service.refresh_access_token(refresh))
+        for refresh in ("refresh", "refresh", "refresh", "other")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["token"] * 4
+    # 사용자(refresh token)별로 한 번씩만 요청
+    assert len(client.post_calls) == 2
+
+
 @pytest.mark.anyio
 async def test_list_primary_events_success(service_module, monkeypatch):
     response = _FakeResponse(
@@ -337,3 +391,463 @@ async def test_list_primary_events_scope_missing_from_google_message(
 
     assert exc.value.status_code == 400
     assert exc.value.detail == "calendar_scope_missing"
+
+
+@pytest.mark.anyio
+async def test_query_free_busy_success(service_module, monkeypatch):
+    busy = [{"start": "2024-01-01T01:00:00Z", "end": "2024-01-01T02:00:00Z"}]
+    response = _FakeResponse(data={"calendars": {"primary": {"busy": busy}}})
+    client = _FakeClient(post=lambda *args, **kwargs: response)
+    _override_client(monkeypatch, service_module, client)
+
+    result = await service_module.GoogleCalendarService.query_free_busy(
+        "access",
+        time_min="2024-01-01T00:00:00Z",
+        time_max="2024-01-02T00:00:00Z",
+    )
+
+    assert result == busy
+    call = client.post_calls[0]
+    assert call["args"][0] == service_module.GoogleCalendarService.FREE_BUSY_URL
+    assert call["kwargs"]["json"] == {
+        "timeMin": "2024-01-01T00:00:00Z",
+        "timeMax": "2024-01-02T00:00:00Z",
+        "timeZone": "Asia/Seoul",
+        "items": [{"id": "primary"}],
+    }
+    assert call["kwargs"]["headers"] == {"Authorization": "Bearer access"}
+
+
+@pytest.mark.anyio
+async def test_query_free_busy_insufficient_scope(service_module, monkeypatch):
+    response = _FakeResponse(
+        status_code=403,
+        data={"error": {"errors": [{"reason": "insufficientPermissions"}]}},
+    )
+    client = _FakeClient(post=lambda *args, **kwargs: response)
+    _override_client(monkeypatch, service_module, client)
+
+    with pytest.raises(HTTPException) as exc:
+        await service_module.GoogleCalendarService.query_free_busy(
+            "access", time_min="a", time_max="b"
+        )
+
+    assert exc.value.status_code == 403
+    assert exc.value.detail == "insufficient_scope"
+
+
+@pytest.mark.anyio
+async def test_query_free_busy_calendar_error(service_module, monkeypatch):
+    response = _FakeResponse(
+        data={
+            "calendars": {
+                "primary": {"errors": [{"domain": "global", "reason": "backendError"}]}
+            }
+        }
+    )
+    client = _FakeClient(post=lambda *args, **kwargs: response)
+    _override_client(monkeypatch, service_module, client)
+
+    with pytest.raises(HTTPException) as exc:
+        await service_module.GoogleCalendarService.query_free_busy(
+            "access", time_min="a", time_max="b"
+        )
+
+    assert exc.value.status_code == 500
+
+
+@pytest.mark.anyio
+async def test_iter_primary_events_follows_page_tokens(service_module, monkeypatch):
+    responses = [
+        _FakeResponse(data={"items": [{"id": "1"}], "nextPageToken": "next"}),
+        _FakeResponse(data={"items": [{"id": "2"}]}),
+    ]
+    client = _FakeClient(get=lambda *args, **kwargs: responses.pop(0))
+    _override_client(monkeypatch, service_module, client)
+
+    pages = [
+        page
+        async for page in service_module.GoogleCalendarService.iter_primary_events(
+            "access",
+            time_min="2024-01-01T00:00:00Z",
+            time_max="2024-02-01T00:00:00Z",
+            fields="items(start,end),nextPageToken",
+        )
+    ]
+
+    assert [page["events"] for page in pages] == [[{"id": "1"}], [{"id": "2"}]]
+    params = [call["kwargs"]["params"] for call in client.get_calls]
+    assert "pageToken" not in params[0]
+    assert params[1]["pageToken"] == "next"
+    assert params[1]["maxResults"] == "250"
+    assert params[1]["fields"] == "items(start,end),nextPageToken"
+
+
+@pytest.mark.anyio
+async def test_watch_events_registers_channel(service_module, monkeypatch):
+    response = _FakeResponse(
+        data={"id": "channel", "resourceId": "resource", "expiration": "1700000000000"}
+    )
+    client = _FakeClient(post=lambda *args, **kwargs: response)
+    _override_client(monkeypatch, service_module, client)
+
+    result = await service_module.GoogleCalendarService.watch_events(
+        "access",
+        channel_id="channel",
+        address="https://example.com/calendar/webhook",
+        token="secret",
+        ttl_seconds=3600,
+    )
+
+    assert result == {
+        "id": "channel",
+        "resourceId": "resource",
+        "expiration": 1700000000000,
+    }
+    call = client.post_calls[0]
+    assert call["args"][0] == service_module.GoogleCalendarService.WATCH_URL
+    assert call["kwargs"]["json"] == {
+        "id": "channel",
+        "type": "web_hook",
+        "address": "https://example.com/calendar/webhook",
+        "token": "secret",
+        "params": {"ttl": "3600"},
+    }
+
+
+@pytest.mark.anyio
+async def test_stop_channel_ignores_expired_channel(service_module, monkeypatch):
+    client = _FakeClient(post=lambda *args, **kwargs: _FakeResponse(status_code=404))
+    _override_client(monkeypatch, service_module, client)
+
+    await service_module.GoogleCalendarService.stop_channel(
+        "access", channel_id="channel", resource_id="resource"
+    )
+
+    assert client.post_calls[0]["kwargs"]["json"] == {
+        "id": "channel",
+        "resourceId": "resource",
+    }
+
+
+def _record_sleeps(monkeypatch, service_module):
+    delays = []
+
+    async def _sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(
+        service_module.GoogleCalendarService, "_sleep", staticmethod(_sleep)
+    )
+    return delays
+
+
+@pytest.mark.anyio
+async def test_idempotent_call_retries_transient_errors(service_module, monkeypatch):
+    responses = [
+        _FakeResponse(status_code=503),
+        _FakeResponse(
+            status_code=403,
+            data={"error": {"errors": [{"reason": "userRateLimitExceeded"}]}},
+        ),
+        _FakeResponse(data={"items": [{"id": "1"}]}),
+    ]
+    client = _FakeClient(get=lambda *args, **kwargs: responses.pop(0))
+    _override_client(monkeypatch, service_module, client)
+    delays = _record_sleeps(monkeypatch, service_module)
+
+    result = await service_module.GoogleCalendarService.list_primary_events(
+        "access", time_min=None, time_max=None
+    )
+
+    assert result["events"] == [{"id": "1"}]
+    assert len(client.get_calls) == 3
+    assert len(delays) == 2
+
+
+@pytest.mark.anyio
+async def test_retry_after_header_is_honored_within_budget(service_module, monkeypatch):
+    rate_limited = _FakeResponse(status_code=429)
+    rate_limited.headers = {"Retry-After": "2"}
+    too_long = _FakeResponse(status_code=429)
+    too_long.headers = {"Retry-After": "3600"}
+    responses = [rate_limited, too_long]
+    client = _FakeClient(post=lambda *args, **kwargs: responses.pop(0))
+    _override_client(monkeypatch, service_module, client)
+    delays = _record_sleeps(monkeypatch, service_module)
+
+    # 두 번째 Retry-After는 재시도 예산을 넘으므로 기다리지 않고 실패
+    with pytest.raises(HTTPException) as exc:
+        await service_module.GoogleCalendarService.query_free_busy(
+            "access", time_min="a", time_max="b"
+        )
+
+    assert exc.value.status_code == 429
+    assert delays == [2.0]
+    assert len(client.post_calls) == 2
+
+
+@pytest.mark.anyio
+async def test_create_event_is_not_retried(service_module, monkeypatch):
+    client = _FakeClient(post=lambda *args, **kwargs: _FakeResponse(status_code=503))
+    _override_client(monkeypatch, service_module, client)
+    delays = _record_sleeps(monkeypatch, service_module)
+
+    with pytest.raises(HTTPException) as exc:
+        await service_module.GoogleCalendarService.create_event(
+            "access", {"summary": "meeting"}
+        )
+
+    assert exc.value.status_code == 500
+    assert len(client.post_calls) == 1
+    assert delays == []
+
+
+@pytest.mark.anyio
+async def test_client_uses_http2_only_when_h2_installed(service_module, monkeypatch):
+    service = service_module.GoogleCalendarService
+    monkeypatch.setattr(service_module, "GOOGLE_HTTP2", True)
+
+    monkeypatch.setattr(service_module.importlib.util, "find_spec", lambda name: None)
+    assert service._http2_enabled() is False
+
+    monkeypatch.setattr(
+        service_module.importlib.util, "find_spec", lambda name: object()
+    )
+    assert service._http2_enabled() is True
+
+    monkeypatch.setattr(service_module, "GOOGLE_HTTP2", False)
+    assert service._http2_enabled() is False
+
+
+@pytest.mark.anyio
+async def test_client_warns_when_http2_requested_without_h2(
+    service_module, monkeypatch, caplog
+):
+    service = service_module.GoogleCalendarService
+    created = []
+
+    def _client(**kwargs):
+        created.append(kwargs)
+        return object()
+
+    monkeypatch.setattr(service_module, "GOOGLE_HTTP2", True)
+    monkeypatch.setattr(service_module.importlib.util, "find_spec", lambda name: None)
+    monkeypatch.setattr(service_module.httpx, "AsyncClient", _client)
+    monkeypatch.setattr(service, "_client", None)
+
+    with caplog.at_level("WARNING", logger=service_module.__name__):
+        await service._get_client()
+
+    assert created[0]["http2"] is False
+    assert "httpx[http2]" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_send_records_connection_pool_wait(service_module, monkeypatch):
+    async def _get(url, **kwargs):
+        trace = kwargs["extensions"]["trace"]
+        # 풀에서 연결을 기다린 뒤 새 연결 생성
+        await asyncio.sleep(0.01)
+        await trace("connection.connect_tcp.started", {})
+        await trace("connection.connect_tcp.complete", {})
+        return _FakeResponse(data={"items": []})
+
+    client = _FakeClient(get=_get)
+    _override_client(monkeypatch, service_module, client)
+
+    await service_module.GoogleCalendarService.list_primary_events(
+        "access", time_min=None, time_max=None
+    )
+    stats = service_module.GoogleCalendarService.http_pool_stats()
+
+    assert stats["requests"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["acquired"] == 1
+    assert stats["new_connections"] == 1
+    assert stats["pool_wait_max"] >= 0.01
+    assert stats["pool_wait_avg"] == round(stats["pool_wait_total"], 6)
+
+
+@pytest.mark.anyio
+async def test_send_counts_pool_timeouts(service_module, monkeypatch):
+    async def _get(url, **kwargs):
+        raise service_module.httpx.PoolTimeout("pool exhausted")
+
+    client = _FakeClient(get=_get)
+    _override_client(monkeypatch, service_module, client)
+    monkeypatch.setattr(service_module, "GOOGLE_RETRY_MAX_ATTEMPTS", 1)
+
+    with pytest.raises(HTTPException):
+        await service_module.GoogleCalendarService.list_primary_events(
+            "access", time_min=None, time_max=None
+        )
+
+    stats = service_module.GoogleCalendarService.http_pool_stats()
+    assert stats["pool_timeouts"] == 1
+    assert stats["acquired"] == 0
+
+
+@pytest.mark.anyio
+async def test_send_drops_calls_over_rate_limit(service_module, monkeypatch):
+    client = _FakeClient(get=lambda *args, **kwargs: _FakeResponse(data={}))
+    _override_client(monkeypatch, service_module, client)
+    monkeypatch.setattr(
+        service_module.GoogleCalendarService,
+        "_rate_limiter",
+        service_module.RateLimiter(100, 100, 1, 1),
+    )
+    # 다음 토큰까지 1초가 걸리므로 0.5초 안에 얻지 못해 거절
+    monkeypatch.setattr(service_module, "GOOGLE_RATE_LIMIT_MAX_WAIT_SECONDS", 0.5)
+
+    await service_module.GoogleCalendarService.list_primary_events(
+        "access", time_min=None, time_max=None
+    )
+    with pytest.raises(HTTPException) as exc:
+        await service_module.GoogleCalendarService.list_primary_events(
+            "access", time_min=None, time_max=None
+        )
+    # 다른 사용자는 자기 버킷으로 계속 호출 가능
+    await service_module.GoogleCalendarService.list_primary_events(
+        "other", time_min=None, time_max=None
+    )
+
+    assert exc.value.status_code == 429
+    assert exc.value.detail == "rate_limited"
+    assert len(client.get_calls) == 2
+    stats = service_module.GoogleCalendarService.rate_limit_stats()
+    assert stats["dropped"] == 1
+    assert stats["keys"] == 2
+
+
+def _batch_handler(requests, statuses):
+    # 받은 배치 요청을 기록하고 항목 순서를 뒤집어 multipart 응답 생성
+    import email
+
+    import httpx
+
+    def _handler(request):
+        message = email.message_from_bytes(
+            b"Content-Type: "
+            + request.headers["Content-Type"].encode()
+            + b"\r\n\r\n"
+            + request.content
+        )
+        parts = message.get_payload()
+        requests.append([part.get_payload() for part in parts])
+
+        body = ""
+        for part in reversed(parts):
+            content_id = part["Content-ID"].strip("<>")
+            index = int(content_id.rpartition("-")[2])
+            status = statuses.get(index, 200)
+            data = (
+                {"error": {"code": status, "message": "Not Found"}}
+                if status >= 400
+                else {"id": f"event-{index}", "summary": "s", "htmlLink": "link"}
+            )
+            body += (
+                "--batch_resp\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} X\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{json.dumps(data)}\r\n"
+            )
+        body += "--batch_resp--\r\n"
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "multipart/mixed; boundary=batch_resp"},
+            content=body.encode(),
+        )
+
+    return _handler
+
+
+@pytest.mark.anyio
+async def test_batch_create_events_returns_results_in_order(
+    service_module, monkeypatch
+):
+    import httpx
+
+    requests = []
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_batch_handler(requests, {1: 400}))
+    )
+    monkeypatch.setattr(service_module.GoogleCalendarService, "_client", client)
+
+    results = await service_module.GoogleCalendarService.batch_create_events(
+        "access", [{"summary": "a"}, {"summary": "b"}, {"summary": "c"}]
+    )
+
+    assert len(requests) == 1
+    assert requests[0][0].startswith(
+        "POST /calendar/v3/calendars/primary/events HTTP/1.1\r\n"
+    )
+    assert requests[0][0].endswith('{"summary": "a"}')
+    assert [item["success"] for item in results] == [True, False, True]
+    assert results[0]["event"]["id"] == "event-0"
+    assert results[1] == {"index": 1, "success": False, "error": "failed"}
+    assert results[2]["id"] == "event-2"
+
+    await client.aclose()
+
+
+@pytest.mark.anyio
+async def test_batch_delete_events_splits_into_batches_of_fifty(
+    service_module, monkeypatch
+):
+    import httpx
+
+    requests = []
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_batch_handler(requests, {3: 404}))
+    )
+    monkeypatch.setattr(service_module.GoogleCalendarService, "_client", client)
+    monkeypatch.setattr(
+        service_module.GoogleCalendarService,
+        "_rate_limiter",
+        service_module.RateLimiter(1000, 1000, 0, 0),
+    )
+    event_ids = [f"id-{index}" for index in range(60)]
+
+    results = await service_module.GoogleCalendarService.batch_delete_events(
+        "access", event_ids
+    )
+
+    assert [len(batch) for batch in requests] == [50, 10]
+    assert requests[1][0].startswith(
+        "DELETE /calendar/v3/calendars/primary/events/id-50 HTTP/1.1"
+    )
+    assert [item["id"] for item in results] == event_ids
+    assert results[3] == {
+        "index": 3,
+        "success": False,
+        "id": "id-3",
+        "error": "event_not_found",
+    }
+    # 배치마다 네 번째 항목(id-3, id-53)만 실패
+    assert [item["index"] for item in results if not item["success"]] == [3, 53]
+    # 배치 요청은 포함된 요청 수만큼 호출 속도 제한 토큰을 소모
+    assert service_module.GoogleCalendarService.rate_limit_stats()["acquired"] == 60
+
+    await client.aclose()
+
+
+@pytest.mark.anyio
+async def test_batch_requires_reauth_when_batch_is_rejected(
+    service_module, monkeypatch
+):
+    response = _FakeResponse(status_code=401, data={"error": {"code": 401}})
+    client = _FakeClient(post=lambda *args, **kwargs: response)
+    _override_client(monkeypatch, service_module, client)
+
+    with pytest.raises(HTTPException) as exc:
+        await service_module.GoogleCalendarService.batch_create_events(
+            "access", [{"summary": "a"}]
+        )
+
+    assert exc.value.status_code == 401
+    assert exc.value.detail == "google_reauth_required"
+    # 생성 배치는 재시도하지 않음
+    assert len(client.post_calls) == 1
@@ -1,9 +1,9 @@
 import importlib
 import sys
 from pathlib import Path
-from types import SimpleNamespace
 from urllib.parse import parse_qs, urlparse
 
+import httpx
 import pytest
 from fastapi import HTTPException
 
@@ -43,6 +43,18 @@ def load_google_service(monkeypatch):
     return _loader
 
 
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _use_transport(service, monkeypatch, handler):
+    # 공용 Google 클라이언트를 가짜 전송 계층을 쓰는 클라이언트로 교체
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(service.GoogleCalendarService, "_client", client)
+    return client
+
+
 def test_generate_auth_url_contains_parameters(load_google_service):
     service = load_google_service()
 
@@ -52,7 +64,8 @@ def test_generate_auth_url_contains_parameters(load_google_service):
     assert query["client_id"] == ["client"]
     assert query["redirect_uri"] == ["http://localhost/callback"]
     assert query["scope"] == [
-        "openid email profile https://www.googleapis.com/auth/calendar.events"
+        "openid email profile https://www.googleapis.com/auth/calendar.events "
+        "https://www.googleapis.com/auth/calendar.freebusy"
     ]
     assert query["access_type"] == ["offline"]
     assert query["include_granted_scopes"] == ["true"]
@@ -67,22 +80,40 @@ def test_generate_auth_url_includes_prompt_when_forced(load_google_service):
     assert query["prompt"] == ["consent"]
 
 
-def test_exchange_code_for_tokens_success(load_google_service, monkeypatch):
+@pytest.mark.anyio
+async def test_exchange_code_for_tokens_success(load_google_service, monkeypatch):
     service = load_google_service()
+    requests = []
 
-    def mock_post(url, data):
-        assert "oauth2.googleapis.com/token" in url
-        return SimpleNamespace(
-            raise_for_status=lambda: None,
-            json=lambda: {"access_token": "access", "refresh_token": "refresh"},
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200, json={"access_token": "access", "refresh_token": "refresh"}
         )
 
-    monkeypatch.setattr("requests.post", mock_post)
-    tokens = service.GoogleOAuthService.exchange_code_for_tokens("auth-code")
+    class _ExhaustedLimiter:
+        async def acquire(self, key, max_wait, cost=1):
+            return False
+
+    _use_transport(service, monkeypatch, handler)
+    # Calendar 호출 속도 제한이 바닥나도 로그인 토큰 교환은 막히지 않음
+    monkeypatch.setattr(
+        service.GoogleCalendarService, "_rate_limiter", _ExhaustedLimiter()
+    )
+    tokens = await service.GoogleOAuthService.exchange_code_for_tokens("auth-code")
 
     assert tokens == {"access_token": "access", "refresh_token": "refresh"}
+    assert str(requests[0].url) == "https://oauth2.googleapis.com/token"
+    assert parse_qs(requests[0].content.decode()) == {
+        "client_id": ["client"],
+        "client_secret": ["secret"],
+        "code": ["auth-code"],
+        "grant_type": ["authorization_code"],
+        "redirect_uri": ["http://localhost/callback"],
+    }
 
 
+@pytest.mark.anyio
 @pytest.mark.parametrize(
     "response_json",
     [
@@ -90,60 +121,66 @@ def test_exchange_code_for_tokens_success(load_google_service, monkeypatch):
         {},
     ],
 )
-def test_exchange_code_for_tokens_missing_access_token(
+async def test_exchange_code_for_tokens_missing_access_token(
     response_json, load_google_service, monkeypatch
 ):
     service = load_google_service()
-
-    def mock_post(url, data):
-        return SimpleNamespace(
-            raise_for_status=lambda: None, json=lambda: response_json
-        )
-
-    monkeypatch.setattr("requests.post", mock_post)
+    _use_transport(
+        service, monkeypatch, lambda request: httpx.Response(200, json=response_json)
+    )
 
     with pytest.raises(HTTPException) as exc:
-        service.GoogleOAuthService.exchange_code_for_tokens("code")
+        await service.GoogleOAuthService.exchange_code_for_tokens("code")
 
     assert exc.value.status_code == 400
 
 
-def test_exchange_code_for_tokens_request_failure(load_google_service, monkeypatch):
-    import requests
-
+@pytest.mark.anyio
+@pytest.mark.parametrize("failure", ["network", "status"])
+async def test_exchange_code_for_tokens_request_failure(
+    failure, load_google_service, monkeypatch
+):
     service = load_google_service()
 
-    def mock_post(url, data):
-        raise requests.RequestException("boom")
+    def handler(request):
+        if failure == "network":
+            raise httpx.ConnectError("boom", request=request)
+        return httpx.Response(400, json={"error": "invalid_grant"})
 
-    monkeypatch.setattr("requests.post", mock_post)
+    _use_transport(service, monkeypatch, handler)
 
     with pytest.raises(HTTPException) as exc:
-        service.GoogleOAuthService.exchange_code_for_tokens("code")
+        await service.GoogleOAuthService.exchange_code_for_tokens("code")
 
     assert exc.value.status_code == 500
 
 
-def test_get_user_info_success(load_google_service, monkeypatch):
+@pytest.mark.anyio
+async def test_get_user_info_success(load_google_service, monkeypatch):
     service = load_google_service()
+    requests = []
 
-    def mock_get(url):
-        assert "userinfo" in url
-        return SimpleNamespace(
-            raise_for_status=lambda: None,
-            json=lambda: {"id": "123", "email": "user@example.com", "name": "User"},
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200, json={"id": "123", "email": "user@example.com", "name": "User"}
         )
 
-    monkeypatch.setattr("requests.get", mock_get)
-    user_info = service.GoogleOAuthService.get_user_info("token")
+    _use_transport(service, monkeypatch, handler)
+    user_info = await service.GoogleOAuthService.get_user_info("token")
 
     assert user_info == {
         "google_id": "123",
         "email": "user@example.com",
         "name": "User",
     }
+    assert requests[0].url.path == "/oauth2/v2/userinfo"
+    # access token은 URL에 남기지 않고 헤더로 전달
+    assert "token" not in str(requests[0].url)
+    assert requests[0].headers["Authorization"] == "Bearer token"
 
 
+@pytest.mark.anyio
 @pytest.mark.parametrize(
     "response_json",
     [
@@ -152,33 +189,30 @@ def test_get_user_info_success(load_google_service, monkeypatch):
         {},
     ],
 )
-def test_get_user_info_missing_fields(load_google_service, monkeypatch, response_json):
+async def test_get_user_info_missing_fields(
+    load_google_service, monkeypatch, response_json
+):
     service = load_google_service()
-
-    def mock_get(url):
-        return SimpleNamespace(
-            raise_for_status=lambda: None, json=lambda: response_json
-        )
-
-    monkeypatch.setattr("requests.get", mock_get)
+    _use_transport(
+        service, monkeypatch, lambda request: httpx.Response(200, json=response_json)
+    )
 
     with pytest.raises(HTTPException) as exc:
-        service.GoogleOAuthService.get_user_info("token")
+        await service.GoogleOAuthService.get_user_info("token")
 
     assert exc.value.status_code == 400
 
 
-def test_get_user_info_request_failure(load_google_service, monkeypatch):
-    import requests
-
+@pytest.mark.anyio
+async def test_get_user_info_request_failure(load_google_service, monkeypatch):
     service = load_google_service()
 
-    def mock_get(url):
-        raise requests.RequestException("boom")
+    def handler(request):
+        raise httpx.ConnectError("boom", request=request)
 
-    monkeypatch.setattr("requests.get", mock_get)
+    _use_transport(service, monkeypatch, handler)
 
     with pytest.raises(HTTPException) as exc:
-        service.GoogleOAuthService.get_user_info("token")
+        await service.GoogleOAuthService.get_user_info("token")
 
     assert exc.value.status_code == 500
@@ -0,0 +1,564 @@
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def analyzer():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    from app.services.schedule_analyzer import ScheduleAnalyzer
+
+    return ScheduleAnalyzer
+
+
+def _user(user_id, date_str, *ranges):
+    return {
+        "user_id": user_id,
+        "slots": [
+            {
+                "date": date_str,
+                "available_times": [{"start": s, "end": e} for s, e in ranges],
+            }
+        ],
+    }
+
+
+def test_time_interval_parse_and_format(analyzer):
+    from app.utils.time_interval import TimeInterval, format_hhmm, parse_hhmm
+
+    interval = TimeInterval.parse("09:30", "18:05")
+
+    assert interval == (570, 1085)
+    assert interval.duration == 515
+    assert interval.format() == {"start": "09:30", "end": "18:05"}
+    assert parse_hhmm("invalid") == 0
+    assert parse_hhmm("25:00") == 0
+    assert format_hhmm(0) == "00:00"
+
+
+def _epoch(day, hhmm, zone="Asia/Seoul"):
+    from app.utils.time_interval import get_zone, local_to_epoch_minutes, parse_hhmm
+
+    return local_to_epoch_minutes(day, parse_hhmm(hhmm), get_zone(zone))
+
+
+def test_epoch_minutes_round_trip_across_dst(analyzer):
+    from app.utils.time_interval import (
+        epoch_minutes_to_local,
+        get_zone,
+        local_to_epoch_minutes,
+    )
+
+    zone = get_zone("America/New_York")
+    # 2026-03-08 02:00 서머타임 시작: 01:00 -> 03:00 사이는 실제로 1시간
+    before = local_to_epoch_minutes(date(2026, 3, 8), 60, zone)
+    after = local_to_epoch_minutes(date(2026, 3, 8), 180, zone)
+
+    assert after - before == 60
+    assert epoch_minutes_to_local(after, zone) == (date(2026, 3, 8), 180)
+    assert get_zone("America/New_York") is zone
+
+
+def test_busy_timeline_keeps_multi_day_events_as_one_interval(analyzer):
+    from app.utils.time_interval import TimeInterval, get_zone
+
+    events = [
+        {
+            "start": {"dateTime": "2026-01-01T22:00:00+09:00"},
+            "end": {"dateTime": "2026-01-03T01:30:00+09:00"},
+        },
+        # 같은 이벤트를 UTC로 표현한 경우도 같은 절대 구간
+        {
+            "start": {"dateTime": "2026-01-01T13:00:00Z"},
+            "end": {"dateTime": "2026-01-01T14:00:00Z"},
+        },
+        {"start": {"date": "2026-01-03"}, "end": {"date": "2026-01-04"}},
+    ]
+
+    busy = analyzer._busy_timeline(events, get_zone("Asia/Seoul"))
+
+    assert busy == [
+        TimeInterval(
+            _epoch(date(2026, 1, 1), "22:00"), _epoch(date(2026, 1, 4), "00:00")
+        )
+    ]
+
+
+def test_available_times_exclude_busy_and_short_gaps(analyzer):
+    from app.utils.time_interval import TimeInterval
+
+    busy = analyzer._merge_time_periods(
+        [
+            TimeInterval.parse("10:00", "11:00"),
+            TimeInterval.parse("10:30", "12:00"),
+            TimeInterval.parse("12:20", "13:00"),
+            TimeInterval.parse("19:00", "20:00"),
+        ]
+    )
+
+    available = analyzer._calculate_available_times(
+        TimeInterval.parse("09:00", "18:00"), busy
+    )
+
+    assert [interval.format() for interval in available] == [
+        {"start": "09:00", "end": "10:00"},
+        {"start": "13:00", "end": "18:00"},
+    ]
+
+
+def test_available_times_empty_for_all_day_event(analyzer):
+    from app.utils.time_interval import MINUTES_PER_DAY, TimeInterval
+
+    available = analyzer._calculate_available_times(
+        TimeInterval.parse("00:00", "23:59"), [TimeInterval(0, MINUTES_PER_DAY)]
+    )
+
+    assert available == []
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class _User:
+    user_id = "user"
+    google_refresh_token = "refresh"
+
+
+def _patch_calendar(monkeypatch, **handlers):
+    import app.services.schedule_analyzer as module
+
+    async def _refresh(refresh_token):
+        return "access"
+
+    calendar = module.GoogleCalendarService
+    monkeypatch.setattr(calendar, "refresh_access_token", _refresh)
+    for name, handler in handlers.items():
+        monkeypatch.setattr(calendar, name, handler)
+
+
+@pytest.mark.anyio
+async def test_calculate_available_slots_uses_free_busy_in_utc(analyzer, monkeypatch):
+    captured = {}
+
+    async def _free_busy(access_token, **kwargs):
+        captured.update(kwargs)
+        # 전날 밤부터 이어지는 바쁜 구간과 UTC로 표현된 종일 바쁜 구간
+        return [
+            {"start": "2026-01-01T14:00:00Z", "end": "2026-01-02T01:00:00Z"},
+            {"start": "2026-01-02T15:00:00Z", "end": "2026-01-03T15:00:00Z"},
+        ]
+
+    async def _list_events(**kwargs):
+        raise AssertionError("event listing must not be used")
+
+    _patch_calendar(
+        monkeypatch, query_free_busy=_free_busy, list_primary_events=_list_events
+    )
+
+    result = await analyzer.calculate_available_slots(
+        _User(), [date(2026, 1, 3), date(2026, 1, 2)], "09:00", "18:00"
+    )
+
+    assert captured["time_min"] == "2026-01-01T15:00:00Z"
+    assert captured["time_max"] == "2026-01-03T15:00:00Z"
+    assert result["slots"] == [
+        {"date": "2026-01-02", "available_times": [{"start": "10:00", "end": "18:00"}]}
+    ]
+
+
+@pytest.mark.anyio
+async def test_calculate_available_slots_falls_back_to_event_listing(
+    analyzer, monkeypatch
+):
+    from fastapi import HTTPException
+
+    async def _free_busy(access_token, **kwargs):
+        raise HTTPException(status_code=403, detail="insufficient_scope")
+
+    pages = {
+        None: {
+            "events": [
+                {
+                    "start": {"dateTime": "2026-01-01T23:00:00+09:00"},
+                    "end": {"dateTime": "2026-01-02T10:00:00+09:00"},
+                },
+                # "한가함"으로 표시된 이벤트는 바쁜 시간이 아님
+                {
+                    "start": {"dateTime": "2026-01-02T12:00:00+09:00"},
+                    "end": {"dateTime": "2026-01-02T13:00:00+09:00"},
+                    "transparency": "transparent",
+                },
+            ],
+            "nextPageToken": "page-2",
+        },
+        "page-2": {
+            "events": [
+                {"start": {"date": "2026-01-03"}, "end": {"date": "2026-01-04"}},
+            ],
+            "nextPageToken": None,
+        },
+    }
+    requested = []
+
+    async def _list_events(access_token, **kwargs):
+        requested.append(kwargs["page_token"])
+        assert kwargs["fields"] == "items(start,end,transparency),nextPageToken"
+        return pages[kwargs["page_token"]]
+
+    _patch_calendar(
+        monkeypatch, query_free_busy=_free_busy, list_primary_events=_list_events
+    )
+
+    result = await analyzer.calculate_available_slots(
+        _User(), [date(2026, 1, 2), date(2026, 1, 3)], "09:00", "18:00"
+    )
+
+    assert requested == [None, "page-2"]
+    assert result["slots"] == [
+        {"date": "2026-01-02", "available_times": [{"start": "10:00", "end": "18:00"}]}
+    ]
+
+
+@pytest.mark.anyio
+async def test_calculate_available_slots_batch_shares_one_fetch(analyzer, monkeypatch):
+    import app.services.schedule_analyzer as module
+
+    refreshes = []
+    windows = []
+
+    async def _refresh(refresh_token):
+        refreshes.append(refresh_token)
+        return "access"
+
+    async def _free_busy(access_token, **kwargs):
+        windows.append((kwargs["time_min"], kwargs["time_max"]))
+        return [{"start": "2026-01-03T00:00:00Z", "end": "2026-01-03T03:00:00Z"}]
+
+    monkeypatch.setattr(module.GoogleCalendarService, "refresh_access_token", _refresh)
+    monkeypatch.setattr(module.GoogleCalendarService, "query_free_busy", _free_busy)
+
+    results = await analyzer.calculate_available_slots_batch(
+        _User(),
+        {
+            1: [date(2026, 1, 2), date(2026, 1, 3)],
+            2: [date(2026, 1, 3), date(2026, 3, 1)],
+            3: [],
+        },
+        "09:00",
+        "18:00",
+    )
+
+    # 토큰 갱신은 한 번, 멀리 떨어진 날짜 묶음만 따로 조회
+    assert refreshes == ["refresh"]
+    assert sorted(windows) == [
+        ("2026-01-01T15:00:00Z", "2026-01-03T15:00:00Z"),
+        ("2026-02-28T15:00:00Z", "2026-03-01T15:00:00Z"),
+    ]
+    assert results[1]["slots"] == [
+        {"date": "2026-01-02", "available_times": [{"start": "09:00", "end": "18:00"}]},
+        {"date": "2026-01-03", "available_times": [{"start": "12:00", "end": "18:00"}]},
+    ]
+    assert [slot["date"] for slot in results[2]["slots"]] == [
+        "2026-01-03",
+        "2026-03-01",
+    ]
+    assert results[3] is None
+
+
+@pytest.mark.anyio
+async def test_concurrent_identical_calculations_share_one_fetch(analyzer, monkeypatch):
+    import asyncio
+
+    from app.utils.single_flight import SingleFlight
+
+    release = asyncio.Event()
+    fetches = []
+
+    async def _free_busy(access_token, **kwargs):
+        fetches.append(kwargs["time_min"])
+        await release.wait()
+        return []
+
+    _patch_calendar(monkeypatch, query_free_busy=_free_busy)
+    monkeypatch.setattr(analyzer, "_flights", SingleFlight())
+
+    dates = [date(2026, 1, 2), date(2026, 1, 3)]
+    tasks = [
+        asyncio.create_task(
+            analyzer.calculate_available_slots(_User(), candidate_dates, "09:00", end)
+        )
+        for candidate_dates, end in [
+            (dates, "18:00"),
+            (list(reversed(dates)), "18:00"),
+            (dates, "17:00"),
+        ]
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    first, retried, other_hours = await asyncio.gather(*tasks)
+
+    # 날짜 순서만 다른 재시도는 조회를 함께 쓰고, 근무 시간이 다르면 따로 계산
+    assert retried["slots"] == first["slots"]
+    assert other_hours["slots"][0]["available_times"][0]["end"] == "17:00"
+    assert len(fetches) == 2
+    stats = analyzer.coalescing_stats()
+    assert (stats["calls"], stats["coalesced"], stats["in_flight"]) == (3, 1, 0)
+
+
+@pytest.mark.anyio
+async def test_join_and_sync_for_same_dates_share_one_fetch(analyzer, monkeypatch):
+    import asyncio
+
+    from app.utils.single_flight import SingleFlight
+
+    release = asyncio.Event()
+    fetches = []
+
+    async def _free_busy(access_token, **kwargs):
+        fetches.append(kwargs["time_min"])
+        await release.wait()
+        return [{"start": "2026-01-03T00:00:00Z", "end": "2026-01-03T03:00:00Z"}]
+
+    _patch_calendar(monkeypatch, query_free_busy=_free_busy)
+    monkeypatch.setattr(analyzer, "_flights", SingleFlight())
+
+    # 참여(None key)와 내 일정 동기화(약속 id key)가 같은 날짜를 동시에 계산
+    join = asyncio.create_task(
+        analyzer.calculate_available_slots(
+            _User(), [date(2026, 1, 3), date(2026, 1, 2)]
+        )
+    )
+    sync = asyncio.create_task(
+        analyzer.calculate_available_slots_batch(
+            _User(), {1: [date(2026, 1, 2)], 2: [date(2026, 1, 3)]}
+        )
+    )
+    await asyncio.sleep(0.01)
+    release.set()
+    joined, synced = await asyncio.gather(join, sync)
+
+    assert len(fetches) == 1
+    assert joined["slots"] == synced[1]["slots"] + synced[2]["slots"]
+    assert synced[2]["slots"][0]["available_times"][0] == {
+        "start": "00:00",
+        "end": "09:00",
+    }
+    stats = analyzer.coalescing_stats()
+    assert (stats["calls"], stats["coalesced"]) == (2, 1)
+
+
+def test_find_common_slots_ranks_by_participants_then_duration(analyzer):
+    user_slots = [
+        _user(1, "2026-01-01", ("09:00", "12:00")),
+        _user(2, "2026-01-01", ("10:00", "11:00")),
+    ]
+
+    result = analyzer.find_common_slots(user_slots, 60)
+
+    assert result[0] == {
+        "date": "2026-01-01",
+        "start_time": "10:00",
+        "end_time": "11:00",
+        "duration_minutes": 60,
+        "participant_count": 2,
+        "total_participants": 2,
+        "participant_ids": [1, 2],
+        "availability_percentage": 100.0,
+    }
+    assert [(r["start_time"], r["end_time"]) for r in result[1:]] == [
+        ("09:00", "10:00"),
+        ("11:00", "12:00"),
+    ]
+
+
+def test_find_common_slots_caps_block_end_at_day_end(analyzer):
+    result = analyzer.find_common_slots(
+        [_user(1, "2026-01-01", ("23:00", "23:59"))], 30
+    )
+
+    assert result[0]["start_time"] == "23:00"
+    assert result[0]["end_time"] == "23:59"
+    assert result[0]["duration_minutes"] == 59
+
+
+def test_find_common_slots_keeps_exact_minute_boundaries(analyzer):
+    user_slots = [
+        _user(1, "2026-01-01", ("09:10", "10:40")),
+        _user(2, "2026-01-01", ("09:55", "11:05")),
+    ]
+
+    result = analyzer.find_common_slots(user_slots, 30)
+
+    assert [(r["start_time"], r["end_time"], r["participant_ids"]) for r in result] == [
+        ("09:55", "10:40", [1, 2]),
+        ("09:10", "09:55", [1]),
+    ]
+
+
+def test_find_common_slots_merges_touching_ranges_of_same_participants(analyzer):
+    user_slots = [
+        _user(1, "2026-01-01", ("09:00", "10:00"), ("10:00", "11:00")),
+        _user(2, "2026-01-01", ("09:00", "11:00")),
+        _user(3, "2026-01-02", ("09:00", "09:20")),
+    ]
+
+    result = analyzer.find_common_slots(user_slots, 30)
+
+    assert len(result) == 1
+    assert result[0]["start_time"] == "09:00"
+    assert result[0]["end_time"] == "11:00"
+    assert result[0]["total_participants"] == 3
+    assert result[0]["availability_percentage"] == 66.67
+
+
+def test_find_common_slots_intersects_participants_across_timezones(analyzer):
+    seoul = _user(1, "2026-01-02", ("09:00", "12:00"))
+    # 뉴욕 2026-01-01 20:00~22:00 == 서울 2026-01-02 10:00~12:00
+    new_york = _user(2, "2026-01-01", ("20:00", "22:00"))
+    new_york["timezone"] = "America/New_York"
+
+    result = analyzer.find_common_slots([seoul, new_york], 30)
+
+    assert [
+        (r["date"], r["start_time"], r["end_time"], r["participant_ids"])
+        for r in result
+    ] == [
+        ("2026-01-02", "10:00", "12:00", [1, 2]),
+        ("2026-01-02", "09:00", "10:00", [1]),
+    ]
+
+    # 표시 타임존을 바꾸면 같은 블록이 뉴욕 현지 날짜/시각으로 반환
+    local = analyzer.find_common_slots(
+        [seoul, new_york], 30, limit=1, timezone="America/New_York"
+    )
+
+    assert (local[0]["date"], local[0]["start_time"]) == ("2026-01-01", "20:00")
+
+
+def test_find_common_slots_splits_blocks_at_local_midnight(analyzer):
+    late = _user(1, "2026-01-01", ("22:00", "23:59"))
+    # 런던 15:00~17:00 == 서울 2026-01-02 00:00~02:00
+    london = _user(2, "2026-01-01", ("13:00", "17:00"))
+    london["timezone"] = "Europe/London"
+
+    result = analyzer.find_common_slots(
+        [late, london], 30, min_participants=1, dates=["2026-01-01", "2026-01-02"]
+    )
+
+    assert sorted((r["date"], r["start_time"], r["end_time"]) for r in result) == [
+        ("2026-01-01", "22:00", "23:59"),
+        ("2026-01-02", "00:00", "02:00"),
+    ]
+
+
+def test_find_common_slots_caps_end_and_keeps_candidate_dates(analyzer):
+    seoul = _user(1, "2026-01-01", ("09:00", "12:00"))
+    # UTC 10:00~20:00 == 서울 19:00~다음날 05:00
+    utc = _user(2, "2026-01-01", ("10:00", "20:00"))
+    utc["timezone"] = "UTC"
+
+    result = analyzer.find_common_slots([seoul, utc], 30)
+
+    # 끝은 "24:00"이 아니라 23:59, 후보 날짜가 아닌 다음날 조각은 제외
+    assert [
+        (r["date"], r["start_time"], r["end_time"], r["participant_ids"])
+        for r in result
+    ] == [
+        ("2026-01-01", "19:00", "23:59", [2]),
+        ("2026-01-01", "09:00", "12:00", [1]),
+    ]
+
+
+def test_numpy_engine_matches_sweep_engine(analyzer):
+    pytest.importorskip("numpy")
+    user_slots = [
+        _user(1, "2026-01-01", ("09:10", "10:40"), ("13:00", "18:00")),
+        _user(2, "2026-01-01", ("09:55", "11:05"), ("14:00", "15:00")),
+        _user(3, "2026-01-01", ("09:00", "12:00"), ("12:00", "17:30")),
+        _user(4, "2026-01-02", ("08:00", "09:00")),
+    ]
+
+    sweep = analyzer.find_common_slots(user_slots, 30, engine=analyzer.ENGINE_SWEEP)
+    matrix = analyzer.find_common_slots(user_slots, 30, engine=analyzer.ENGINE_NUMPY)
+
+    assert matrix == sweep
+
+
+def test_numpy_engine_falls_back_without_numpy(analyzer, monkeypatch):
+    import app.services.schedule_analyzer as module
+
+    monkeypatch.setattr(module, "np", None)
+    user_slots = [
+        _user(1, "2026-01-01", ("09:00", "12:00")),
+        _user(2, "2026-01-01", ("10:00", "11:00")),
+    ]
+
+    result = analyzer.find_common_slots(user_slots, 60, engine=analyzer.ENGINE_NUMPY)
+
+    assert result == analyzer.find_common_slots(user_slots, 60)
+
+
+def test_sweep_blocks_carry_participant_bitmasks(analyzer):
+    from app.utils.time_interval import TimeInterval
+
+    blocks = analyzer._sweep_common_blocks(
+        [
+            (TimeInterval.parse("09:00", "11:00"), 0),
+            (TimeInterval.parse("10:00", "12:00"), 2),
+        ]
+    )
+
+    assert blocks == [
+        (TimeInterval.parse("09:00", "10:00"), 0b001),
+        (TimeInterval.parse("10:00", "11:00"), 0b101),
+        (TimeInterval.parse("11:00", "12:00"), 0b100),
+    ]
+    assert analyzer._decode_participants(0b101, ["a", "b", "c"]) == ["a", "c"]
+
+
+def test_find_common_slots_merges_overlapping_ranges_of_one_user(analyzer):
+    user_slots = [
+        _user("200", "2026-01-01", ("09:00", "10:30"), ("10:00", "11:00")),
+        _user("100", "2026-01-01", ("09:00", "11:00")),
+    ]
+
+    result = analyzer.find_common_slots(user_slots, 30)
+
+    assert len(result) == 1
+    assert result[0]["participant_ids"] == ["100", "200"]
+    assert result[0]["duration_minutes"] == 120
+
+
+def test_find_common_slots_limit_keeps_top_blocks_in_order(analyzer):
+    user_slots = [
+        _user(1, "2026-01-01", ("09:00", "12:00"), ("14:00", "16:00")),
+        _user(2, "2026-01-01", ("10:00", "11:00"), ("14:00", "15:00")),
+        _user(3, "2026-01-01", ("10:00", "11:00")),
+    ]
+
+    full = analyzer.find_common_slots(user_slots, 30)
+    top = analyzer.find_common_slots(user_slots, 30, limit=2)
+
+    assert top == full[:2]
+    assert [(r["start_time"], r["participant_count"]) for r in top] == [
+        ("10:00", 3),
+        ("14:00", 2),
+    ]
+
+
+def test_find_common_slots_prunes_below_min_participants(analyzer):
+    user_slots = [
+        _user(1, "2026-01-01", ("09:00", "12:00")),
+        _user(2, "2026-01-01", ("10:00", "11:00")),
+    ]
+
+    result = analyzer.find_common_slots(user_slots, 30, min_participants=2)
+
+    assert [(r["start_time"], r["end_time"]) for r in result] == [("10:00", "11:00")]
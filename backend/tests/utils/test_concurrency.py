@@ -0,0 +1,78 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def run_bounded():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    from app.utils.concurrency import run_bounded
+
+    return run_bounded
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_run_bounded_respects_limit_and_keeps_order(run_bounded):
+    running = 0
+    peak = 0
+
+    async def _work(key):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - key))
+        running -= 1
+        return key * 10
+
+    outcomes = await run_bounded(range(5), _work, limit=2)
+
+    assert peak == 2
+    assert list(outcomes) == [0, 1, 2, 3, 4]
+    assert [outcome.value for outcome in outcomes.values()] == [0, 10, 20, 30, 40]
+
+
+@pytest.mark.anyio
+async def test_run_bounded_isolates_failures_and_timeouts(run_bounded):
+    async def _work(key):
+        if key == "slow":
+            await asyncio.sleep(10)
+        if key == "broken":
+            raise ValueError("broken")
+        return key
+
+    outcomes = await run_bounded(["ok", "slow", "broken"], _work, limit=3, timeout=0.05)
+
+    assert outcomes["ok"].ok and outcomes["ok"].value == "ok"
+    assert outcomes["slow"].timed_out
+    assert isinstance(outcomes["broken"].error, ValueError)
+    assert not outcomes["broken"].timed_out
+
+
+@pytest.mark.anyio
+async def test_run_bounded_cancels_running_work_when_cancelled(run_bounded):
+    cancelled = []
+
+    async def _work(key):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(key)
+            raise
+
+    task = asyncio.create_task(run_bounded([1, 2], _work, limit=2))
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert sorted(cancelled) == [1, 2]
@@ -0,0 +1,135 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def limiter_module():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    import app.utils.rate_limiter as module
+
+    return module
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _limiter(module, clock, sleeps, **kwargs):
+    async def _sleep(delay):
+        sleeps.append(delay)
+        clock.now += delay
+
+    options = {"rate": 10, "burst": 10, "key_rate": 1, "key_burst": 2}
+    options.update(kwargs)
+    return module.RateLimiter(
+        options.pop("rate"),
+        options.pop("burst"),
+        options.pop("key_rate"),
+        options.pop("key_burst"),
+        clock=clock,
+        sleep=_sleep,
+        **options,
+    )
+
+
+def test_token_bucket_refills_up_to_capacity(limiter_module):
+    clock = _Clock()
+    bucket = limiter_module.TokenBucket(rate=2, capacity=2, clock=clock)
+
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    # 남은 토큰이 없으면 다음 예약은 0.5초 뒤
+    assert bucket.take() == pytest.approx(0.5)
+    assert bucket.delay() == pytest.approx(1.0)
+
+    clock.now = 100
+    assert bucket.delay() == 0
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    assert bucket.delay() == pytest.approx(0.5)
+
+
+@pytest.mark.anyio
+async def test_acquire_waits_in_reservation_order(limiter_module):
+    clock = _Clock()
+    sleeps = []
+    limiter = _limiter(limiter_module, clock, sleeps)
+
+    assert await limiter.acquire("user", max_wait=5)
+    assert await limiter.acquire("user", max_wait=5)
+    assert await limiter.acquire("user", max_wait=5)
+
+    assert sleeps == [pytest.approx(1.0)]
+    stats = limiter.stats()
+    assert stats["acquired"] == 3
+    assert stats["throttled"] == 1
+    assert stats["dropped"] == 0
+    assert stats["keys"] == 1
+
+
+@pytest.mark.anyio
+async def test_acquire_drops_without_consuming_when_wait_exceeds_deadline(
+    limiter_module,
+):
+    clock = _Clock()
+    sleeps = []
+    limiter = _limiter(limiter_module, clock, sleeps, rate=10, burst=3)
+
+    assert await limiter.acquire("a", max_wait=0)
+    assert await limiter.acquire("a", max_wait=0)
+    # 사용자 버킷이 비어 있으면 거절되고 전체 버킷 토큰도 남아 있어야 함
+    assert not await limiter.acquire("a", max_wait=0.5)
+    assert await limiter.acquire("b", max_wait=0)
+
+    # 전체 버킷이 비면 다른 사용자도 거절
+    assert not await limiter.acquire("c", max_wait=0)
+    assert sleeps == []
+    assert limiter.stats()["dropped"] == 2
+
+
+@pytest.mark.anyio
+async def test_key_buckets_are_bounded_and_optional(limiter_module):
+    clock = _Clock()
+    limiter = _limiter(limiter_module, clock, [], max_keys=2)
+
+    for key in ("a", "b", "c"):
+        assert await limiter.acquire(key, max_wait=0)
+    assert limiter.stats()["keys"] == 2
+
+    unlimited = _limiter(limiter_module, clock, [], rate=0, key_rate=0)
+    for _ in range(100):
+        assert await unlimited.acquire("a", max_wait=0)
+    assert unlimited.stats()["keys"] == 0
+
+
+@pytest.mark.anyio
+async def test_acquire_charges_cost_and_carries_oversized_debt(limiter_module):
+    clock = _Clock()
+    sleeps = []
+    limiter = _limiter(limiter_module, clock, sleeps, key_rate=0)
+
+    assert await limiter.acquire("user", max_wait=5, cost=5)
+    assert await limiter.acquire("user", max_wait=5, cost=5)
+    assert sleeps == []
+
+    # 버킷보다 큰 요청은 버킷이 가득 차면 보내고 나머지는 다음 요청이 기다림
+    assert await limiter.acquire("user", max_wait=5, cost=50)
+    assert sleeps == [pytest.approx(1.0)]
+    assert not await limiter.acquire("user", max_wait=3)
+
+    stats = limiter.stats()
+    assert (stats["acquired"], stats["dropped"]) == (60, 1)
@@ -0,0 +1,85 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def single_flight_cls():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    from app.utils.single_flight import SingleFlight
+
+    return SingleFlight
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_concurrent_calls_share_result(single_flight_cls):
+    flights = single_flight_cls()
+    calls = []
+
+    async def _work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(flights.do("key", _work) for _ in range(3)))
+
+    assert results == ["value"] * 3
+    assert calls == [1]
+    assert len(flights) == 0
+    assert flights.stats()["coalesced"] == 2
+
+    # 완료 후 호출은 새로 실행
+    assert await flights.do("key", _work) == "value"
+    assert calls == [1, 1]
+
+
+@pytest.mark.anyio
+async def test_error_is_shared_and_not_cached(single_flight_cls):
+    flights = single_flight_cls()
+    attempts = []
+
+    async def _fail():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flights.do("key", _fail), flights.do("key", _fail), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert attempts == [1]
+
+    with pytest.raises(ValueError):
+        await flights.do("key", _fail)
+    assert attempts == [1, 1]
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_does_not_cancel_shared_call(single_flight_cls):
+    flights = single_flight_cls()
+    release = asyncio.Event()
+
+    async def _work():
+        await release.wait()
+        return "value"
+
+    first = asyncio.create_task(flights.do("key", _work))
+    second = asyncio.create_task(flights.do("key", _work))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "value"
+    with pytest.raises(asyncio.CancelledError):
+        await first
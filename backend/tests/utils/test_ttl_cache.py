@@ -0,0 +1,77 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def cache_cls():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    from app.utils.ttl_cache import TTLCache
+
+    return TTLCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_evicts_least_recently_used(cache_cls):
+    cache = cache_cls(max_size=2, ttl_seconds=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_expires_entries_after_ttl(cache_cls):
+    clock = _Clock()
+    cache = cache_cls(max_size=10, ttl_seconds=30, clock=clock)
+
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=120)
+    clock.now = 31
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_stats_count_hits_and_misses(cache_cls):
+    cache = cache_cls(max_size=10, ttl_seconds=30)
+
+    cache.set("a", [])
+    cache.get("a")
+    cache.get("missing")
+
+    assert cache.stats() == {
+        "size": 1,
+        "max_size": 10,
+        "ttl_seconds": 30,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "hit_rate": 0.5,
+    }
+
+
+def test_zero_size_disables_cache(cache_cls):
+    cache = cache_cls(max_size=0, ttl_seconds=30)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0